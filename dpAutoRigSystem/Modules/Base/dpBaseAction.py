@@ -1,7 +1,11 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
+from maya.api import OpenMaya
 import os
+import json
+import hashlib
+from array import array
 import getpass
 import shutil
 from functools import partial
@@ -13,7 +17,7 @@ WARNING_COLOR = (1.0, 1.0, 0.5)
 ISSUE_COLOR = (1.0, 0.65, 0.65)
 RUNNING_COLOR = (1.0, 1.0, 1.0)
 
-DP_ACTIONSTARTCLASS_VERSION = 2.08
+DP_ACTIONSTARTCLASS_VERSION = 2.15
 
 
 class ActionStartClass(object):
@@ -23,6 +27,7 @@ class ActionStartClass(object):
         # defining variables:
         self.dpUIinst = dpUIinst
         self.utils = dpUIinst.utils
+        self.sceneIndex = dpUIinst.sceneIndex
         self.pipeliner = dpUIinst.pipeliner
         self.guideModuleName = CLASS_NAME
         self.title = TITLE
@@ -54,6 +59,8 @@ class ActionStartClass(object):
         self.resultOkList = []
         self.messageList = []
         self.dataLogDic = {}
+        self.profileDic = {}
+        self.deepProfile = False
         # start action type
         self.setActionType(self.actionType)
 
@@ -95,10 +102,11 @@ class ActionStartClass(object):
         self.messageList = []
         self.dataLogDic = {}
         # close info log window if it exists
-        if cmds.window('dpInfoWindow', query=True, exists=True):
+        if not self.dpUIinst.headless and cmds.window('dpInfoWindow', query=True, exists=True):
             cmds.deleteUI('dpInfoWindow', window=True)
         self.updateButtonColors(True) #running
-        cmds.refresh()
+        if not self.dpUIinst.headless and not self.dpUIinst.deferRefreshView:
+            cmds.refresh()
         if self.verbose:
             titleText = self.getTitle()
             self.utils.setProgress(titleText+': '+self.dpUIinst.lang['c110_start'], self.dpUIinst.lang[self.actionType], addOne=False, addNumber=False)
@@ -169,7 +177,7 @@ class ActionStartClass(object):
         buttonLabel = self.getLatestExportedData()
         buttonCommand = self.dpUIinst.packager.openFolder
         buttonArgument = self.ioPath
-        if cmds.iconTextButton(self.infoITB, query=True, exists=True):
+        if self.ui and cmds.iconTextButton(self.infoITB, query=True, exists=True):
             #functools.partial(<bound method Logger.infoWin of <dpAutoRigSystem.Pipeline.dpLogger.Logger object at 0x00000259E390BD10>>, 'r003_modelIO', 'r004_modelIODesc', None, 'center', 305, 250, wiki='10-‐-Rebuilder#-model')
             thisWiki = str(cmds.iconTextButton(self.infoITB, query=True, command=True)).split("wiki='")[1][:-2]
             cmds.iconTextButton(self.infoITB, edit=True, command=partial(self.dpUIinst.logger.infoWin, self.title, self.description, self.infoText, 'center', 305, 250, buttonList=[buttonLabel, buttonCommand, buttonArgument], wiki=thisWiki))
@@ -328,11 +336,23 @@ class ActionStartClass(object):
                     return exportedList
                 assetName = self.pipeliner.pipeData["assetName"]
                 for item in exportedList:
-                    if assetName in item:
+                    if assetName in item and not self.pipeliner.isCompactSidecar(item) and not self.pipeliner.isDataHashIndex(item):
                         resultList.append(item)
         return resultList
 
 
+    def runProfiledAction(self, firstMode=True, objList=None, *args):
+        """ Run this action measuring the wall time, node count, Maya commands and Python memory peak.
+            Set deepProfile as True to get the cProfile statistics of this action only.
+            Returns the action dataLog and keeps the measured data in the profileDic member variable.
+        """
+        profileState = self.utils.startActionProfile(self.deepProfile)
+        try:
+            return self.runAction(firstMode, objList)
+        finally:
+            self.profileDic = self.utils.stopActionProfile(profileState)
+
+
     def runActionsInSilence(self, actionToRunList, actionInstanceList, firstMode, objList, *args):
         """ Run action from a list without verbose.
         """
@@ -347,7 +367,13 @@ class ActionStartClass(object):
 
     def refreshView(self, *args):
         """ Just refresh the viewport and fit the view camera to all visible nodes.
+            It's skipped without interface (mayapy) and deferred to run once at the end of runSelectedActions in batch mode.
         """
+        if self.dpUIinst.headless:
+            return
+        if self.dpUIinst.deferRefreshView:
+            self.dpUIinst.pendingRefreshView = True
+            return
         cmds.refresh()
         cmds.viewFit(allObjects=True, animate=True)
         mel.eval("flushUndo;")
@@ -429,15 +455,31 @@ class ActionStartClass(object):
             self.utils.setProgress(endIt=True)
 
 
-    def exportDicToJsonFile(self, dic, *args):
+    def exportDicToJsonFile(self, dic, compact=False, compactKeyList=None, *args):
         """ Export given dictionary to json file using ioPath and startName as prefix of the current file name.
+            If compact is True, the weight values in the given compact keys will be stored in a compressed binary sidecar file beside a small json header.
+            If the latest exported file has the same content, it only saves a pointer file to it.
         """
         if dic:
             try:
                 # export json file
                 self.pipeliner.makeDirIfNotExists(self.ioPath)
                 jsonName = self.ioPath+"/"+self.startName+"_"+self.pipeliner.pipeData['currentFileName']+".json"
-                self.pipeliner.saveJsonFile(dic, jsonName)
+                dataHash = self.pipeliner.getDataHash(dic)
+                sameDataFile = self.pipeliner.findSameDataFile(jsonName, self.startName+"_", dataHash)
+                if sameDataFile:
+                    if not sameDataFile == os.path.basename(jsonName):
+                        self.pipeliner.saveDataPointer(jsonName, sameDataFile, dataHash)
+                else:
+                    if compact:
+                        self.pipeliner.saveCompactJsonFile(dic, jsonName, compactKeyList)
+                    else:
+                        self.pipeliner.saveJsonFile(dic, jsonName)
+                        # remove an old sidecar of this file to avoid mixing formats
+                        sidecarPath = self.pipeliner.getCompactSidecarPath(jsonName)
+                        if os.path.exists(sidecarPath):
+                            os.remove(sidecarPath)
+                    self.pipeliner.recordDataHash(jsonName, dataHash)
                 self.wellDoneIO(jsonName)
             except Exception as e:
                 self.notWorkedWellIO(jsonName+": "+str(e))
@@ -448,15 +490,29 @@ class ActionStartClass(object):
     def exportAlembicFile(self, itemList, path=None, startName=None, fileName=None, attr=True, curve=False, *args):
         """ Export given mesh list to alembic file.
             If curve argument is True, it'll also accept export nurbsCurve shapes.
+            When using the current file name, it only saves a pointer file if the latest exported file has the same geometry data.
         """
         try:
             if not path:
                 path = self.ioPath
             if not startName:
                 startName = self.startName
+            dataHash = None
+            versionedFile = not fileName
             if not fileName:
                 fileName = self.pipeliner.pipeData['currentFileName']
             nodeStateDic = self.changeNodeState(itemList, state=1) #has no effect
+            abcName = path+"/"+startName+"_"+fileName+".abc"
+            if versionedFile:
+                dataHash = self.getGeometryDataHash(itemList, attr, curve)
+                sameDataFile = self.pipeliner.findSameDataFile(abcName, startName+"_", dataHash)
+                if sameDataFile:
+                    if not sameDataFile == os.path.basename(abcName):
+                        self.pipeliner.saveDataPointer(abcName, sameDataFile, dataHash)
+                    if nodeStateDic:
+                        self.changeNodeState(itemList, findDeformers=False, dic=nodeStateDic) #back deformer as before
+                    self.wellDoneIO(abcName)
+                    return
             # export alembic
             self.pipeliner.makeDirIfNotExists(path)
             ioItems = ' -root '.join(itemList)
@@ -471,8 +527,9 @@ class ActionStartClass(object):
                     if userDefAttrList:
                         for userDefAttr in userDefAttrList:
                             attrStr += " -attr "+userDefAttr
-            abcName = path+"/"+startName+"_"+fileName+".abc"
             cmds.AbcExport(jobArg="-frameRange 0 0 -uvWrite -writeVisibility -writeUVSets -worldSpace -dataFormat ogawa -root "+ioItems+attrStr+" -file "+abcName)
+            if versionedFile:
+                self.pipeliner.recordDataHash(abcName, dataHash)
             if nodeStateDic:
                 self.changeNodeState(itemList, findDeformers=False, dic=nodeStateDic) #back deformer as before
             self.wellDoneIO(abcName)
@@ -480,6 +537,62 @@ class ActionStartClass(object):
             self.notWorkedWellIO(', '.join(itemList)+": "+str(e))
 
 
+    def getGeometryDataHash(self, itemList, attr=True, curve=False, worldSpace=True, descendents=True, shapeAttrList=None, *args):
+        """ Returns a hash of the given transforms and their mesh shapes, or also nurbsCurve shapes if curve is True, as they would be exported.
+            It reads names, matrices, visibility, user defined attributes if attr is True, points, topology, normals and uvs.
+            Returns None if the data can't be read, so the file must be exported.
+        """
+        try:
+            dataHash = hashlib.sha1()
+            space = OpenMaya.MSpace.kWorld if worldSpace else OpenMaya.MSpace.kObject
+            typeList = ["mesh"]
+            if curve:
+                typeList.append("nurbsCurve")
+            transformList = cmds.ls(itemList, long=True) or []
+            if descendents:
+                transformList.extend(cmds.listRelatives(transformList, type="transform", allDescendents=True, fullPath=True) or [])
+            shapeList = cmds.listRelatives(transformList, type=typeList, children=True, noIntermediate=True, fullPath=True) or []
+            for node in transformList+shapeList:
+                nodeData = [node, cmds.getAttr(node+".visibility")]
+                if node in transformList:
+                    nodeData.append(cmds.getAttr(node+".worldMatrix[0]") if worldSpace else cmds.getAttr(node+".matrix"))
+                elif shapeAttrList:
+                    for shapeAttr in shapeAttrList:
+                        if cmds.objExists(node+"."+shapeAttr):
+                            nodeData.append([shapeAttr, cmds.getAttr(node+"."+shapeAttr)])
+                if attr:
+                    for userDefAttr in cmds.listAttr(node, userDefined=True) or []:
+                        try:
+                            nodeData.append([userDefAttr, cmds.getAttr(node+"."+userDefAttr)])
+                        except:
+                            nodeData.append([userDefAttr, None])
+                dataHash.update(json.dumps(nodeData, default=str).encode("utf-8"))
+            for shape in shapeList:
+                selectionList = OpenMaya.MSelectionList()
+                selectionList.add(shape)
+                dagPath = selectionList.getDagPath(0)
+                if dagPath.hasFn(OpenMaya.MFn.kMesh):
+                    meshFn = OpenMaya.MFnMesh(dagPath)
+                    dataHash.update(array("d", [c for point in meshFn.getPoints(space) for c in (point.x, point.y, point.z)]).tobytes())
+                    for intArray in list(meshFn.getVertices())+list(meshFn.getNormalIds()):
+                        dataHash.update(array("i", intArray).tobytes())
+                    dataHash.update(array("f", [c for normal in meshFn.getNormals(space) for c in (normal.x, normal.y, normal.z)]).tobytes())
+                    for uvSet in meshFn.getUVSetNames():
+                        dataHash.update(uvSet.encode("utf-8"))
+                        for floatArray in meshFn.getUVs(uvSet):
+                            dataHash.update(array("f", floatArray).tobytes())
+                        for intArray in meshFn.getAssignedUVs(uvSet):
+                            dataHash.update(array("i", intArray).tobytes())
+                elif dagPath.hasFn(OpenMaya.MFn.kNurbsCurve):
+                    curveFn = OpenMaya.MFnNurbsCurve(dagPath)
+                    dataHash.update(array("d", [c for point in curveFn.cvPositions(space) for c in (point.x, point.y, point.z)]).tobytes())
+                    dataHash.update(array("d", curveFn.knots()).tobytes())
+                    dataHash.update(json.dumps([curveFn.degree, curveFn.form]).encode("utf-8"))
+            return dataHash.hexdigest()
+        except:
+            return None
+
+
     def importLatestAlembicFile(self, exportedList, *args):
         """ Import the latest alembic file from given exported list.
         """
@@ -490,7 +603,7 @@ class ActionStartClass(object):
                 # import alembic
                 exportedList.sort()
                 self.latestDataFile = exportedList[-1]
-                abcToImport = self.ioPath+"/"+self.latestDataFile
+                abcToImport = self.pipeliner.resolveDataPointer(self.ioPath+"/"+self.latestDataFile)
                 #cmds.AbcImport(jobArg="-mode import \""+abcToImport+"\"")
                 mel.eval("AbcImport -mode import \""+abcToImport+"\";")
                 self.wellDoneIO(self.latestDataFile)
@@ -502,12 +615,14 @@ class ActionStartClass(object):
 
     def importLatestJsonFile(self, exportedList, path=None, *args):
         """ Return the latest exported json file from given list.
+            It reads the regular json or the compact json header with its binary sidecar, whichever format is present.
         """
         self.latestDataFile = None
+        if exportedList:
+            exportedList = sorted([f for f in exportedList if not self.pipeliner.isCompactSidecar(f) and not self.pipeliner.isDataHashIndex(f)])
         if exportedList:
             if not path:
                 path = self.ioPath
-            exportedList.sort()
             self.latestDataFile = exportedList[-1]
             return self.pipeliner.getJsonContent(self.ioPath+"/"+exportedList[-1])
         else:
@@ -517,7 +632,7 @@ class ActionStartClass(object):
     def updateDeleteDataButton(self, *args):
         """ Check if there's some exported data for this module and update the delete data button as enable or disable.
         """
-        if self.ioDir and cmds.iconTextButton(self.deleteDataITB, query=True, exists=True):
+        if self.ui and self.ioDir and cmds.iconTextButton(self.deleteDataITB, query=True, exists=True):
             if self.getExportedList(askHasData=True):
                 cmds.iconTextButton(self.deleteDataITB, edit=True, enable=True)
             else:
@@ -1,6 +1,8 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
+import json
+import hashlib
 from ..Library import dpControls
 from ...Tools import dpCorrectionManager
 
@@ -9,7 +11,7 @@ class RigType(object):
     quadruped = "quadruped"
     default = "unknown" #Support old guide system
 
-DP_BASESTANDARD_VERSION = 2.12
+DP_BASESTANDARD_VERSION = 2.13
 
 
 class BaseStandard(object):
@@ -646,6 +648,22 @@ class BaseStandard(object):
         cmds.setAttr(self.guideNet+".beforeData", (";").join(bList)+";", type="string")
 
 
+    def getGuideDataHash(self, optionList=None, *args):
+        """ Read the guide data like serializeGuide does, without changing the guide, to return its hash with the given build options.
+            Used to know if this guide changed since the last build.
+        """
+        guideDic = {}
+        beforeList = self.getBeforeList()
+        if beforeList:
+            for beforeAttr in beforeList:
+                nodeName = cmds.listConnections(self.guideNet+"."+beforeAttr, source=True, destination=False) or None
+                if nodeName:
+                    if cmds.objExists(nodeName[0]):
+                        guideDic[nodeName[0]] = self.getNodeData(nodeName[0])
+        hashData = json.dumps([self.guideModuleName, guideDic, optionList], sort_keys=True, default=str)
+        return hashlib.sha1(hashData.encode("utf-8")).hexdigest()
+
+
     def getNodeData(self, node, *args):
         """ Get and return all transformation data for the transform, also the userDefined attributes and them values.
             Returns a dictionary with this info.
@@ -1,6 +1,7 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
+from maya.api import OpenMaya
 from ...Pipeline.Validator.CheckOut import dpResetPose
 from functools import partial
 import os
@@ -12,7 +13,7 @@ SNAPSHOT_SUFFIX = "_Snapshot_Crv"
 HEADDEFINFLUENCE = "dpHeadDeformerInfluence"
 JAWDEFINFLUENCE = "dpJawDeformerInfluence"
 
-DP_CONTROLS_VERSION = 3.07
+DP_CONTROLS_VERSION = 3.12
 
 
 class ControlClass(object):
@@ -110,64 +111,144 @@ class ControlClass(object):
 
     def getGuideListByAttr(self, item, attr="guideColorIndex", *args):
         """ Return the guide children list if it is a guide node.
+            The children are compared by namespace, so the item can be a short or long name.
         """
         guideList = []
         if attr in cmds.listAttr(item):
             guideList.append(item)
             if "__" in item and ":" in item and item.endswith("Guide_Base"):
-                spaceName = item.split(":")[0]
+                spaceName = item.rpartition("|")[2].rpartition(":")[0]
                 childrenList = cmds.listRelatives(item, children=True, allDescendents=True, noIntermediate=True, type=self.shapeTypeList)
                 if childrenList:
                     for child in childrenList:
-                        if child.startswith(spaceName):
+                        if child.rpartition("|")[2].rpartition(":")[0] == spaceName:
                             guideList.append(child)
         return guideList
 
 
     # CONTROLS functions:
-    def colorShape(self, objList, color, rgb=False, outliner=False, instance=None, *args):
-        """ Create a color override for all shapes from the objList.
+    def getColorData(self, color, rgb=False, *args):
+        """ Returns the color and the color index from the given color name, index or rgb list.
         """
-        # define colorIndex value
         iColorIdx = color
         if rgb:
             if color in list(self.dic_colors):
                 color = self.dic_colors[color]
         elif color in list(self.dic_colors):
             iColorIdx = self.dic_colors[color]
+        return color, iColorIdx
+
+
+    def colorShape(self, objList, color, rgb=False, outliner=False, instance=None, *args):
+        """ Create a color override for all shapes from the objList.
+        """
         if not objList:
             objList = cmds.ls(selection=True)
         # find shapes and apply the color override:
         if objList:
-            for objName in objList:
-                if outliner:
+            if outliner:
+                color, iColorIdx = self.getColorData(color, rgb)
+                for objName in objList:
                     self.setColorOverride(objName, color, iColorIdx, rgb, outliner)
-                else:
-                    objType = cmds.objectType(objName)
+            else:
+                self.colorShapeBatch([[color, objList]], rgb, instance)
+
+
+    def colorShapeBatch(self, colorObjList, rgb=False, instance=None, *args):
+        """ Create the color override for all shapes of the given list of [color, objList] in bulk.
+            The shapes of all transforms by color are found at once and the override attributes are set in only one command.
+        """
+        overrideList = []
+        for color, objList in colorObjList:
+            if objList:
+                color, iColorIdx = self.getColorData(color, rgb)
+                shapeList, transformList = [], []
+                typedList = cmds.ls(objList, long=True, showType=True) or []
+                for objName, objType in zip(typedList[0::2], typedList[1::2]):
                     # verify if the object is the shape type:
                     if objType in self.shapeTypeList:
-                        self.setColorOverride(objName, color, iColorIdx, rgb, instance=instance)
+                        shapeList.append(objName)
                     # verify if the object is a transform type:
                     elif objType == "transform":
-                        # try get guide shape list
-                        itemList = self.getGuideListByAttr(objName)
-                        if itemList:
-                            if rgb:
-                                cmds.setAttr(objName+".guideColorIndex", -1)
-                                cmds.setAttr(objName+".guideColorR", color[0])
-                                cmds.setAttr(objName+".guideColorG", color[1])
-                                cmds.setAttr(objName+".guideColorB", color[2])
-                            else:
-                                cmds.setAttr(objName+".guideColorIndex", iColorIdx)
-                                cmds.setAttr(objName+".guideColorR", self.colorList[iColorIdx][0])
-                                cmds.setAttr(objName+".guideColorG", self.colorList[iColorIdx][1])
-                                cmds.setAttr(objName+".guideColorB", self.colorList[iColorIdx][2])
+                        transformList.append(objName)
+                if transformList:
+                    guideList = cmds.ls([t+".guideColorIndex" for t in transformList], objectsOnly=True, long=True) or []
+                    for objName in guideList:
+                        # guide shapes list
+                        if rgb:
+                            cmds.setAttr(objName+".guideColorIndex", -1)
+                            cmds.setAttr(objName+".guideColorR", color[0])
+                            cmds.setAttr(objName+".guideColorG", color[1])
+                            cmds.setAttr(objName+".guideColorB", color[2])
                         else:
-                            # find all shapes children of the transform object:
-                            itemList = cmds.listRelatives(objName, shapes=True, children=True, fullPath=True)
-                        if itemList:
-                            for shape in itemList:
-                                self.setColorOverride(shape, color, iColorIdx, rgb, instance=instance)
+                            cmds.setAttr(objName+".guideColorIndex", iColorIdx)
+                            cmds.setAttr(objName+".guideColorR", self.colorList[iColorIdx][0])
+                            cmds.setAttr(objName+".guideColorG", self.colorList[iColorIdx][1])
+                            cmds.setAttr(objName+".guideColorB", self.colorList[iColorIdx][2])
+                        shapeList.extend(self.getGuideListByAttr(objName))
+                    # find all shapes children of the transform objects:
+                    transformList = [t for t in transformList if not t in guideList]
+                    if transformList:
+                        shapeList.extend(cmds.listRelatives(transformList, shapes=True, children=True, fullPath=True) or [])
+                if shapeList:
+                    overrideList.append([shapeList, color, iColorIdx])
+        if overrideList:
+            self.setColorOverrideList(overrideList, rgb, instance)
+
+
+    def setColorOverrideList(self, overrideList, rgb, instance=None, *args):
+        """ Set the color override for the given list of [nodeList, color, colorIndex] running all setAttr in only one mel command.
+        """
+        melCmdList = []
+        for nodeList, color, iColorIdx in overrideList:
+            for item in nodeList:
+                melCmdList.append('setAttr "'+item+'.overrideEnabled" 1;')
+                if rgb:
+                    melCmdList.append('setAttr "'+item+'.overrideRGBColors" 1;')
+                    melCmdList.append('setAttr "'+item+'.overrideColorRGB" -type double3 '+str(color[0])+' '+str(color[1])+' '+str(color[2])+';')
+                else:
+                    melCmdList.append('setAttr "'+item+'.overrideRGBColors" 0;')
+                    melCmdList.append('setAttr "'+item+'.overrideColor" '+str(iColorIdx)+';')
+        mel.eval("\n".join(melCmdList))
+        if instance:
+            color, iColorIdx = overrideList[-1][1], overrideList[-1][2]
+            if not rgb:
+                color = self.colorList[iColorIdx]
+            cmds.button(instance.colorButton, edit=True, backgroundColor=[color[0], color[1], color[2]])
+            if not instance.moduleGrp in cmds.ls(selection=True):
+                cmds.button(instance.selectButton, edit=True, backgroundColor=[color[0], color[1], color[2]])
+
+
+    def getNotColorizedList(self, objList, *args):
+        """ Returns the given transforms that have shapes without color override.
+            It checks the same shape listRelatives allDescendents would give first for each transform, but all shapes are listed in one query.
+        """
+        resultList = []
+        if objList:
+            longList = cmds.ls(objList, long=True) or []
+            if len(longList) == len(objList):
+                longDic = dict(zip(longList, objList))
+            else:
+                longDic = dict((cmds.ls(objName, long=True)[0], objName) for objName in objList if cmds.objExists(objName))
+                longList = list(longDic.keys())
+            # the last shape in the dag order is the first one listed by allDescendents:
+            firstShapeDic = {}
+            for shape in cmds.ls(longList, dag=True, long=True, type="shape") or []:
+                pathList = shape.split("|")
+                for i in range(2, len(pathList)):
+                    parent = "|".join(pathList[:i])
+                    if parent in longDic:
+                        firstShapeDic[parent] = shape
+            if firstShapeDic:
+                shapeList = list(set(firstShapeDic.values()))
+                selList = OpenMaya.MSelectionList()
+                for shape in shapeList:
+                    selList.add(shape+".overrideEnabled")
+                overrideDic = dict((shape, selList.getPlug(i).asBool()) for i, shape in enumerate(shapeList))
+                for longName in longList:
+                    if longName in firstShapeDic and not overrideDic[firstShapeDic[longName]]:
+                        resultList.append(longDic[longName])
+        return resultList
 
 
     def setColorOverride(self, item, color, iColorIdx, rgb, outliner=False, instance=None, *args):
@@ -462,14 +543,9 @@ class ControlClass(object):
 
     def getControlNodeById(self, ctrlType, *args):
         """ Find and return node list with ctrlType in its attribute.
+            It uses the scene lookup by attribute.
         """
-        ctrlList = []
-        allTransformList = cmds.ls(selection=False, type="transform")
-        for item in allTransformList:
-            if "controlID" in cmds.listAttr(item):
-                if cmds.getAttr(item+".controlID") == ctrlType:
-                    ctrlList.append(item)
-        return ctrlList
+        return self.dpUIinst.sceneLookup.getControlNodeById(ctrlType)
 
 
     def getControlModuleById(self, ctrlType, *args):
@@ -490,12 +566,20 @@ class ControlClass(object):
 
     def getControlInstance(self, instanceName, *args):
         """ Find the loaded control instance by name.
+            If it isn't loaded yet, find its module by the registry to import and initialize it.
+            The registry keeps the names not found, so a missing control doesn't list the curve folders again.
             Return the instance found.
         """
         if self.dpUIinst.controlInstanceList:
             for instance in self.dpUIinst.controlInstanceList:
                 if instance.guideModuleName == instanceName:
                     return instance
+        for curvesFolder in [self.dpUIinst.curvesSimpleFolder, self.dpUIinst.curvesCombinedFolder]:
+            guideModule = self.dpUIinst.registry.findModuleByClassName(self.dpUIinst.dpARpath, curvesFolder, instanceName)
+            if guideModule:
+                instance = self.dpUIinst.initExtraModule(guideModule, curvesFolder.replace("/", "."))
+                self.dpUIinst.controlInstanceList.append(instance)
+                return instance
 
 
     def cvControl(self, ctrlType, ctrlName, r=1, d=1, dir='+Y', rot=(0, 0, 0), corrective=False, headDef=0, guideSource=None, parentTag=None, *args):
@@ -0,0 +1,165 @@
+# importing libraries:
+from maya import cmds
+import os
+import sys
+import json
+import marshal
+
+DP_LANGUAGECACHE_VERSION = 1.00
+
+
+class Language(dict):
+    def __init__(self, content, fallbackFunction=None, *args):
+        """ Language dictionary that looks for the missing keys in the fallback language.
+        """
+        dict.__init__(self, content)
+        self.fallbackFunction = fallbackFunction
+
+
+    def __missing__(self, key):
+        """ Returns the text of the fallback language if this language doesn't have the key.
+        """
+        if self.fallbackFunction:
+            fallbackLang = self.fallbackFunction()
+            if fallbackLang != None and not fallbackLang is self:
+                return fallbackLang[key]
+        raise KeyError(key)
+
+
+class LanguageDic(dict):
+    def __init__(self, langList, loadFunction, *args):
+        """ Dictionary of languages by name that loads each language only when it's asked for.
+        """
+        dict.__init__(self)
+        self.langList = list(langList)
+        self.loadFunction = loadFunction
+
+
+    def __missing__(self, langName):
+        """ Load the language the first time it's used.
+        """
+        if not langName in self.langList:
+            raise KeyError(langName)
+        lang = self.loadFunction(langName)
+        dict.__setitem__(self, langName, lang)
+        return lang
+
+
+    def __setitem__(self, langName, lang):
+        if not langName in self.langList:
+            self.langList.append(langName)
+        dict.__setitem__(self, langName, lang)
+
+
+    def __contains__(self, langName):
+        return langName in self.langList
+
+
+    def __iter__(self):
+        return iter(self.langList)
+
+
+    def __len__(self):
+        return len(self.langList)
+
+
+    def keys(self):
+        return list(self.langList)
+
+
+    def get(self, langName, default=None):
+        if langName in self.langList:
+            return self[langName]
+        return default
+
+
+    def items(self):
+        return [(langName, self[langName]) for langName in self.langList]
+
+
+    def values(self):
+        return [self[langName] for langName in self.langList]
+
+
+class LanguageCache(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It lists the language json files without reading them and loads only the asked languages.
+            Each loaded language is kept as a marshal file in the user preferences folder, read again only if its json file changed.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.cacheFolderName = "dpLanguageCache"
+        self.langDic = None
+
+
+    def getLanguagePath(self, *args):
+        """ Returns the languages folder path.
+        """
+        return os.path.join(self.dpUIinst.dpARpath, self.dpUIinst.languagesFolder, "").replace("\\", "/")
+
+
+    def getCacheFile(self, langName, *args):
+        """ Returns the marshal cache file path of the given language.
+        """
+        cacheFolder = os.path.join(cmds.internalVar(userPrefDir=True), self.cacheFolderName)
+        return os.path.join(cacheFolder, langName+"."+sys.implementation.cache_tag+".marshal")
+
+
+    def getLanguageInfo(self, *args):
+        """ Find all language json files.
+            Returns the language name list and a language dictionary that loads each language only when it's used.
+        """
+        langList = []
+        for file in os.listdir(self.getLanguagePath()):
+            if file.endswith(".json"):
+                langList.append(file.partition(".json")[0])
+        self.langDic = LanguageDic(langList, self.loadLanguage)
+        return langList, self.langDic
+
+
+    def getFallbackLanguage(self, *args):
+        """ Returns the English language used to find the missing keys of the other languages.
+        """
+        if self.langDic != None and self.dpUIinst.englishName in self.langDic:
+            return self.langDic[self.dpUIinst.englishName]
+
+
+    def loadLanguage(self, langName, *args):
+        """ Returns the language dictionary from the cache file if it's updated with the json file.
+            Otherwise read the json file and write the cache file.
+        """
+        jsonFile = self.getLanguagePath()+langName+".json"
+        jsonStat = os.stat(jsonFile)
+        stampList = [DP_LANGUAGECACHE_VERSION, jsonStat.st_mtime, jsonStat.st_size]
+        content = None
+        cacheFile = self.getCacheFile(langName)
+        try:
+            with open(cacheFile, "rb") as cache:
+                cacheStampList, cacheContent = marshal.load(cache)
+            if list(cacheStampList) == stampList:
+                content = cacheContent
+        except (OSError, EOFError, ValueError, TypeError):
+            pass
+        if content == None:
+            try:
+                with open(jsonFile, "r", encoding='utf-8') as fileDictionary:
+                    content = json.loads(fileDictionary.read())
+                self.writeCache(cacheFile, stampList, content)
+            except ValueError:
+                print("Error: json file corrupted:", langName+".json")
+                content = {}
+        return Language(content, self.getFallbackLanguage)
+
+
+    def writeCache(self, cacheFile, stampList, content, *args):
+        """ Write the language content and its json file stamp as a marshal file.
+        """
+        try:
+            cacheFolder = os.path.dirname(cacheFile)
+            if not os.path.exists(cacheFolder):
+                os.makedirs(cacheFolder)
+            with open(cacheFile, "wb") as cache:
+                marshal.dump([stampList, content], cache)
+        except OSError:
+            pass
@@ -0,0 +1,162 @@
+# importing libraries:
+from maya import cmds
+from maya.api import OpenMaya
+
+DP_MESHTOPOLOGY_VERSION = 1.01
+
+EDGE_KEY_LIST = ["edgeVertexList", "edgeFaceCount", "vertexEdgeCount"]
+
+
+class Topology(dict):
+    def __init__(self, content, dagPath, loadFunction, *args):
+        """ Topology dictionary of a mesh that reads the edge data only when it's asked for.
+        """
+        dict.__init__(self, content)
+        self.dagPath = OpenMaya.MDagPath(dagPath)
+        self.loadFunction = loadFunction
+
+
+    def __missing__(self, key):
+        """ Read the edge data the first time one of its keys is used.
+        """
+        if not key in EDGE_KEY_LIST:
+            raise KeyError(key)
+        self.update(self.loadFunction(self.dagPath))
+        return dict.__getitem__(self, key)
+
+
+class MeshTopology(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It reads the mesh topology arrays once by API 2.0 and can keep them in a snapshot shared by the validators of the same run.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.snapshotDic = None
+
+
+    def startSnapshot(self, *args):
+        """ Start to keep the read mesh topology data indexed by the shape dagPath.
+        """
+        self.snapshotDic = {}
+
+
+    def clearSnapshot(self, *args):
+        """ Forget the kept mesh topology data, used when an action changed the meshes.
+        """
+        if self.snapshotDic != None:
+            self.snapshotDic = {}
+
+
+    def stopSnapshot(self, *args):
+        """ Stop to keep the mesh topology data.
+        """
+        self.snapshotDic = None
+
+
+    def readTopology(self, dagPath, *args):
+        """ Read the face topology arrays of the given mesh dagPath.
+            Returns a topology dictionary with:
+                - object = transform name
+                - shape = shape full path name
+                - faceVertexCount = vertex count by face
+                - faceVertexList = vertex indices of all faces in order
+            The edge data keys are read by readEdgeTopology only when they are used:
+                - edgeVertexList = pair of vertex indices by edge in a flat list
+                - edgeFaceCount = connected face count by edge
+                - vertexEdgeCount = connected edge count by vertex
+        """
+        meshFn = OpenMaya.MFnMesh(dagPath)
+        faceVertexCount, faceVertexList = meshFn.getVertices()
+        return Topology({
+                "object"          : OpenMaya.MFnDagNode(dagPath.transform()).name(),
+                "shape"           : dagPath.fullPathName(),
+                "faceVertexCount" : list(faceVertexCount),
+                "faceVertexList"  : list(faceVertexList)
+                }, dagPath, self.readEdgeTopology)
+
+
+    def readEdgeTopology(self, dagPath, *args):
+        """ Read the edge topology arrays of the given mesh dagPath.
+            Returns a dictionary with the edgeVertexList, edgeFaceCount and vertexEdgeCount keys.
+        """
+        meshFn = OpenMaya.MFnMesh(dagPath)
+        edgeVertexList = [0] * (2 * meshFn.numEdges)
+        edgeFaceCount = [0] * meshFn.numEdges
+        vertexEdgeCount = [0] * meshFn.numVertices
+        # one edge pass because there isn't a bulk edge query in API 2.0
+        edgeIter = OpenMaya.MItMeshEdge(dagPath)
+        while not edgeIter.isDone():
+            e = edgeIter.index()
+            v0 = edgeIter.vertexId(0)
+            v1 = edgeIter.vertexId(1)
+            edgeVertexList[2*e] = v0
+            edgeVertexList[2*e+1] = v1
+            edgeFaceCount[e] = edgeIter.numConnectedFaces()
+            vertexEdgeCount[v0] += 1
+            vertexEdgeCount[v1] += 1
+            edgeIter.next()
+        return {
+                "edgeVertexList"  : edgeVertexList,
+                "edgeFaceCount"   : edgeFaceCount,
+                "vertexEdgeCount" : vertexEdgeCount
+                }
+
+
+    def getTopology(self, dagPath, *args):
+        """ Returns the topology dictionary of the given mesh dagPath.
+            It uses the snapshot data if it was already read in this run.
+        """
+        if self.snapshotDic == None:
+            return self.readTopology(dagPath)
+        shapeName = dagPath.fullPathName()
+        if not shapeName in self.snapshotDic.keys():
+            self.snapshotDic[shapeName] = self.readTopology(dagPath)
+        return self.snapshotDic[shapeName]
+
+
+    def getMeshTopologyList(self, meshList, *args):
+        """ Returns the topology dictionary list of the given mesh shapes ignoring the intermediate objects.
+        """
+        topologyList = []
+        for meshNode in cmds.ls(meshList, long=True, type="mesh"):
+            selList = OpenMaya.MSelectionList()
+            selList.add(meshNode)
+            dagPath = selList.getDagPath(0)
+            if not OpenMaya.MFnDagNode(dagPath).isIntermediateObject:
+                topologyList.append(self.getTopology(dagPath))
+        return topologyList
+
+
+    def getLaminaFaceList(self, topologyDic, *args):
+        """ Returns the face indices using the same vertices of another face.
+            The result is kept in the topology dictionary to be shared by the validators of the same snapshot.
+        """
+        if "laminaFaceList" in topologyDic.keys():
+            return list(topologyDic["laminaFaceList"])
+        faceList, faceDic = [], {}
+        start = 0
+        for f, count in enumerate(topologyDic["faceVertexCount"]):
+            key = tuple(sorted(topologyDic["faceVertexList"][start:start+count]))
+            start += count
+            if key in faceDic.keys():
+                if not faceDic[key] in faceList:
+                    faceList.append(faceDic[key])
+                faceList.append(f)
+            else:
+                faceDic[key] = f
+        faceList.sort()
+        topologyDic["laminaFaceList"] = faceList
+        return list(faceList)
+
+
+    def getBorderVertexSet(self, topologyDic, *args):
+        """ Returns the set of vertex indices in the border edges.
+        """
+        edgeVertexList = topologyDic["edgeVertexList"]
+        borderSet = set()
+        for e, faceCount in enumerate(topologyDic["edgeFaceCount"]):
+            if faceCount == 1:
+                borderSet.add(edgeVertexList[2*e])
+                borderSet.add(edgeVertexList[2*e+1])
+        return borderSet
@@ -0,0 +1,134 @@
+# importing libraries:
+from maya import cmds
+import os
+import ast
+import json
+
+DP_MODULEREGISTRY_VERSION = 1.01
+
+
+class ModuleRegistry(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It reads the global variables of the module files (CLASS_NAME, TITLE, DESCRIPTION, ICON, WIKI) without importing them.
+            The read data is kept in a manifest file by module file modification time to be reused in the next start.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.metadataList = ["CLASS_NAME", "TITLE", "DESCRIPTION", "ICON", "WIKI"]
+        self.manifestName = "dpModuleManifest.json"
+        self.manifestDic = None
+        self.manifestChanged = False
+        self.missedClassSet = set()
+
+
+    def clearMissedClasses(self, *args):
+        """ Forget the class names not found before, called when the module folders are scanned again.
+        """
+        self.missedClassSet = set()
+
+
+    def getManifestFile(self, *args):
+        """ Returns the manifest file path in the user preferences folder.
+        """
+        return os.path.join(cmds.internalVar(userPrefDir=True), self.manifestName)
+
+
+    def loadManifest(self, *args):
+        """ Read the manifest file if it was written by the same dpAutoRigSystem version.
+            Otherwise start an empty manifest.
+        """
+        self.manifestDic = {"dpARVersion" : self.dpUIinst.dpARVersion, "registryVersion" : DP_MODULEREGISTRY_VERSION, "files" : {}}
+        try:
+            with open(self.getManifestFile(), encoding='utf8') as manifestFile:
+                loadedDic = json.load(manifestFile)
+            if loadedDic.get("dpARVersion") == self.dpUIinst.dpARVersion and loadedDic.get("registryVersion") == DP_MODULEREGISTRY_VERSION:
+                self.manifestDic["files"] = loadedDic.get("files", {})
+        except (OSError, ValueError):
+            pass
+        self.manifestChanged = False
+
+
+    def saveManifest(self, *args):
+        """ Write the manifest file if there are new module data.
+        """
+        if self.manifestDic and self.manifestChanged:
+            try:
+                with open(self.getManifestFile(), "w", encoding='utf8') as manifestFile:
+                    json.dump(self.manifestDic, manifestFile, indent=4, sort_keys=True)
+                self.manifestChanged = False
+            except OSError:
+                pass
+
+
+    def readMetadata(self, filePath, *args):
+        """ Parse the module file to get its global string variables listed in metadataList.
+            Returns a dictionary with the found values.
+        """
+        metadataDic = {}
+        with open(filePath, encoding='utf8') as moduleFile:
+            tree = ast.parse(moduleFile.read(), filename=filePath)
+        for node in tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                if node.targets[0].id in self.metadataList:
+                    try:
+                        value = ast.literal_eval(node.value)
+                    except (ValueError, TypeError):
+                        continue
+                    if isinstance(value, str):
+                        metadataDic[node.targets[0].id] = value
+        return metadataDic
+
+
+    def getModuleInfo(self, path, guideDir, guideModule, *args):
+        """ Returns the metadata dictionary of the given module file.
+            It only parses the file again if its modification time changed since the last read.
+            Returns None if the file doesn't declare all the needed variables, so the caller must import it.
+        """
+        if self.manifestDic == None:
+            self.loadManifest()
+        if guideDir:
+            filePath = path+"/"+guideDir.replace(".", "/")+"/"+guideModule+".py"
+        else:
+            filePath = path+"/"+guideModule+".py"
+        try:
+            mtime = os.path.getmtime(filePath)
+        except OSError:
+            return None
+        fileDic = self.manifestDic["files"].get(filePath)
+        if fileDic == None or fileDic["mtime"] != mtime:
+            try:
+                metadataDic = self.readMetadata(filePath)
+            except (OSError, SyntaxError, ValueError):
+                return None
+            fileDic = {"mtime" : mtime, "info" : metadataDic}
+            self.manifestDic["files"][filePath] = fileDic
+            self.manifestChanged = True
+        for key in ["CLASS_NAME", "TITLE", "DESCRIPTION", "ICON"]:
+            if not key in fileDic["info"].keys():
+                return None
+        infoDic = dict(fileDic["info"])
+        if not "WIKI" in infoDic.keys():
+            infoDic["WIKI"] = None
+        return infoDic
+
+
+    def getModuleInfoList(self, path, guideDir, guideModuleList, *args):
+        """ Returns a list of metadata dictionaries, one by given module, and save the manifest if needed.
+        """
+        infoList = [self.getModuleInfo(path, guideDir, guideModule) for guideModule in guideModuleList]
+        self.saveManifest()
+        return infoList
+
+
+    def findModuleByClassName(self, path, guideDir, className, *args):
+        """ Returns the module name of the given folder that declares the given CLASS_NAME or None.
+            A class name not found is kept to not list the folder again until the modules are scanned again.
+        """
+        if (path, guideDir, className) in self.missedClassSet:
+            return None
+        guideModuleList = self.dpUIinst.utils.findAllModules(path, guideDir)
+        for guideModule, infoDic in zip(guideModuleList, self.getModuleInfoList(path, guideDir, guideModuleList)):
+            if infoDic and infoDic["CLASS_NAME"] == className:
+                return guideModule
+        self.missedClassSet.add((path, guideDir, className))
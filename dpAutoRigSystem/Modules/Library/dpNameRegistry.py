@@ -0,0 +1,122 @@
+# importing libraries:
+from maya import cmds
+from maya.api import OpenMaya
+import re
+import time
+
+DP_NAMEREGISTRY_VERSION = 1.01
+
+
+class NameRegistry(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It keeps a set with the scene node names, listed once when the registry starts and updated by callbacks as nodes are renamed or deleted.
+            New nodes aren't listened, the free name found is always checked in the scene and added to the set if it exists.
+            The next free number of each name pattern is remembered, so repeated names are resolved without probing the scene for every number.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.nameSet = set()
+        self.cursorDic = {}
+        self.callbackIdList = []
+        self.callbackCount = 0
+        self.callbackTime = 0
+
+
+    def isActive(self, *args):
+        """ Returns True if the registry is listening the scene changes.
+        """
+        return bool(self.callbackIdList)
+
+
+    def startRegistry(self, *args):
+        """ List the scene node names and create the callbacks to keep them updated.
+        """
+        if self.callbackIdList:
+            return
+        self.nameSet = set(longName.rpartition("|")[2] for longName in cmds.ls(long=True) or [])
+        self.cursorDic = {}
+        self.callbackCount = 0
+        self.callbackTime = 0
+        try:
+            self.callbackIdList.append(OpenMaya.MDGMessage.addNodeRemovedCallback(self.nodeRemoved, "dependNode"))
+            self.callbackIdList.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj, self.nameChanged))
+        except:
+            # without callbacks the names would be outdated
+            self.stopRegistry()
+
+
+    def stopRegistry(self, *args):
+        """ Remove the callbacks and forget the listed names.
+        """
+        if self.callbackIdList:
+            try:
+                OpenMaya.MMessage.removeCallbacks(self.callbackIdList)
+            except:
+                pass
+        self.callbackIdList = []
+        self.nameSet = set()
+        self.cursorDic = {}
+
+
+    def getReportDic(self, *args):
+        """ Returns how many times the callbacks ran and the time spent in them since the registry started, to be stored in the build report.
+        """
+        return {"callbacks" : self.callbackCount, "callbackTime" : round(self.callbackTime, 4), "patterns" : len(self.cursorDic)}
+
+
+    def freeName(self, name, *args):
+        """ Discard the given name and lower the remembered number of the patterns it matches.
+            Each digit run of the name is tried as the number between a pattern prefix and suffix.
+        """
+        self.nameSet.discard(name)
+        for match in re.finditer(r"\d+", name):
+            for i in range(match.start(), match.end()):
+                key = (name[:i], name[match.end():])
+                if key in self.cursorDic.keys():
+                    self.cursorDic[key] = min(self.cursorDic[key], int(name[i:match.end()]))
+
+
+    def nodeRemoved(self, mObj, *args):
+        """ Free the deleted node name, called by the callback.
+        """
+        startTime = time.perf_counter()
+        self.freeName(OpenMaya.MFnDependencyNode(mObj).name())
+        self.callbackCount += 1
+        self.callbackTime += time.perf_counter()-startTime
+
+
+    def nameChanged(self, mObj, prevName, *args):
+        """ Free the previous node name, called by the callback.
+        """
+        startTime = time.perf_counter()
+        if prevName:
+            self.freeName(prevName)
+        self.callbackCount += 1
+        self.callbackTime += time.perf_counter()-startTime
+
+
+    def getFreeNumber(self, prefix, suffix="", start=1, pad=0, *args):
+        """ Returns the smallest number from start that makes a name that doesn't exist with the given prefix and suffix.
+            The number is padded with zeros to the given pad length.
+            The found number is remembered by pattern to start the next search from it, and it's lowered when a matching name is freed.
+            Without callbacks or with a dag path or attribute name it probes the scene for each number.
+        """
+        def getName(n):
+            return prefix+str(n).zfill(pad)+suffix
+        if not self.callbackIdList or "|" in prefix+suffix or "." in prefix+suffix:
+            i = start
+            while cmds.objExists(getName(i)):
+                i += 1
+            return i
+        key = (prefix, suffix)
+        i = max(start, self.cursorDic.get(key, start))
+        while True:
+            while getName(i) in self.nameSet:
+                i += 1
+            # be sure about names the registry can't see, like new nodes or repeated short names
+            if not cmds.objExists(getName(i)):
+                break
+            self.nameSet.add(getName(i))
+        self.cursorDic[key] = i
+        return i
@@ -0,0 +1,130 @@
+# importing libraries:
+from maya import cmds
+
+DP_SCENEINDEX_VERSION = 1.02
+
+
+class SceneIndex(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It keeps the scene queries shared by the actions of the same run, built lazily when they are asked for.
+            Without an active index each query just asks Maya.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+        self.indexDic = None
+
+
+    def startIndex(self, *args):
+        """ Start to keep the scene query results.
+        """
+        self.indexDic = {}
+
+
+    def clearIndex(self, *args):
+        """ Forget the kept scene query results, used when an action changed the scene.
+        """
+        if self.indexDic != None:
+            self.indexDic = {}
+
+
+    def stopIndex(self, *args):
+        """ Stop to keep the scene query results.
+        """
+        self.indexDic = None
+
+
+    def isActive(self, *args):
+        """ Returns True if the scene query results are being kept for this run.
+        """
+        return self.indexDic != None
+
+
+    def getIndexed(self, key, queryFunction, *args):
+        """ Returns the kept result of the given key running the query function only once by run.
+            Lists and dictionaries are returned as copies to avoid the caller change the kept data.
+        """
+        if self.indexDic == None:
+            return queryFunction()
+        if not key in self.indexDic.keys():
+            self.indexDic[key] = queryFunction()
+        result = self.indexDic[key]
+        if isinstance(result, (list, dict)):
+            return result.copy()
+        return result
+
+
+    def isReferenced(self, *args):
+        """ Returns the referenced file list of the scene.
+        """
+        return self.getIndexed("reference", lambda: cmds.file(query=True, reference=True))
+
+
+    def listNodes(self, nodeType, longName=False, *args):
+        """ Returns the scene nodes of the given type or type list like cmds.ls(selection=False, type=nodeType).
+        """
+        typeKey = nodeType
+        if isinstance(nodeType, list):
+            typeKey = tuple(nodeType)
+        return self.getIndexed(("ls", typeKey, longName), lambda: cmds.ls(selection=False, type=nodeType, long=longName))
+
+
+    def getAllGrp(self, *args):
+        """ Returns the All_Grp if it exists in the scene.
+        """
+        return self.getIndexed("allGrp", self.dpUIinst.utils.getAllGrp)
+
+
+    def getNetworkNodeByAttr(self, netAttr, *args):
+        """ Returns a list of network nodes with the boolean given net attribute active.
+        """
+        return self.getIndexed(("network", netAttr), lambda: self.dpUIinst.utils.getNetworkNodeByAttr(netAttr))
+
+
+    def getDagData(self, itemList=None, *args):
+        """ Read all dag nodes in one query to build the hierarchy data by long name:
+                - childrenDic = children list by parent
+                - childTypeDic = children node type list by parent
+                - typeDic = node type by node
+                - shortNameDic = long name list by short name
+            If an item list is given, it only reads these items and their children.
+        """
+        dagData = {"childrenDic" : {}, "childTypeDic" : {}, "typeDic" : {}, "shortNameDic" : {}}
+        if itemList:
+            itemTypeList = cmds.ls(itemList, long=True, showType=True) or []
+            childList = cmds.listRelatives(itemTypeList[0::2], children=True, fullPath=True) or []
+            dagList = itemTypeList + (cmds.ls(childList, long=True, showType=True) or [])
+        else:
+            dagList = cmds.ls(dag=True, long=True, showType=True) or []
+        for node, nodeType in zip(dagList[0::2], dagList[1::2]):
+            dagData["typeDic"][node] = nodeType
+            dagData["shortNameDic"].setdefault(node.rpartition("|")[2], []).append(node)
+            parent = node.rpartition("|")[0]
+            if parent:
+                dagData["childrenDic"].setdefault(parent, []).append(node)
+                dagData["childTypeDic"].setdefault(parent, []).append(nodeType)
+        return dagData
+
+
+    def getDagIndex(self, *args):
+        """ Returns the dag data dictionary with childrenDic, childTypeDic, typeDic and shortNameDic keys.
+        """
+        return self.getIndexed("dagData", self.getDagData)
+
+
+    def getChildrenDic(self, *args):
+        """ Returns the dag children long names by parent long name.
+        """
+        return self.getDagIndex()["childrenDic"]
+
+
+    def getChildTypeDic(self, *args):
+        """ Returns the dag children node types by parent long name.
+        """
+        return self.getDagIndex()["childTypeDic"]
+
+
+    def getNodeTypeDic(self, *args):
+        """ Returns the node type by dag node long name.
+        """
+        return self.getDagIndex()["typeDic"]
@@ -0,0 +1,56 @@
+# importing libraries:
+from maya import cmds
+
+DP_SCENELOOKUP_VERSION = 1.02
+
+
+class SceneLookup(object):
+    def __init__(self, dpUIinst, *args):
+        """ Initialize the class.
+            It finds the All_Grp, the message linked nodes, the dp network nodes and the controls by id,
+            listing only the nodes that have the searched attribute with one query instead of checking every node in the scene.
+        """
+        # defining variables:
+        self.dpUIinst = dpUIinst
+
+
+    def listNodesWithAttr(self, attr, nodeType, *args):
+        """ Returns the nodes of the given type that have the given attribute, in all namespaces, with one query.
+        """
+        return cmds.ls("*."+attr, objectsOnly=True, recursive=True, type=nodeType) or []
+
+
+    def getAllGrp(self, masterAttr, *args):
+        """ Return the All_Grp if it exists in the scene.
+        """
+        for transform in self.listNodesWithAttr(masterAttr, "transform"):
+            if cmds.getAttr(transform+"."+masterAttr) == 1:
+                return transform #All_Grp found
+
+
+    def getNodeByMessage(self, attrName, node, *args):
+        """ Get connected node in the given attribute of the given node searching as message.
+            Return the found node name or False if it wasn't found.
+        """
+        if cmds.objExists(node+"."+attrName):
+            foundNodeList = cmds.listConnections(node+"."+attrName, source=True, destination=False)
+            if foundNodeList:
+                return foundNodeList[0]
+        return False
+
+
+    def getNetworkNodeByAttr(self, netAttr, *args):
+        """ Returns a list of network nodes with the dpNetwork and the given boolean net attribute active.
+        """
+        netList = []
+        dpNetworkSet = set(self.listNodesWithAttr("dpNetwork", "network"))
+        for item in self.listNodesWithAttr(netAttr, "network"):
+            if item in dpNetworkSet and cmds.getAttr(item+".dpNetwork") == 1 and cmds.getAttr(item+"."+netAttr) == 1:
+                netList.append(item)
+        return netList
+
+
+    def getControlNodeById(self, ctrlType, *args):
+        """ Find and return node list with ctrlType in its controlID attribute.
+        """
+        return [item for item in self.listNodesWithAttr("controlID", "transform") if cmds.getAttr(item+".controlID") == ctrlType]
@@ -1,9 +1,11 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
+from maya.api import OpenMaya
+from maya.api import OpenMayaAnim
 from . import dpWeights
 
-DP_SKINNING_VERSION = 1.10
+DP_SKINNING_VERSION = 1.13
 
 
 class Skinning(dpWeights.Weights):
@@ -288,27 +290,93 @@ class Skinning(dpWeights.Weights):
             self.setSkinRelativeMode(scNode)
 
 
+    def getSkinClusterFn(self, skinClusterNode, *args):
+        """ Returns the OpenMaya MFnSkinCluster function set of the given skinCluster node.
+        """
+        selectionList = OpenMaya.MSelectionList()
+        selectionList.add(skinClusterNode)
+        return OpenMayaAnim.MFnSkinCluster(selectionList.getDependNode(0))
+
+
+    def getSkinnedGeometryData(self, item, skinFn, *args):
+        """ Find the shape deformed by the given skinCluster function set that belongs to the item.
+            Returns a list with the shape dagPath, a complete component object and the component count.
+        """
+        itemPath = cmds.ls(item, long=True)
+        itemPath = itemPath[0] if itemPath else item
+        shapePath = None
+        for i in range(skinFn.numOutputConnections()):
+            outputPath = skinFn.getPathAtIndex(skinFn.indexForOutputConnection(i))
+            transformPath = OpenMaya.MDagPath(outputPath)
+            transformPath.pop()
+            if outputPath.fullPathName() == itemPath or transformPath.fullPathName() == itemPath:
+                shapePath = outputPath
+                break
+            if not shapePath:
+                shapePath = outputPath
+        if not shapePath:
+            return [None, None, 0]
+        if shapePath.hasFn(OpenMaya.MFn.kMesh):
+            componentType = OpenMaya.MFn.kMeshVertComponent
+            count = OpenMaya.MFnMesh(shapePath).numVertices
+        elif shapePath.hasFn(OpenMaya.MFn.kNurbsCurve):
+            componentType = OpenMaya.MFn.kCurveCVComponent
+            count = OpenMaya.MFnNurbsCurve(shapePath).numCVs
+        else:
+            return [shapePath, None, 0]
+        componentFn = OpenMaya.MFnSingleIndexedComponent()
+        components = componentFn.create(componentType)
+        componentFn.setCompleteData(count)
+        return [shapePath, components, count]
+
+
+    def getSkinWeightMatrix(self, item, skinClusterNode, *args):
+        """ Read all skinCluster weights of the item in just one API call.
+            Returns a list with the influence name list, the influence matrix index list, the component count and the flat weight list (component by influence).
+        """
+        skinFn = self.getSkinClusterFn(skinClusterNode)
+        shapePath, components, count = self.getSkinnedGeometryData(item, skinFn)
+        infNameList, infIndexList = [], []
+        if not components:
+            return [infNameList, infIndexList, 0, []]
+        for infPath in skinFn.influenceObjects():
+            infNameList.append(infPath.partialPathName())
+            infIndexList.append(skinFn.indexForInfluenceObject(infPath))
+        weightArray, infCount = skinFn.getWeights(shapePath, components)
+        return [infNameList, infIndexList, count, list(weightArray)]
+
+
     def getSkinWeights(self, item, skinClusterNode, infList=False, *args):
         """ Returns a list with all skin weights for each item component (vertex or cv) as a influence dictionary.
+            The keys are the influence matrix indices or the influence names if infList is True.
+            It reads the whole weight matrix once by API and keeps only the non zero weights.
         """
         skinWeightsList = []
-        componentList = cmds.ls(item+".vtx[*]", flatten=True) or [] #mesh
-        componentList.extend(cmds.ls(item+".cv[*]", flatten=True) or []) #nurbsCurve
-        for component in range(0, len(componentList)):
-            skinWeightsList.append(self.getDeformerWeights(skinClusterNode, component, infList))
+        infNameList, infIndexList, count, weightList = self.getSkinWeightMatrix(item, skinClusterNode)
+        keyList = infIndexList
+        if infList:
+            keyList = infNameList
+        infCount = len(keyList)
+        if infCount:
+            for c in range(0, count):
+                rowList = weightList[c*infCount:(c+1)*infCount]
+                skinWeightsList.append({keyList[i]: w for i, w in enumerate(rowList) if w})
         return skinWeightsList
     
 
     def getSkinListWeights(self, item, skinClusterNode, attrName="blendWeights", *args):
         """ Returns a dictionary with the skin blend weights by each item component (vertex or cv) that has non zero blend weight value.
+            Only the existing plug elements are read.
         """
         skinDataDic = {}
-        componentList = cmds.ls(item+".vtx[*]", flatten=True) or [] #mesh
-        componentList.extend(cmds.ls(item+".cv[*]", flatten=True) or []) #nurbsCurve
-        for component in range(0, len(componentList)):
-            value = cmds.getAttr(skinClusterNode+"."+attrName+"["+str(component)+"]")
-            if not value == 0:
-                skinDataDic[component] = value
+        skinFn = self.getSkinClusterFn(skinClusterNode)
+        count = self.getSkinnedGeometryData(item, skinFn)[2]
+        plug = skinFn.findPlug(attrName, False)
+        for component in plug.getExistingArrayAttributeIndices():
+            if component < count:
+                value = plug.elementByLogicalIndex(component).asDouble()
+                if not value == 0:
+                    skinDataDic[component] = value
         return skinDataDic
 
 
@@ -346,8 +414,61 @@ class Skinning(dpWeights.Weights):
         return skinWeightsDic
 
 
-    def setImportedSkinWeights(self, item, skinClusterName, skinWeightDic, *args):
+    def setImportedSkinWeights(self, item, skinClusterName, skinWeightDic, mode="api", *args):
         """ Set the skinCluster weight values from the given dictionary.
+            Modes:
+                api = write the full weight array of the skinCluster in just one MFnSkinCluster call (not undoable).
+                undoable = one skinPercent by component zeroing the remaining influences, all inside a single undo chunk.
+                attr = legacy per weight setAttr using a temporary joint to hold all weights before import.
+        """
+        if mode == "api":
+            self.setSkinWeightsByAPI(item, skinClusterName, skinWeightDic[item][skinClusterName]['skinJointsWeights'])
+        elif mode == "undoable":
+            cmds.undoInfo(openChunk=True, chunkName="dpSkinningImport")
+            try:
+                self.setSkinWeightsByComponent(item, skinClusterName, skinWeightDic[item][skinClusterName]['skinJointsWeights'])
+            finally:
+                cmds.undoInfo(closeChunk=True)
+        else:
+            self.setSkinWeightsByAttr(item, skinClusterName, skinWeightDic)
+        self.normalizeItemWeights(item)
+
+
+    def setSkinWeightsByAPI(self, item, skinClusterName, weightList, *args):
+        """ Mount the dense component by influence weight array from the given list of influence dictionaries and set it in one call.
+            Influences that aren't in the skinCluster are ignored.
+        """
+        skinFn = self.getSkinClusterFn(skinClusterName)
+        shapePath, components, count = self.getSkinnedGeometryData(item, skinFn)
+        if components:
+            infPositionDic = {}
+            for p, infPath in enumerate(skinFn.influenceObjects()):
+                infPositionDic[infPath.partialPathName()] = p
+            infCount = len(infPositionDic)
+            valueArray = OpenMaya.MDoubleArray(count*infCount, 0.0)
+            for c, weightDic in enumerate(weightList[:count]):
+                if weightDic:
+                    for jntName in weightDic.keys():
+                        if jntName in infPositionDic:
+                            valueArray[c*infCount+infPositionDic[jntName]] = weightDic[jntName]
+            skinFn.setWeights(shapePath, components, OpenMaya.MIntArray(range(infCount)), valueArray, False)
+
+
+    def setSkinWeightsByComponent(self, item, skinClusterName, weightList, *args):
+        """ Set the weights of each component (vertex or cv) with one skinPercent command zeroing the remaining influences.
+            It's slower than the api mode but it's recorded in the undo queue.
+        """
+        componentName = ".vtx["
+        if not cmds.ls(item+".vtx[0]"):
+            componentName = ".cv["
+        self.unlockJoints(skinClusterName)
+        for c, weightDic in enumerate(weightList):
+            if weightDic:
+                cmds.skinPercent(skinClusterName, item+componentName+str(c)+"]", transformValue=list(weightDic.items()), zeroRemainingInfluences=True, normalize=False)
+
+
+    def setSkinWeightsByAttr(self, item, skinClusterName, skinWeightDic, *args):
+        """ Set the skinCluster weight values from the given dictionary by setAttr one by one.
             Ensure we have a skinCluster node with all weights in just one joint to avoid import issue.
         """
         # workaround to have all weights in a temporary joint
@@ -369,31 +490,39 @@ class Skinning(dpWeights.Weights):
         # remove temporary joint
         cmds.skinCluster(skinClusterName, edit=True, removeInfluence=self.tmpJoint, toSelectedBones=True)
         cmds.delete(self.tmpJoint)
-        self.normalizeItemWeights(item)
 
 
-    def setImportedSkinListWeights(self, skinClusterName, skinWeightDic, attrName="blendWeights", *args):
+    def setImportedSkinListWeights(self, skinClusterName, skinWeightDic, attrName="blendWeights", mode="api", *args):
         """ Set the skinCluster blend or dropoff weight values from the given dictionary.
+            Use the plug elements directly in the api mode or setAttr one by one otherwise.
         """
         if skinWeightDic:
-            for vertex in skinWeightDic.keys():
-                cmds.setAttr(skinClusterName+"."+attrName+"["+str(vertex)+"]", skinWeightDic[vertex])
+            if mode == "api":
+                plug = self.getSkinClusterFn(skinClusterName).findPlug(attrName, False)
+                for vertex in skinWeightDic.keys():
+                    plug.elementByLogicalIndex(int(vertex)).setDouble(skinWeightDic[vertex])
+            else:
+                for vertex in skinWeightDic.keys():
+                    cmds.setAttr(skinClusterName+"."+attrName+"["+str(vertex)+"]", skinWeightDic[vertex])
 
 
-    def importSkinWeightsFromFile(self, itemList, path, filename, verbose=True, *args):
+    def importSkinWeightsFromFile(self, itemList, path, filename, verbose=True, mode="api", skinWeightDic=None, *args):
         """ Import the skinCluster weights of the given item in the given path and filename.
+            The mode argument defines how the weights will be set, see setImportedSkinWeights.
+            Use the given skinWeightDic if it was already loaded to avoid reading the file again.
         """
         self.utils.setProgress(self.ioStartName+": "+self.dpUIinst.lang['c110_start'], self.ioStartName, len(itemList), addOne=False, addNumber=False)
-        skinWeightDic = self.dpUIinst.pipeliner.getJsonContent(path+"/"+filename)
+        if not skinWeightDic:
+            skinWeightDic = self.dpUIinst.pipeliner.getJsonContent(path+"/"+filename)
         if skinWeightDic:
             for item in itemList:
                 self.utils.setProgress("SkinningIO: "+item)
                 if cmds.objExists(item):
                     for skinClusterName in skinWeightDic[item].keys():
                         self.updateOrCreateSkinCluster(item, skinClusterName, skinWeightDic)
-                        self.setImportedSkinWeights(item, skinClusterName, skinWeightDic)
-                        self.setImportedSkinListWeights(skinClusterName, skinWeightDic[item][skinClusterName]['skinBlendWeights'], "blendWeights")
-                        self.setImportedSkinListWeights(skinClusterName, skinWeightDic[item][skinClusterName]['skinDropoffWeights'], "dropoff")
+                        self.setImportedSkinWeights(item, skinClusterName, skinWeightDic, mode)
+                        self.setImportedSkinListWeights(skinClusterName, skinWeightDic[item][skinClusterName]['skinBlendWeights'], "blendWeights", mode)
+                        self.setImportedSkinListWeights(skinClusterName, skinWeightDic[item][skinClusterName]['skinDropoffWeights'], "dropoff", mode)
                         cmds.setAttr(skinClusterName+".dqsSupportNonRigid", skinWeightDic[item][skinClusterName]["skinSupportNonRigid"])
                         cmds.setAttr(skinClusterName+".useComponents", skinWeightDic[item][skinClusterName]["skinUseComponents"])
                         cmds.setAttr(skinClusterName+".deformUserNormals", skinWeightDic[item][skinClusterName]["skinDeformUserNormals"])
@@ -5,7 +5,10 @@ from maya import mel
 import os
 import sys
 import re
+import builtins
 import cProfile
+import pstats
+import tracemalloc
 import urllib.request
 import webbrowser
 import math
@@ -18,7 +21,7 @@ import unicodedata
 from io import TextIOWrapper
 from importlib import reload
 
-DP_UTILS_VERSION = 3.14
+DP_UTILS_VERSION = 3.25
 
 
 class Utils(object):
@@ -188,17 +191,21 @@ class Utils(object):
 
     def findAllModuleNames(self, path, dir):
         """ Find all modules names for this directory.
+            The CLASS_NAME comes from the module registry and the module is only imported if the registry can't read it.
             Return a list with the valid modules and valid modules names.
         """
         validModules = self.findAllModules(path, dir)
         validModuleNames = []
         #guideFolder = (path+"/"+dir).partition("/Modules/")[2]
         guideFolder = self.findEnv("PYTHONPATH", "dpAutoRigSystem")+".Modules.Standard"
-        for m in validModules:
-            mod = __import__(guideFolder+"."+m, {}, {}, [m])
-            if self.dpUIinst.dev:
-                reload(mod)
-            validModuleNames.append(mod.CLASS_NAME)
+        for m, infoDic in zip(validModules, self.dpUIinst.registry.getModuleInfoList(path, dir, validModules)):
+            if infoDic:
+                validModuleNames.append(infoDic["CLASS_NAME"])
+            else:
+                mod = __import__(guideFolder+"."+m, {}, {}, [m])
+                if self.dpUIinst.dev:
+                    reload(mod)
+                validModuleNames.append(mod.CLASS_NAME)
         return(validModules, validModuleNames)
 
 
@@ -229,7 +236,7 @@ class Utils(object):
         if guideNet:
             nodeList = self.getNetworkNodeByAttr("dpGuideNet")
         else:
-            nodeList = cmds.ls(selection=False, transforms=True)
+            nodeList = self.dpUIinst.sceneLookup.listNodesWithAttr(typeName, "transform")
         if nodeList:
             for node in nodeList:
                 if cmds.objExists(node+"."+typeName):
@@ -366,15 +373,44 @@ class Utils(object):
             cmds.setAttr(objName+".originedFrom", attrString, type='string')
 
 
+    def getTransformIndexDic(self, attrList=None, *args):
+        """ Read all transforms by two bulk ls queries and build the hierarchy maps in memory.
+            Also list the transforms with each given attribute without checking the transforms one by one.
+            Returns a dictionary with:
+                - transformList = short names in scene order
+                - shortNameDic = short name by long name
+                - longNameDic = long name by short name
+                - childrenDic = direct children long names by parent long name
+                - attrDic = set of long names by given attribute
+        """
+        indexDic = {"transformList" : [], "shortNameDic" : {}, "longNameDic" : {}, "childrenDic" : {}, "attrDic" : {}}
+        longList = cmds.ls(selection=False, type="transform", long=True) or []
+        shortList = cmds.ls(selection=False, type="transform") or []
+        if len(longList) != len(shortList):
+            shortList = [cmds.ls(longName)[0] for longName in longList]
+        indexDic["transformList"] = shortList
+        for longName, shortName in zip(longList, shortList):
+            indexDic["shortNameDic"][longName] = shortName
+            indexDic["longNameDic"][shortName] = longName
+            parent = longName.rpartition("|")[0]
+            if parent:
+                indexDic["childrenDic"].setdefault(parent, []).append(longName)
+        if attrList:
+            for attr in attrList:
+                indexDic["attrDic"][attr] = set(n for n in cmds.ls("*."+attr, recursive=True, objectsOnly=True, long=True) or [] if n in indexDic["shortNameDic"])
+        return indexDic
+
+
     def getOriginedFromDic(self):
         """ List all transforms in the scene, verify if there is an originedFrom string attribute and store it value in a dictionary.
             Return a dictionary with originedFrom string as keys and transform nodes as values of these keys.
         """
         originedFromDic = {}
-        allTransformList = cmds.ls(selection=False, type="transform")
-        if allTransformList:
-            for transform in allTransformList:
-                if cmds.objExists(transform+".originedFrom"):
+        indexDic = self.getTransformIndexDic(["originedFrom"])
+        originedFromSet = indexDic["attrDic"]["originedFrom"]
+        if originedFromSet:
+            for transform in indexDic["transformList"]:
+                if indexDic["longNameDic"][transform] in originedFromSet:
                     tempOriginedFrom = cmds.getAttr(transform+".originedFrom")
                     if tempOriginedFrom:
                         if not ";" in tempOriginedFrom:
@@ -400,13 +436,19 @@ class Utils(object):
 
     def hook(self):
         """ Mount a dictionary with guide modules hierarchies.
+            It reads the transform hierarchy and the guide attributes in bulk to find the father and children guides in memory.
             Return a dictionary with the father and children lists inside of each guide like:
             {guide{'guideModuleNamespace':"...", 'guideModuleName':"...", 'guideCustomName':"...", 'guideMirrorAxis':"...", 'guideMirrorName':"...", 'fatherGuide':"...", 'fatherNode':"...", 'fatherModule':"...", 'fatherCustomName':"...", 'fatherMirrorAxis':"...", 'fatherMirrorName':"...", 'fatherGuideLoc':"...", 'childrenList':[...]}}
         """
         hookDic = {}
-        allList = cmds.ls(type='transform')
-        for item in allList:
-            if cmds.objExists(item+".guideBase") and cmds.getAttr(item+".guideBase") == 1:
+        indexDic = self.getTransformIndexDic(["guideBase", "nJoint"])
+        shortNameDic = indexDic["shortNameDic"]
+        childrenDic = indexDic["childrenDic"]
+        guideBaseSet = set(n for n in indexDic["attrDic"]["guideBase"] if cmds.getAttr(n+".guideBase") == 1)
+        nJointSet = set(n for n in indexDic["attrDic"]["nJoint"] if cmds.getAttr(n+".nJoint") == 1)
+        for item in indexDic["transformList"]:
+            itemLong = indexDic["longNameDic"][item]
+            if itemLong in guideBaseSet:
                 # module info:
                 guideModuleNamespace = item[:item.find(":")]
                 guideModuleName      = item[:item.find("__")]
@@ -416,36 +458,31 @@ class Utils(object):
                 tempAMirrorName      = cmds.getAttr(item+".mirrorName")
                 guideMirrorName      = [tempAMirrorName[0]+"_" , tempAMirrorName[len(tempAMirrorName)-1:]+"_"]
                 
-                # get children:
+                # get children in the listRelatives allDescendents order:
                 guideChildrenList = []
-                childrenList = cmds.listRelatives(item, allDescendents=True, type='transform')
-                if childrenList:
-                    for child in childrenList:
-                        if cmds.objExists(child+".guideBase"):
-                            if cmds.getAttr(child+".guideBase") == 1:
-                                guideChildrenList.append(child)
-                        if cmds.objExists(child+".hookNode"):
-                            hookNode = cmds.getAttr(child+".hookNode")
+                descendentList = []
+                toVisitList = list(reversed(childrenDic.get(itemLong, [])))
+                while toVisitList:
+                    child = toVisitList.pop()
+                    descendentList.append(child)
+                    toVisitList.extend(reversed(childrenDic.get(child, [])))
+                for child in reversed(descendentList):
+                    if child in guideBaseSet:
+                        guideChildrenList.append(shortNameDic[child])
                 
                 # get father:
                 guideParentList = []
                 fatherNodeList = []
                 parentNode = ""
-                parentList = cmds.listRelatives(item, parent=True, type='transform')
-                if parentList:
-                    nextLoop = True
-                    while nextLoop:
-                        if cmds.objExists(parentList[0]+".guideBase") and cmds.getAttr(parentList[0]+".guideBase") == 1:
-                            guideParentList.append(parentList[0])
-                            nextLoop = False
-                        else:
-                            if not fatherNodeList:
-                                fatherNodeList.append(parentList[0])
-                            parentList = cmds.listRelatives(parentList[0], parent=True, type='transform')
-                            if parentList:
-                                nextLoop = True
-                            else:
-                                nextLoop = False
+                parentLong = itemLong.rpartition("|")[0]
+                if parentLong in shortNameDic:
+                    while parentLong in shortNameDic:
+                        if parentLong in guideBaseSet:
+                            guideParentList.append(shortNameDic[parentLong])
+                            break
+                        if not fatherNodeList:
+                            fatherNodeList.append(shortNameDic[parentLong])
+                        parentLong = parentLong.rpartition("|")[0]
                     if guideParentList:
                         # father info:
                         guideParent      = guideParentList[0]
@@ -458,30 +495,77 @@ class Utils(object):
                         if fatherNodeList:
                             fatherGuideLoc = fatherNodeList[0][fatherNodeList[0].find("Guide_")+6:]
                         else:
-                            guideParentChildrenList = cmds.listRelatives(guideParent, children=True, type='transform')
-                            if guideParentChildrenList:
-                                for guideParentChild in guideParentChildrenList:
-                                    if cmds.objExists(guideParentChild+'.nJoint'):
-                                        if cmds.getAttr(guideParentChild+'.nJoint') == 1:
-                                            if guideParent[:guideParent.rfind(":")] in guideParentChild:
-                                                fatherNodeList = [guideParentChild]
-                                                fatherGuideLoc = guideParentChild[guideParentChild.find("Guide_")+6:]
+                            for guideParentChildLong in childrenDic.get(indexDic["longNameDic"][guideParent], []):
+                                if guideParentChildLong in nJointSet:
+                                    guideParentChild = shortNameDic[guideParentChildLong]
+                                    if guideParent[:guideParent.rfind(":")] in guideParentChild:
+                                        fatherNodeList = [guideParentChild]
+                                        fatherGuideLoc = guideParentChild[guideParentChild.find("Guide_")+6:]
                     
                     # parentNode info:
-                    parentNode = cmds.listRelatives(item, parent=True, type='transform')[0]
+                    parentNode = shortNameDic[itemLong.rpartition("|")[0]]
                 
                 # mounting dictionary:
-                if guideParentList and guideChildrenList:
-                    hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":guideChildrenList}
-                elif guideParentList:
-                    hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc, "parentNode":parentNode, "childrenList":[]}
-                elif guideChildrenList:
-                    hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":guideChildrenList}
-                else:
-                    hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":[]}
+                hookDic[item]={"guideModuleNamespace":guideModuleNamespace, "guideModuleName":guideModuleName, "guideInstance":guideInstance, "guideCustomName":guideCustomName, "guideMirrorAxis":guideMirrorAxis, "guideMirrorName":guideMirrorName, "fatherGuide":"", "fatherNode":"", "fatherModule":"", "fatherInstance":"", "fatherCustomName":"", "fatherMirrorAxis":"", "fatherMirrorName":"", "fatherGuideLoc":"", "parentNode":parentNode, "childrenList":guideChildrenList}
+                if guideParentList:
+                    hookDic[item].update({"fatherGuide":guideParent, "fatherNode":fatherNodeList[0], "fatherModule":fatherModule, "fatherInstance":fatherInstance, "fatherCustomName":fatherCustomName, "fatherMirrorAxis":fatherMirrorAxis, "fatherMirrorName":fatherMirrorName, "fatherGuideLoc":fatherGuideLoc})
         return hookDic
 
 
+    def getBuildPlanDic(self, moduleGrpList, hookDic, *args):
+        """ Mount the build plan of the given guide modules as a dependency graph from the hook father and children relations.
+            Each module gets its father module, children modules and level (number of father modules up to a root module).
+            Modules in the same level don't depend on each other, and modules without father or children in the plan are independent.
+            Returns a dictionary with modules, levels and independentList keys.
+        """
+        planDic = {"modules" : {}, "levels" : [], "independentList" : []}
+        moduleGrpSet = set(moduleGrpList)
+        for moduleGrp in moduleGrpList:
+            fatherGuide = ""
+            if moduleGrp in hookDic:
+                fatherGuide = hookDic[moduleGrp]["fatherGuide"]
+            if not fatherGuide in moduleGrpSet:
+                fatherGuide = ""
+            planDic["modules"][moduleGrp] = {"father" : fatherGuide, "children" : [], "level" : 0}
+        for moduleGrp in moduleGrpList:
+            fatherGuide = planDic["modules"][moduleGrp]["father"]
+            if fatherGuide:
+                planDic["modules"][fatherGuide]["children"].append(moduleGrp)
+        for moduleGrp in moduleGrpList:
+            level = 0
+            fatherGuide = planDic["modules"][moduleGrp]["father"]
+            while fatherGuide and level < len(moduleGrpList):
+                level += 1
+                fatherGuide = planDic["modules"][fatherGuide]["father"]
+            planDic["modules"][moduleGrp]["level"] = level
+            while len(planDic["levels"]) <= level:
+                planDic["levels"].append([])
+            planDic["levels"][level].append(moduleGrp)
+            if not planDic["modules"][moduleGrp]["father"] and not planDic["modules"][moduleGrp]["children"]:
+                planDic["independentList"].append(moduleGrp)
+        return planDic
+
+
+    def getDirtyModuleList(self, buildHashDic, previousHashDic, planDic, *args):
+        """ Compare the guide hashes of this build with the previous build hashes.
+            Returns the list of modules to rebuild: the changed ones, their children and their fathers in the build plan.
+            The fathers are rebuilt too because the integration reads their data and changes their rig to receive the children.
+        """
+        dirtyList = [m for m in buildHashDic.keys() if previousHashDic.get(m) != buildHashDic[m]]
+        toVisitList = list(dirtyList)
+        while toVisitList:
+            moduleGrp = toVisitList.pop()
+            if moduleGrp in planDic["modules"]:
+                peerList = list(planDic["modules"][moduleGrp]["children"])
+                if planDic["modules"][moduleGrp]["father"]:
+                    peerList.append(planDic["modules"][moduleGrp]["father"])
+                for peer in peerList:
+                    if not peer in dirtyList:
+                        dirtyList.append(peer)
+                        toVisitList.append(peer)
+        return dirtyList
+
+
     def distanceBet(self, a, b, name="temp_DistBet", keep=False):
         """ Creates a distance between node for 2 objects a and b.
             Keeps them in the scene or delete.
@@ -862,13 +946,10 @@ class Utils(object):
                     needRestoreSuffix = True
                     nodeName = nodeName[:nodeName.rfind("_")]
             # find numering:
-            i = 1
             if not needRestoreSuffix:
-                while cmds.objExists(nodeName+str(i)):
-                    i += 1
+                i = self.dpUIinst.nameRegistry.getFreeNumber(nodeName)
             else:
-                while cmds.objExists(nodeName+str(i)+"_"+suffix):
-                    i += 1
+                i = self.dpUIinst.nameRegistry.getFreeNumber(nodeName, "_"+suffix)
             # add number:
             nodeName = nodeName+str(i)
             if needRestoreSuffix:
@@ -925,15 +1006,11 @@ class Utils(object):
 
     def getAllGrp(self, masterAttr=None, *args):
         """ Return the All_Grp if it exists in the scene.
+            It uses the scene lookup by attribute.
         """
         if not masterAttr:
             masterAttr = self.dpUIinst.masterAttr
-        allTransformList = cmds.ls(selection=False, type="transform")
-        if allTransformList:
-            for transform in allTransformList:
-                if cmds.objExists(transform+"."+masterAttr):
-                    if cmds.getAttr(transform+"."+masterAttr) == 1:
-                        return transform #All_Grp found
+        return self.dpUIinst.sceneLookup.getAllGrp(masterAttr)
 
 
     def validateMasterGrp(self, nodeGrp, *args):
@@ -961,10 +1038,7 @@ class Utils(object):
         if not node:
             node = self.getAllGrp()
         if node:
-            if cmds.objExists(node+"."+attrName):
-                foundNodeList = cmds.listConnections(node+"."+attrName, source=True, destination=False)
-                if foundNodeList:
-                    result = foundNodeList[0]
+            result = self.dpUIinst.sceneLookup.getNodeByMessage(attrName, node)
         return result
 
 
@@ -983,7 +1057,7 @@ class Utils(object):
     def profiler(func):
         DPAR_PROFILE_MODE = False
         def runProfile(*args, **kwargs):
-            if DPAR_PROFILE_MODE:
+            if DPAR_PROFILE_MODE or os.environ.get("DPAR_PROFILE_MODE") == "2":
                 pProf = cProfile.Profile()
                 try:
                     pProf.enable()
@@ -997,6 +1071,118 @@ class Utils(object):
                 return pResult
         return runProfile
 
+    def getProfileMode(self, *args):
+        """ Returns the action profile mode from the DPAR_PROFILE_MODE environment variable.
+            -1 = don't write the build report.
+            0 = wall time and node count only (default).
+            1 = also count Maya commands and get the peak of Python memory, running cProfile and tracemalloc.
+            2 = deep mode, also keep the cProfile statistics of the most expensive functions.
+        """
+        try:
+            return int(os.environ.get("DPAR_PROFILE_MODE", 0))
+        except ValueError:
+            return 0
+
+
+    def startActionProfile(self, deep=False, *args):
+        """ Start to measure an action and return the profile state to be given to stopActionProfile.
+        """
+        mode = self.getProfileMode()
+        if deep:
+            mode = 2
+        profileState = {"mode" : mode, "nodes" : len(cmds.ls()), "cProfile" : None, "tracemalloc" : False}
+        if mode > 0:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                profileState["tracemalloc"] = True
+            elif hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            profileState["cProfile"] = cProfile.Profile()
+            profileState["cProfile"].enable()
+        profileState["start"] = time.perf_counter()
+        return profileState
+
+
+    def stopActionProfile(self, profileState, *args):
+        """ Stop the given profile state and return the measured data dictionary.
+        """
+        wallTime = time.perf_counter()-profileState["start"]
+        profileDic = {"mode" : profileState["mode"], "time" : round(wallTime, 4), "nodesBefore" : profileState["nodes"], "nodesAfter" : len(cmds.ls())}
+        profileDic["nodesDelta"] = profileDic["nodesAfter"]-profileDic["nodesBefore"]
+        if profileState["cProfile"]:
+            profileState["cProfile"].disable()
+            profileDic["peakMemoryMB"] = round(tracemalloc.get_traced_memory()[1]/1048576.0, 3)
+            if profileState["tracemalloc"]:
+                tracemalloc.stop()
+            commandDic = {}
+            statList = []
+            for funcKey, funcStat in pstats.Stats(profileState["cProfile"]).stats.items():
+                commandName = self.getProfiledCommandName(funcKey)
+                if commandName:
+                    commandDic[commandName] = commandDic.get(commandName, 0)+funcStat[1]
+                statList.append([pstats.func_std_string(funcKey), funcStat[1], round(funcStat[2], 4), round(funcStat[3], 4)])
+            profileDic["commands"] = sum(commandDic.values())
+            profileDic["commandDic"] = commandDic
+            if profileState["mode"] > 1:
+                statList.sort(key=lambda x: x[3], reverse=True)
+                profileDic["deepStats"] = statList[:30]
+        return profileDic
+
+
+    def getProfiledCommandName(self, funcKey, *args):
+        """ Returns the Maya command name if the given cProfile function key is a maya.cmds call, or None.
+        """
+        if funcKey[0] == "~" and funcKey[2].startswith("<built-in method "):
+            fullName = funcKey[2][17:-1]
+            if fullName.startswith("maya.cmds."):
+                return fullName[10:]
+            if not "." in fullName and not " " in fullName and hasattr(cmds, fullName) and not hasattr(builtins, fullName):
+                return fullName
+
+
+    def getLogFolder(self, path=None, subFolder=None, *args):
+        """ Returns the folder used to write the dpLog files of the given or current scene path.
+        """
+        if not path:
+            path = cmds.file(query=True, sceneName=True)
+        if path:
+            dpFolder = path[:path.rfind("/")]
+            if subFolder:
+                dpFolder = dpFolder+"/"+subFolder
+            return dpFolder
+
+
+    def compareProfileLog(self, profileDic, path=None, subFolder=None, threshold=1.2, verbose=True, *args):
+        """ Find the latest dpLog file with profile data of the same action type and mode to compare the action times.
+            An action is flagged as a regression when it takes more than threshold times the previous run and at least one second more.
+            Returns the comparison dictionary or None if there isn't a previous log to compare.
+        """
+        dpFolder = self.getLogFolder(path, subFolder)
+        if not dpFolder or not os.path.exists(dpFolder):
+            return
+        logList = [f for f in next(os.walk(dpFolder))[2] if f.startswith("dpLog_") and f.endswith(".json")]
+        logList.sort(key=lambda f: os.path.getmtime(dpFolder+"/"+f), reverse=True)
+        for logFile in logList:
+            try:
+                with open(dpFolder+"/"+logFile, "r", encoding="utf-8") as jsonFile:
+                    previousDic = json.load(jsonFile).get("dpProfile")
+            except:
+                continue
+            if previousDic and previousDic.get("actionType") == profileDic["actionType"] and previousDic.get("firstMode") == profileDic["firstMode"]:
+                compareDic = {"previousLog" : logFile, "previousTime" : previousDic["time"], "time" : profileDic["time"], "actions" : {}, "regressionList" : []}
+                for actionName, actionDic in profileDic["actions"].items():
+                    if actionName in previousDic["actions"].keys():
+                        previousTime = previousDic["actions"][actionName]["time"]
+                        compareDic["actions"][actionName] = {"time" : actionDic["time"], "previousTime" : previousTime, "delta" : round(actionDic["time"]-previousTime, 4)}
+                        if actionDic["time"] > previousTime*threshold and actionDic["time"]-previousTime >= 1.0:
+                            compareDic["regressionList"].append(actionName)
+                if verbose:
+                    print("dpProfile: "+str(profileDic["time"])+"s, previous "+logFile+": "+str(previousDic["time"])+"s")
+                    for actionName in compareDic["regressionList"]:
+                        print("dpProfile regression: "+actionName+" "+str(compareDic["actions"][actionName]["previousTime"])+"s -> "+str(compareDic["actions"][actionName]["time"])+"s")
+                return compareDic
+
+
     '''
     Open Maya Utils Functions
     '''
@@ -1024,15 +1210,9 @@ class Utils(object):
         """
         name = name[0].upper()+name[1:].replace(" ", "_")
         baseName = name
-        name = name+"_00_"+suffix
-        if cmds.objExists(name):
-            i = 1
-            while cmds.objExists(name):
-                name = baseName+"_"+str(i).zfill(2)+"_"+suffix
-                i = i+1
-            baseName = baseName+"_"+str(i-1).zfill(2)
-        else:
-            baseName = baseName+"_00"
+        i = self.dpUIinst.nameRegistry.getFreeNumber(baseName+"_", "_"+suffix, start=0, pad=2)
+        baseName = baseName+"_"+str(i).zfill(2)
+        name = baseName+"_"+suffix
         return baseName, name
 
 
@@ -1115,9 +1295,7 @@ class Utils(object):
         if not path:
             path = cmds.file(query=True, sceneName=True)
         if path:
-            dpFolder = path[:path.rfind("/")]
-            if subFolder:
-                dpFolder = dpFolder+"/"+subFolder
+            dpFolder = self.getLogFolder(path, subFolder)
             if not os.path.exists(dpFolder):
                 os.makedirs(dpFolder)
             if not name:
@@ -1286,70 +1464,90 @@ class Utils(object):
 
     def getNetworkNodeByAttr(self, netAttr, *args):
         """ Returns a list of network nodes with the boolean given net attribute active.
+            It uses the scene lookup by attribute.
         """
-        netList = []
-        allNetList = cmds.ls(selection=False, type="network")
-        if allNetList:
-            for item in allNetList:
-                if cmds.objExists(item+".dpNetwork"):
-                    if cmds.getAttr(item+".dpNetwork") == 1:
-                        if cmds.objExists(item+"."+netAttr):
-                            if cmds.getAttr(item+"."+netAttr) == 1:
-                                netList.append(item)
-        return netList
+        return self.dpUIinst.sceneLookup.getNetworkNodeByAttr(netAttr)
 
 
     def filterTransformList(self, itemList=None, filterCamera=True, filterConstraint=True, filterFollicle=True, filterJoint=True, filterLocator=True, filterHandle=True, filterLinearDeform=True, filterEffector=True, filterBaseNode=True, filterBaseName=True, filterLattice=True, verbose=True, title="Rigging", *args):
         """ Remove camera, constraints, follicles, etc from the given list and return it.
+            It reads the node types and children types in bulk and classify the items by a set lookup.
+            The scene dag data is only read when the scene index is active for this run, otherwise just the given items are read.
         """
         if itemList:
-            cameraList = ["|persp", "|top", "|side", "|front"]
-            constraintList = ["parentConstraint", "pointConstraint", "orientConstraint", "scaleConstraint", "aimConstraint", "poleVectorConstraint"]
-            toRemoveList = []
-            for item in itemList:
-                if verbose:
-                    self.setProgress(title)
-                itemType = cmds.objectType(item)
-                if filterCamera:
-                    for cameraName in cameraList:
-                        if item.endswith(cameraName):
-                            toRemoveList.append(item)
-                if filterConstraint:
-                    if itemType in constraintList:
-                        toRemoveList.append(item)
-                if filterFollicle:
-                    if cmds.listRelatives(item, children=True, type="follicle"):
-                        toRemoveList.append(item)
-                if filterJoint:
-                    if cmds.listRelatives(item, children=True, type="joint") or itemType == "joint":
-                        toRemoveList.append(item)
-                if filterLocator:
-                    if cmds.listRelatives(item, children=True, type="locator"):
-                        toRemoveList.append(item)
-                if filterHandle:
-                    if cmds.listRelatives(item, children=True, type="ikHandle") or itemType == "ikHandle":
-                        toRemoveList.append(item)
-                    if cmds.listRelatives(item, children=True, type="clusterHandle") or itemType == "clusterHandle":
-                        toRemoveList.append(item)
-                if filterLinearDeform:
-                    for defName in ["deformBend", "deformTwist", "deformSquash", "deformFlare", "deformSine", "deformWave"]:
-                        if cmds.listRelatives(item, children=True, type=defName) or itemType == defName:
-                            toRemoveList.append(item)
-                if filterEffector:
-                    if cmds.listRelatives(item, children=True, type="ikEffector") or itemType == "ikEffector":
-                        toRemoveList.append(item)
-                if filterBaseNode:
-                    if item in self.baseNodeList:
-                        toRemoveList.append(item)
-                if filterBaseName:
-                    if self.getSuffixNumberList(item)[1].endswith("Base"):
-                        toRemoveList.append(item)
-                if filterLattice:
-                    for defName in ["lattice", "baseLattice"]:
-                        if cmds.listRelatives(item, children=True, type=defName) or itemType == defName:
-                            toRemoveList.append(item)
-            if toRemoveList:
-                itemList = list(set(itemList) - set(toRemoveList))
+            cameraList = ("|persp", "|top", "|side", "|front")
+            # node types to remove by filter as [typeList, checkItemType, checkChildrenType]
+            filterTypeList = []
+            if filterConstraint:
+                filterTypeList.append([["parentConstraint", "pointConstraint", "orientConstraint", "scaleConstraint", "aimConstraint", "poleVectorConstraint"], True, False])
+            if filterFollicle:
+                filterTypeList.append([["follicle"], False, True])
+            if filterJoint:
+                filterTypeList.append([["joint"], True, True])
+            if filterLocator:
+                filterTypeList.append([["locator"], False, True])
+            if filterHandle:
+                filterTypeList.append([["ikHandle", "clusterHandle"], True, True])
+            if filterLinearDeform:
+                filterTypeList.append([["deformBend", "deformTwist", "deformSquash", "deformFlare", "deformSine", "deformWave"], True, True])
+            if filterEffector:
+                filterTypeList.append([["ikEffector"], True, True])
+            if filterLattice:
+                filterTypeList.append([["lattice", "baseLattice"], True, True])
+            itemTypeSet, childTypeSet = set(), set()
+            for typeList, checkItemType, checkChildrenType in filterTypeList:
+                if checkItemType:
+                    itemTypeSet.update(typeList)
+                if checkChildrenType:
+                    childTypeSet.update(typeList)
+            # bulk dag data
+            if self.dpUIinst.sceneIndex.isActive():
+                dagIndexDic = self.dpUIinst.sceneIndex.getDagIndex()
+            else:
+                dagIndexDic = self.dpUIinst.sceneIndex.getDagData(list(set(itemList)))
+            typeDic, childTypeDic, shortNameDic = dagIndexDic["typeDic"], dagIndexDic["childTypeDic"], dagIndexDic["shortNameDic"]
+            inheritedDic = {}
+            if verbose:
+                self.setProgress(title)
+            toRemoveSet = set()
+            for item in set(itemList):
+                if filterCamera and item.endswith(cameraList):
+                    toRemoveSet.add(item)
+                    continue
+                if filterBaseNode and item in self.baseNodeList:
+                    toRemoveSet.add(item)
+                    continue
+                if filterBaseName and self.getSuffixNumberList(item)[1].endswith("Base"):
+                    toRemoveSet.add(item)
+                    continue
+                longName = item
+                if not item in typeDic:
+                    longNameList = shortNameDic.get(item, [])
+                    if len(longNameList) == 1:
+                        longName = longNameList[0]
+                    else:
+                        longNameList = cmds.ls(item, long=True)
+                        if longNameList:
+                            longName = longNameList[0]
+                if longName in typeDic:
+                    itemType = typeDic[longName]
+                    itemChildTypeList = childTypeDic.get(longName, [])
+                else:
+                    # not indexed node, like a new one or a not dag node
+                    itemType = cmds.objectType(item)
+                    itemChildTypeList = [cmds.objectType(c) for c in cmds.listRelatives(item, children=True, fullPath=True) or []]
+                if itemType in itemTypeSet:
+                    toRemoveSet.add(item)
+                    continue
+                for childType in itemChildTypeList:
+                    # listRelatives type flag also accepts the derived types
+                    if not childType in inheritedDic:
+                        inheritedDic[childType] = set(cmds.nodeType(childType, inherited=True, isTypeName=True) or [childType])
+                    if inheritedDic[childType] & childTypeSet:
+                        toRemoveSet.add(item)
+                        break
+            if toRemoveSet:
+                itemList = list(set(itemList) - toRemoveSet)
         return itemList
 
 
@@ -1448,6 +1646,8 @@ class Utils(object):
                 True if the progressWindow is running
                 False if the progressWindow was ended or cancelled
         """
+        if self.dpUIinst.headless:
+            return False
         if endIt:
             cmds.progressWindow(endProgress=True)
             self.progress = False
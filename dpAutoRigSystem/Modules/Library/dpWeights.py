@@ -2,7 +2,7 @@
 from maya import cmds
 from maya import mel
 
-DP_WEIGTHS_VERSION = 1.00
+DP_WEIGTHS_VERSION = 1.01
 
 
 class Weights(object):
@@ -62,18 +62,31 @@ class Weights(object):
         weightPlug = deformerNode+".weightList["+str(idx)+"].weights"
         if cmds.objExists(weightPlug):
             weightKeyList = cmds.getAttr(weightPlug, multiIndices=True)
-            if infList:
-                matrixList = []
-                for item in weightKeyList:
-                    sourceList = cmds.listConnections(deformerNode+".matrix["+str(item)+"]", source=True, destination=False)
-                    if sourceList:
-                        matrixList.append(sourceList[0])
-                weightKeyList = matrixList
             if weightKeyList:
-                for weightIndex in weightKeyList:
-                    valueList = cmds.getAttr(weightPlug)[0]
-                    #if any(x != 1.0 for x in valueList):
+                valueList = self.getArrayValueList(weightPlug, weightKeyList)
+                if infList:
+                    matrixList = []
+                    for item in weightKeyList:
+                        sourceList = cmds.listConnections(deformerNode+".matrix["+str(item)+"]", source=True, destination=False)
+                        if sourceList:
+                            matrixList.append(sourceList[0])
+                    weightKeyList = matrixList
+                if weightKeyList:
                     return dict(zip(weightKeyList, valueList))
+
+
+    def getArrayValueList(self, arrayPlug, indexList, *args):
+        """ Returns the values of the existing elements of the given array plug, read all together by one getAttr.
+        """
+        valueList = cmds.getAttr(arrayPlug)
+        if isinstance(valueList, list):
+            if valueList and isinstance(valueList[0], tuple):
+                valueList = list(valueList[0]) #array plug values come as [(v0, v1, ...)]
+        else:
+            valueList = [valueList]
+        if not len(valueList) == len(indexList):
+            valueList = [cmds.getAttr(arrayPlug+"["+str(i)+"]") for i in indexList]
+        return valueList
     
 
     def unlockJoints(self, skinCluster, *args):
@@ -153,6 +166,19 @@ class Weights(object):
         return result
 
 
+    def getDeformerTypeDic(self, nodeList, *args):
+        """ Find the deformers of the known types in the given node list with one typed query.
+            Returns a dictionary with the deformer types as keys, in the typeAttrDic order, and their node lists as values.
+        """
+        deformerTypeDic, foundSet = {}, set()
+        typeList = cmds.ls(nodeList, type=list(self.typeAttrDic.keys()), showType=True) or []
+        for deformerNode, deformerType in zip(typeList[0::2], typeList[1::2]):
+            if not deformerNode in foundSet:
+                foundSet.add(deformerNode)
+                deformerTypeDic.setdefault(deformerType, []).append(deformerNode)
+        return dict((deformerType, deformerTypeDic[deformerType]) for deformerType in self.typeAttrDic.keys() if deformerType in deformerTypeDic.keys())
+
+
     def getDeformerInfo(self, deformerNode, *args):
         """ Return the dictionary with attributes and values.
         """
@@ -391,9 +417,16 @@ class Weights(object):
 
     def setDeformerWeights(self, deformerNode, weightsDic, idx=0, *args):
         """ Set the deformer weights to the given node for the indexed shape.
+            Sequential vertices are set together by one setAttr in the weight array range.
         """
-        for vtx in weightsDic.keys():
-            cmds.setAttr(deformerNode+".weightList["+str(idx)+"].weights["+str(vtx)+"]", weightsDic[vtx])
+        weightPlug = deformerNode+".weightList["+str(idx)+"].weights"
+        vtxList = sorted(weightsDic.keys(), key=int)
+        start = 0
+        for v in range(1, len(vtxList)+1):
+            if v == len(vtxList) or not int(vtxList[v]) == int(vtxList[v-1])+1:
+                valueList = [weightsDic[vtx] for vtx in vtxList[start:v]]
+                cmds.setAttr(weightPlug+"["+str(vtxList[start])+":"+str(vtxList[v-1])+"]", *valueList, size=len(valueList))
+                start = v
 
 
     def getLatticePoints(self, latticeNode, *args):
@@ -9,7 +9,7 @@ DESCRIPTION = "r046_connectionIODesc"
 ICON = "/Icons/dp_connectionIO.png"
 WIKI = "10-‐-Rebuilder#-connection"
 
-DP_CONNECTIONIO_VERSION = 1.01
+DP_CONNECTIONIO_VERSION = 1.02
 
 
 class ConnectionIO(dpBaseAction.ActionStartClass):
@@ -24,6 +24,8 @@ class ConnectionIO(dpBaseAction.ActionStartClass):
         self.setActionType("r000_rebuilder")
         self.ioDir = "s_connectionIO"
         self.startName = "dpConnection"
+        self.snapshotDic = None
+        self.snapshotBatchSize = 1000
     
 
     def runAction(self, firstMode=True, objList=None, *args):
@@ -53,8 +55,11 @@ class ConnectionIO(dpBaseAction.ActionStartClass):
                         ctrlList = self.dpUIinst.ctrls.getControlList()
                     if ctrlList:
                         if self.firstMode: #export
+                            utilityList = cmds.ls(selection=False, type=self.utils.utilityTypeList)
+                            self.takeConnectionSnapshot(list(ctrlList)+utilityList)
                             toExportDataDic = self.getConnectionDataDic(ctrlList)
-                            toExportDataDic.update(self.getUtilitiesDataDic(cmds.ls(selection=False, type=self.utils.utilityTypeList))) #utilityNodes without dpID
+                            toExportDataDic.update(self.getUtilitiesDataDic(utilityList)) #utilityNodes without dpID
+                            self.snapshotDic = None
                             self.exportDicToJsonFile(toExportDataDic)
                         else: #import
                             connectDic = self.importLatestJsonFile(self.getExportedList())
@@ -96,9 +101,8 @@ class ConnectionIO(dpBaseAction.ActionStartClass):
                     attrList.extend(userDefList)
                 connectedAttrList = []
                 for attr in attrList:
-                    if cmds.objExists(item+"."+attr):
-                        if cmds.listConnections(item+"."+attr):
-                            connectedAttrList.append(attr)
+                    if self.hasConnection(item, attr):
+                        connectedAttrList.append(attr)
                 if connectedAttrList:
                     dic[item] = {}
                     for attr in connectedAttrList:
@@ -110,32 +114,170 @@ class ConnectionIO(dpBaseAction.ActionStartClass):
         """ Return a list of plugged nodes and their attributes of the given item.
         """
         resultList = []
-        if cmds.listConnections(item, plugs=True, source=sourceConnection, destination=destinationConnection):
+        infoList = self.getSnapshotConnectionList(item, sourceConnection, destinationConnection)
+        if infoList == None:
             infoList = cmds.listConnections(item, plugs=True, source=sourceConnection, destination=destinationConnection)
-            if infoList:
-                for info in infoList:
-                    if cmds.objectType(info[:info.find(".")]) == "unitConversion":
-                        if sourceConnection:
-                            connectionInfo = self.getConnectionInfoList(info[:info.find(".")]+".input", sourceConnection, destinationConnection) or [None]
-                            resultList.append({info : connectionInfo})
-                        else:
-                            connectionInfo = self.getConnectionInfoList(info[:info.find(".")]+".output", sourceConnection, destinationConnection) or [None]
-                            resultList.append({info : connectionInfo})
-                        resultList[-1][list(resultList[-1].keys())[0]].append(cmds.getAttr(info[:info.find(".")]+".conversionFactor"))
+        if infoList:
+            for info in infoList:
+                if self.isUnitConversion(info[:info.find(".")]):
+                    if sourceConnection:
+                        connectionInfo = self.getConnectionInfoList(info[:info.find(".")]+".input", sourceConnection, destinationConnection) or [None]
+                        resultList.append({info : connectionInfo})
                     else:
-                        resultList.append(info)
+                        connectionInfo = self.getConnectionInfoList(info[:info.find(".")]+".output", sourceConnection, destinationConnection) or [None]
+                        resultList.append({info : connectionInfo})
+                    resultList[-1][list(resultList[-1].keys())[0]].append(self.getConversionFactor(info[:info.find(".")]))
+                else:
+                    resultList.append(info)
         return resultList
 
 
+    def takeConnectionSnapshot(self, nodeList, *args):
+        """ Read all connections of the given nodes with one listConnections query by direction for each batch of nodes.
+            The found unitConversion nodes are read too, so their chains are resolved from this snapshot without querying the scene again.
+            The connected plugs are stored by node and attribute, also by their parent multi or compound attributes,
+            to give the same plug list of a listConnections query in the given node attribute.
+        """
+        self.snapshotDic = {"in" : {}, "out" : {}, "nodeSet" : set(), "remoteSet" : set(), "typeDic" : {}, "parentDic" : {}, "factorDic" : {}}
+        toReadList = [node for node in dict.fromkeys(nodeList) if cmds.objExists(node)]
+        while toReadList:
+            remoteNodeSet = set()
+            # dag paths can be listed by Maya with other names, so they are read one by one to keep the given names
+            pathList = [node for node in toReadList if "|" in node]
+            nameList = [node for node in toReadList if not "|" in node]
+            batchList = [nameList[b:b+self.snapshotBatchSize] for b in range(0, len(nameList), self.snapshotBatchSize)]
+            batchList.extend([[node] for node in pathList])
+            for batch in batchList:
+                typeList = cmds.ls(batch, showType=True) or []
+                self.snapshotDic["typeDic"].update(zip(typeList[0::2], typeList[1::2]))
+                for io, sourceConnection in zip(["in", "out"], [True, False]):
+                    pairList = cmds.listConnections(batch, connections=True, plugs=True, source=sourceConnection, destination=not sourceConnection) or []
+                    for localPlug, remotePlug in zip(pairList[0::2], pairList[1::2]):
+                        node = localPlug[:localPlug.find(".")]
+                        if len(batch) == 1:
+                            node = batch[0]
+                        for key in self.getPlugKeyList(node, localPlug[localPlug.find(".")+1:]):
+                            self.snapshotDic[io].setdefault(node, {}).setdefault(key, []).append(remotePlug)
+                        remoteNodeSet.add(remotePlug[:remotePlug.find(".")])
+                self.snapshotDic["nodeSet"].update(batch)
+            # read the unitConversion nodes of the found connections:
+            toReadList = []
+            remoteNodeList = list(remoteNodeSet - self.snapshotDic["nodeSet"] - self.snapshotDic["remoteSet"])
+            self.snapshotDic["remoteSet"].update(remoteNodeList)
+            if remoteNodeList:
+                toReadList = [node for node in cmds.ls(remoteNodeList, type="unitConversion") or [] if not node in self.snapshotDic["nodeSet"]]
+
+
+    def getPlugKeyList(self, node, attr, *args):
+        """ Returns the given attribute name and the names of its parent attributes, with and without multi indices.
+        """
+        keyList = [attr]
+        partList = attr.split(".")
+        for p, part in enumerate(partList):
+            if p < len(partList)-1:
+                keyList.append(".".join(partList[:p+1]))
+            if part.endswith("]"):
+                keyList.append(".".join(partList[:p]+[part[:part.find("[")]]))
+        # compound parents are named only by their children in the connected plug:
+        leafName = partList[-1]
+        if "[" in leafName:
+            leafName = leafName[:leafName.find("[")]
+        upperName = None
+        if len(partList) > 1:
+            upperName = partList[-2]
+            if "[" in upperName:
+                upperName = upperName[:upperName.find("[")]
+        parentName = self.getAttrParent(node, leafName)
+        while parentName and not parentName == upperName:
+            keyList.append(".".join(partList[:-1]+[parentName]))
+            parentName = self.getAttrParent(node, parentName)
+        return list(dict.fromkeys(keyList))
+
+
+    def getAttrParent(self, node, attr, *args):
+        """ Returns the parent compound attribute name of the given attribute or None.
+            Static attributes are queried once by node type.
+        """
+        nodeType = self.getNodeType(node)
+        if (nodeType, attr) in self.snapshotDic["parentDic"].keys():
+            return self.snapshotDic["parentDic"][(nodeType, attr)]
+        try:
+            parentList = cmds.attributeQuery(attr, type=nodeType, listParent=True)
+            self.snapshotDic["parentDic"][(nodeType, attr)] = parentList[0] if parentList else None
+            return self.snapshotDic["parentDic"][(nodeType, attr)]
+        except:
+            # dynamic attribute
+            try:
+                parentList = cmds.attributeQuery(attr, node=node, listParent=True)
+                if parentList:
+                    return parentList[0]
+            except:
+                pass
+        return None
+
+
+    def getNodeType(self, node, *args):
+        """ Returns the node type from the snapshot or querying it.
+        """
+        if self.snapshotDic and node in self.snapshotDic["typeDic"].keys():
+            return self.snapshotDic["typeDic"][node]
+        return cmds.objectType(node)
+
+
+    def isUnitConversion(self, node, *args):
+        """ Returns True if the given node is an unitConversion.
+            The snapshot already read all the connected unitConversion nodes.
+        """
+        if self.snapshotDic:
+            if node in self.snapshotDic["nodeSet"]:
+                return self.snapshotDic["typeDic"].get(node) == "unitConversion"
+            if node in self.snapshotDic["remoteSet"]:
+                return False
+        return cmds.objectType(node) == "unitConversion"
+
+
+    def getConversionFactor(self, uc, *args):
+        """ Returns the conversionFactor value of the given unitConversion node, reading it once for the snapshot.
+        """
+        if self.snapshotDic:
+            if not uc in self.snapshotDic["factorDic"].keys():
+                self.snapshotDic["factorDic"][uc] = cmds.getAttr(uc+".conversionFactor")
+            return self.snapshotDic["factorDic"][uc]
+        return cmds.getAttr(uc+".conversionFactor")
+
+
+    def getSnapshotConnectionList(self, plug, sourceConnection, destinationConnection, *args):
+        """ Returns the connected plug list of the given plug from the snapshot.
+            Returns None if the node wasn't read by the snapshot, so it must be queried.
+        """
+        if self.snapshotDic and not sourceConnection == destinationConnection:
+            node = plug[:plug.find(".")]
+            if node in self.snapshotDic["nodeSet"]:
+                io = "in" if sourceConnection else "out"
+                return list(self.snapshotDic[io].get(node, {}).get(plug[plug.find(".")+1:], []))
+        return None
+
+
+    def hasConnection(self, item, attr, *args):
+        """ Returns True if the given node attribute has any input or output connection.
+        """
+        if self.snapshotDic and item in self.snapshotDic["nodeSet"]:
+            return attr in self.snapshotDic["in"].get(item, {}).keys() or attr in self.snapshotDic["out"].get(item, {}).keys()
+        if cmds.objExists(item+"."+attr):
+            if cmds.listConnections(item+"."+attr):
+                return True
+        return False
+
+
     def getAttrConnections(self, item, attrDic, multi=False, *args):
         """ Return a dictionary with the connections for the attributes.
         """
         dic = {}
-        nodeType = cmds.objectType(item)
+        nodeType = self.getNodeType(item)
         if nodeType in attrDic.keys():
             connectedAttrList = []
             for attr in attrDic[nodeType]:
-                if cmds.listConnections(item+"."+attr):
+                if self.hasConnection(item, attr):
                     connectedAttrList.append(attr)
             if connectedAttrList:
                 for attr in connectedAttrList:
@@ -1,5 +1,6 @@
 # importing libraries:
 from maya import cmds
+import os
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -9,7 +10,7 @@ DESCRIPTION = "r015_controlShapeIODesc"
 ICON = "/Icons/dp_controlShapeIO.png"
 WIKI = "10-‐-Rebuilder#-controller-shape"
 
-DP_CONTROLSHAPEIO_VERSION = 1.01
+DP_CONTROLSHAPEIO_VERSION = 1.02
 
 
 class ControlShapeIO(dpBaseAction.ActionStartClass):
@@ -24,6 +25,7 @@ class ControlShapeIO(dpBaseAction.ActionStartClass):
         self.setActionType("r000_rebuilder")
         self.ioDir = "s_controlShapeIO"
         self.startName = "dpControlShape"
+        self.shapeAttrList = ["overrideEnabled", "overrideRGBColors", "overrideColor", "overrideColorRGB", "lineWidth"]
     
 
     def runAction(self, firstMode=True, objList=None, *args):
@@ -57,7 +59,15 @@ class ControlShapeIO(dpBaseAction.ActionStartClass):
                             try:
                                 self.pipeliner.makeDirIfNotExists(self.ioPath)
                                 ctrlFileName = self.ioPath+"/"+self.startName+"_"+self.pipeliner.pipeData['currentFileName']+".ma"
-                                self.dpUIinst.ctrls.exportShape(ctrlList, ctrlFileName, ui=False, verbose=True)
+                                # only save a pointer to the latest exported file if the control shapes didn't change
+                                dataHash = self.getGeometryDataHash(ctrlList, attr=False, curve=True, worldSpace=False, descendents=False, shapeAttrList=self.shapeAttrList)
+                                sameDataFile = self.pipeliner.findSameDataFile(ctrlFileName, self.startName+"_", dataHash)
+                                if sameDataFile:
+                                    if not sameDataFile == os.path.basename(ctrlFileName):
+                                        self.pipeliner.saveDataPointer(ctrlFileName, sameDataFile, dataHash)
+                                else:
+                                    self.dpUIinst.ctrls.exportShape(ctrlList, ctrlFileName, ui=False, verbose=True)
+                                    self.pipeliner.recordDataHash(ctrlFileName, dataHash)
                                 self.wellDoneIO(ctrlFileName)
                             except Exception as e:
                                 self.notWorkedWellIO(', '.join(ctrlList)+": "+str(e))
@@ -66,7 +76,7 @@ class ControlShapeIO(dpBaseAction.ActionStartClass):
                             if exportedList:
                                 try:
                                     exportedList.sort()
-                                    ctrlsToImport = self.ioPath+"/"+exportedList[-1]
+                                    ctrlsToImport = self.pipeliner.resolveDataPointer(self.ioPath+"/"+exportedList[-1])
                                     self.dpUIinst.ctrls.importShape(ctrlList, ctrlsToImport, ui=False, verbose=True)
                                     self.wellDoneIO(exportedList[-1])
                                 except Exception as e:
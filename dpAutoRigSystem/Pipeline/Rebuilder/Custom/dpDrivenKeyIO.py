@@ -1,5 +1,7 @@
 # importing libraries:
 from maya import cmds
+from maya.api import OpenMaya
+from maya.api import OpenMayaAnim
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -9,7 +11,7 @@ DESCRIPTION = "r053_drivenKeyIODesc"
 ICON = "/Icons/dp_drivenKeyIO.png"
 WIKI = "10-‐-Rebuilder#-driven-key"
 
-DP_DRIVENKEYIO_VERSION = 1.01
+DP_DRIVENKEYIO_VERSION = 1.04
 
 
 class DrivenKeyIO(dpBaseAction.ActionStartClass):
@@ -25,6 +27,10 @@ class DrivenKeyIO(dpBaseAction.ActionStartClass):
         self.ioDir = "s_drivenKeyIO"
         self.startName = "dpDrivenKey"
         self.drivenKeyTypeList = ["animCurveUA", "animCurveUL", "animCurveUT", "animCurveUU"]
+        self.tangentTypeDic = {}
+        for tangentName, tangentAttr in zip(["global", "fixed", "linear", "flat", "spline", "step", "slow", "fast", "clamped", "plateau", "stepnext", "auto"], ["kTangentGlobal", "kTangentFixed", "kTangentLinear", "kTangentFlat", "kTangentSmooth", "kTangentStep", "kTangentSlow", "kTangentFast", "kTangentClamped", "kTangentPlateau", "kTangentStepNext", "kTangentAuto"]):
+            if hasattr(OpenMayaAnim.MFnAnimCurve, tangentAttr):
+                self.tangentTypeDic[tangentName] = getattr(OpenMayaAnim.MFnAnimCurve, tangentAttr)
 
 
     def runAction(self, firstMode=True, objList=None, *args):
@@ -86,28 +92,13 @@ class DrivenKeyIO(dpBaseAction.ActionStartClass):
         """
         dic = {}
         attrList = ["preInfinity", "postInfinity", "useCurveColor", "stipplePattern", "outStippleThreshold", "stippleReverse"]
-        keyAttrList = ["keyBreakdown", "keyTickDrawSpecial"]
-        keyTimeAttrList = ["keyTime", "keyValue"]
         self.utils.setProgress(max=len(nodeList), addOne=False, addNumber=False)
         for item in nodeList:
             self.utils.setProgress(self.dpUIinst.lang[self.title])
             if not cmds.attributeQuery(self.dpID, node=item, exists=True) or not self.utils.validateID(item):
                 # getting attributes if they exists
                 dic[item] = { "attributes"     : {},
-                            "keys"             : {},
-                            "keyTimeValue"     : {},
-                            "keyTanInType"     : {},
-                            "keyTanOutType"    : {},
-                            "keyTanInX"        : {},
-                            "keyTanInY"        : {},
-                            "keyTanOutX"       : {},
-                            "keyTanOutY"       : {},
-                            "keyTanLocked"     : {},
-                            "keyWeightLocked"  : {},
-                            "inAngle"          : {},
-                            "inWeight"         : {},
-                            "outAngle"         : {},
-                            "outWeight"        : {},
+                            "keyData"          : self.getCurveKeyData(item),
                             "input"            : cmds.listConnections(item+".input", source=True, destination=False, plugs=True),
                             "output"           : cmds.listConnections(item+".output", source=False, destination=True, plugs=True),
                             "curveColor"       : cmds.getAttr(item+".curveColor")[0],
@@ -119,30 +110,99 @@ class DrivenKeyIO(dpBaseAction.ActionStartClass):
                 for attr in attrList:
                     if cmds.objExists(item+"."+attr):
                         dic[item]["attributes"][attr] = cmds.getAttr(item+"."+attr)
-                # storage the keys
-                if cmds.getAttr(item+".keyTimeValue", multiIndices=True):
-                    for i, index in enumerate(cmds.getAttr(item+".keyTimeValue", multiIndices=True)):
-                        dic[item]["keyTimeValue"][index] = {}
-                        dic[item]["keys"][index] = {}
-                        for ktAttr in keyTimeAttrList:
-                            dic[item]["keyTimeValue"][index][ktAttr] = cmds.getAttr(item+".keyTimeValue["+str(i)+"]."+ktAttr)
-                        for kAttr in keyAttrList:
-                            dic[item]["keys"][index][kAttr] = cmds.getAttr(item+"."+kAttr+"["+str(i)+"]")
-                        dic[item]["keyTanInType"][index]    = cmds.keyTangent(item, query=True, index=(i, i), inTangentType=True)[0]
-                        dic[item]["keyTanOutType"][index]   = cmds.keyTangent(item, query=True, index=(i, i), outTangentType=True)[0]
-                        dic[item]["keyTanInX"][index]       = cmds.keyTangent(item, query=True, index=(i, i), ix=True)[0]
-                        dic[item]["keyTanInY"][index]       = cmds.keyTangent(item, query=True, index=(i, i), iy=True)[0]
-                        dic[item]["keyTanOutX"][index]      = cmds.keyTangent(item, query=True, index=(i, i), ox=True)[0]
-                        dic[item]["keyTanOutY"][index]      = cmds.keyTangent(item, query=True, index=(i, i), oy=True)[0]
-                        dic[item]["keyTanLocked"][index]    = cmds.keyTangent(item, query=True, index=(i, i), lock=True)[0]
-                        dic[item]["keyWeightLocked"][index] = cmds.keyTangent(item, query=True, index=(i, i), weightLock=True)[0]
-                        dic[item]["inAngle"][index]         = cmds.keyTangent(item, query=True, index=(i, i), inAngle=True)[0]
-                        dic[item]["inWeight"][index]        = cmds.keyTangent(item, query=True, index=(i, i), inWeight=True)[0]
-                        dic[item]["outAngle"][index]        = cmds.keyTangent(item, query=True, index=(i, i), outAngle=True)[0]
-                        dic[item]["outWeight"][index]       = cmds.keyTangent(item, query=True, index=(i, i), outWeight=True)[0]
         return dic
 
 
+    def getAnimCurveFn(self, node, *args):
+        """ Returns the MFnAnimCurve of the given animation curve node.
+        """
+        selectionList = OpenMaya.MSelectionList()
+        selectionList.add(node)
+        return OpenMayaAnim.MFnAnimCurve(selectionList.getDependNode(0))
+
+
+    def getCurveKeyData(self, node, *args):
+        """ Read all keys of the given animation curve at once using MFnAnimCurve.
+            Returns a dictionary with one list by key data, ordered by key index.
+        """
+        tangentNameDic = dict((value, name) for name, value in self.tangentTypeDic.items())
+        curveFn = self.getAnimCurveFn(node)
+        keyData = {"input" : [], "value" : [], "inTangentType" : [], "outTangentType" : [], "inAngle" : [], "inWeight" : [], "outAngle" : [], "outWeight" : [], "tangentsLocked" : [], "weightsLocked" : [], "breakdown" : [], "tickDrawSpecial" : []}
+        for i in range(curveFn.numKeys):
+            keyData["input"].append(curveFn.input(i))
+            keyData["value"].append(curveFn.value(i))
+            keyData["inTangentType"].append(tangentNameDic.get(curveFn.inTangentType(i), "auto"))
+            keyData["outTangentType"].append(tangentNameDic.get(curveFn.outTangentType(i), "auto"))
+            inAngle, inWeight = curveFn.getTangentAngleWeight(i, True)
+            outAngle, outWeight = curveFn.getTangentAngleWeight(i, False)
+            keyData["inAngle"].append(inAngle.asDegrees())
+            keyData["inWeight"].append(inWeight)
+            keyData["outAngle"].append(outAngle.asDegrees())
+            keyData["outWeight"].append(outWeight)
+            keyData["tangentsLocked"].append(curveFn.tangentsLocked(i))
+            keyData["weightsLocked"].append(curveFn.weightsLocked(i))
+            keyData["breakdown"].append(curveFn.isBreakdown(i))
+            keyData["tickDrawSpecial"].append(curveFn.tickDrawSpecial(i))
+        return keyData
+
+
+    def setCurveKeyData(self, node, keyData, weightedTangents, *args):
+        """ Create all keys of the given animation curve from the exported key data lists.
+            The MFnAnimCurve edits aren't in the Maya undo queue, so it uses the commands when the undo is on.
+        """
+        if cmds.undoInfo(query=True, state=True):
+            self.setCurveKeyDataByCommands(node, keyData, weightedTangents)
+        else:
+            self.setCurveKeyDataByAPI(node, keyData, weightedTangents)
+        breakdownList = [(i, i) for i, breakdown in enumerate(keyData["breakdown"]) if breakdown]
+        if breakdownList:
+            cmds.keyframe(node, edit=True, index=breakdownList, breakdown=True)
+
+
+    def setCurveKeyDataByAPI(self, node, keyData, weightedTangents, *args):
+        """ Create all keys of the given animation curve at once using MFnAnimCurve (not undoable).
+            The tangents are unlocked to set their angles and weights, then their locks and types are restored.
+        """
+        curveFn = self.getAnimCurveFn(node)
+        curveFn.setIsWeighted(bool(weightedTangents))
+        inTypeList = [self.tangentTypeDic.get(tangentName, self.tangentTypeDic["auto"]) for tangentName in keyData["inTangentType"]]
+        outTypeList = [self.tangentTypeDic.get(tangentName, self.tangentTypeDic["auto"]) for tangentName in keyData["outTangentType"]]
+        for i, keyInput in enumerate(keyData["input"]):
+            curveFn.addKey(keyInput, keyData["value"][i], inTypeList[i], outTypeList[i])
+        for i in range(curveFn.numKeys):
+            curveFn.setTangentsLocked(i, False)
+            curveFn.setWeightsLocked(i, False)
+            curveFn.setTangent(i, OpenMaya.MAngle(keyData["inAngle"][i], OpenMaya.MAngle.kDegrees), keyData["inWeight"][i], True)
+            curveFn.setTangent(i, OpenMaya.MAngle(keyData["outAngle"][i], OpenMaya.MAngle.kDegrees), keyData["outWeight"][i], False)
+            curveFn.setInTangentType(i, inTypeList[i])
+            curveFn.setOutTangentType(i, outTypeList[i])
+            curveFn.setTangentsLocked(i, keyData["tangentsLocked"][i])
+            if weightedTangents:
+                curveFn.setWeightsLocked(i, keyData["weightsLocked"][i])
+            if keyData["tickDrawSpecial"][i]:
+                curveFn.setTickDrawSpecial(i, True)
+
+
+    def setCurveKeyDataByCommands(self, node, keyData, weightedTangents, *args):
+        """ Create the keys of the given animation curve by setKeyframe and keyTangent commands, one key by time (undoable).
+            The tangents are unlocked to set their angles and weights, then their locks and types are restored.
+        """
+        for i, keyInput in enumerate(keyData["input"]):
+            cmds.setKeyframe(node, float=keyInput, value=keyData["value"][i])
+        for i in range(len(keyData["input"])):
+            index = (i, i)
+            cmds.keyTangent(node, edit=True, index=index, lock=False)
+            if weightedTangents:
+                cmds.keyTangent(node, edit=True, index=index, weightLock=False)
+            cmds.keyTangent(node, edit=True, index=index, inAngle=keyData["inAngle"][i], inWeight=keyData["inWeight"][i], outAngle=keyData["outAngle"][i], outWeight=keyData["outWeight"][i])
+            cmds.keyTangent(node, edit=True, index=index, inTangentType=keyData["inTangentType"][i], outTangentType=keyData["outTangentType"][i])
+            cmds.keyTangent(node, edit=True, index=index, lock=keyData["tangentsLocked"][i])
+            if weightedTangents:
+                cmds.keyTangent(node, edit=True, index=index, weightLock=keyData["weightsLocked"][i])
+            if keyData["tickDrawSpecial"][i]:
+                cmds.keyframe(node, edit=True, index=index, tickDrawSpecial=True)
+
+
     def importDrivenKeyData(self, drivenKeyDic, *args):
         """ Import set driven key nodes from exported dictionary.
             Create missing set driven key nodes and set them values if they don't exists.
@@ -164,23 +224,26 @@ class DrivenKeyIO(dpBaseAction.ActionStartClass):
                 cmds.setAttr(node+".curveColor", drivenKeyDic[item]["curveColor"][0], drivenKeyDic[item]["curveColor"][1], drivenKeyDic[item]["curveColor"][2], type="double3")
                 cmds.keyTangent(node, edit=True, weightedTangents=drivenKeyDic[item]["weightedTangents"])
                 # set driven keys
-                for i in range(0, drivenKeyDic[item]["size"]):
-                    cmds.setKeyframe(item, float=drivenKeyDic[item]["keyTimeValue"][str(i)]["keyTime"], value=drivenKeyDic[item]["keyTimeValue"][str(i)]["keyValue"])
-                    for kAttr in drivenKeyDic[item]["keys"][str(i)].keys():
-                        cmds.setAttr(item+"."+kAttr+"["+str(i)+"]", drivenKeyDic[item]["keys"][str(i)][kAttr])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inTangentType=drivenKeyDic[item]["keyTanInType"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outTangentType=drivenKeyDic[item]["keyTanOutType"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), ix=drivenKeyDic[item]["keyTanInX"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), iy=drivenKeyDic[item]["keyTanInY"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), ox=drivenKeyDic[item]["keyTanOutX"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), oy=drivenKeyDic[item]["keyTanOutX"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), lock=drivenKeyDic[item]["keyTanLocked"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inAngle=drivenKeyDic[item]["inAngle"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inWeight=drivenKeyDic[item]["inWeight"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outAngle=drivenKeyDic[item]["outAngle"][str(i)])
-                    cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outWeight=drivenKeyDic[item]["outWeight"][str(i)])
-                    if drivenKeyDic[item]["weightedTangents"]:
-                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), weightLock=drivenKeyDic[item]["keyWeightLocked"][str(i)])
+                if "keyData" in drivenKeyDic[item].keys():
+                    self.setCurveKeyData(node, drivenKeyDic[item]["keyData"], drivenKeyDic[item]["weightedTangents"])
+                else: #data exported by the old per key layout
+                    for i in range(0, drivenKeyDic[item]["size"]):
+                        cmds.setKeyframe(item, float=drivenKeyDic[item]["keyTimeValue"][str(i)]["keyTime"], value=drivenKeyDic[item]["keyTimeValue"][str(i)]["keyValue"])
+                        for kAttr in drivenKeyDic[item]["keys"][str(i)].keys():
+                            cmds.setAttr(item+"."+kAttr+"["+str(i)+"]", drivenKeyDic[item]["keys"][str(i)][kAttr])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inTangentType=drivenKeyDic[item]["keyTanInType"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outTangentType=drivenKeyDic[item]["keyTanOutType"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), ix=drivenKeyDic[item]["keyTanInX"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), iy=drivenKeyDic[item]["keyTanInY"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), ox=drivenKeyDic[item]["keyTanOutX"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), oy=drivenKeyDic[item]["keyTanOutY"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), lock=drivenKeyDic[item]["keyTanLocked"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inAngle=drivenKeyDic[item]["inAngle"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), inWeight=drivenKeyDic[item]["inWeight"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outAngle=drivenKeyDic[item]["outAngle"][str(i)])
+                        cmds.keyTangent(node, edit=True, index=(int(i), int(i)), outWeight=drivenKeyDic[item]["outWeight"][str(i)])
+                        if drivenKeyDic[item]["weightedTangents"]:
+                            cmds.keyTangent(node, edit=True, index=(int(i), int(i)), weightLock=drivenKeyDic[item]["keyWeightLocked"][str(i)])
                 # reconnect node
                 if drivenKeyDic[item]["input"]:
                     if cmds.objExists(drivenKeyDic[item]["input"][0]):
@@ -11,7 +11,7 @@ DESCRIPTION = "r034_deformationIODesc"
 ICON = "/Icons/dp_deformationIO.png"
 WIKI = "10-‐-Rebuilder#-deformation"
 
-DP_DEFORMATIONIO_VERSION = 1.03
+DP_DEFORMATIONIO_VERSION = 1.06
 
 
 class DeformationIO(dpBaseAction.ActionStartClass):
@@ -58,14 +58,10 @@ class DeformationIO(dpBaseAction.ActionStartClass):
                             itemList.extend(cmds.listRelatives(cmds.ls(selection=False, type="nurbsCurve"), parent=True) or [])
                         if itemList:
                             # finding deformers
-                            hasDef = False
                             inputDeformerList = cmds.listHistory(itemList, pruneDagObjects=False, interestLevel=True)
-                            for deformerType in self.defWeights.typeAttrDic.keys():
-                                if cmds.ls(inputDeformerList, type=deformerType):
-                                    hasDef = True
-                                    break
-                            if hasDef:
-                                self.exportDicToJsonFile(self.getDeformerDataDic(inputDeformerList))
+                            deformerTypeDic = self.defWeights.getDeformerTypeDic(inputDeformerList)
+                            if deformerTypeDic:
+                                self.exportDicToJsonFile(self.getDeformerDataDic(deformerTypeDic), compact=self.pipeliner.pipeData.get("b_compactData", False), compactKeyList=["weights"])
                             else:
                                 self.maybeDoneIO(self.dpUIinst.lang['v014_notFoundNodes']+" deformers")
                         else:
@@ -94,44 +90,44 @@ class DeformationIO(dpBaseAction.ActionStartClass):
         return self.dataLogDic
 
 
-    def getDeformerDataDic(self, inputDeformerList, *args):
-        """ Return the deformer data dictionary to export.
+    def getDeformerDataDic(self, deformerTypeDic, *args):
+        """ Return the deformer data dictionary to export from the given dictionary of deformer nodes by type.
         """
-        self.utils.setProgress(max=len(self.defWeights.typeAttrDic.keys()), addOne=False, addNumber=False)
+        self.utils.setProgress(max=len(deformerTypeDic.keys()), addOne=False, addNumber=False)
         # Declaring the data dictionary to export it
         deformerDic = {}
-        # run for all deformer types to get info
-        for deformerType in self.defWeights.typeAttrDic.keys():
+        # run for all found deformer types to get info
+        for deformerType in deformerTypeDic.keys():
             self.utils.setProgress(self.dpUIinst.lang[self.title])
-            deformerList = cmds.ls(selection=False, type=deformerType)
+            deformerList = deformerTypeDic[deformerType]
             if deformerList:
                 for deformerNode in deformerList:
-                    if deformerNode in inputDeformerList:
-                        # get the attributes and values for this deformer node
-                        deformerDic[deformerNode] = self.defWeights.getDeformerInfo(deformerNode)
-                        # Get shape indexes for the deformer so we can query the deformer weights
-                        shapeList, indexList, shapeToIndexDic = self.defWeights.getShapeToIndexData(deformerNode)
-                        # update dictionary
-                        deformerDic[deformerNode]["shapeList"] = shapeList
-                        deformerDic[deformerNode]["indexList"] = indexList
-                        deformerDic[deformerNode]["shapeToIndexDic"] = shapeToIndexDic
-                        deformerDic[deformerNode]["weights"] = {}
-                        for shape in shapeList:
-                            # Get weights
-                            index = shapeToIndexDic[shape]
-                            weights = self.defWeights.getDeformerWeights(deformerNode, index)
-                            if deformerDic[deformerNode]["relatedNode"]: 
-                                if not deformerType == "ffd":
-                                    # nonLinear because other don't have weights (wrap, shrinkWrap and wire)
-                                    weights = self.defWeights.getDeformerWeights(deformerDic[deformerNode]["relatedNode"], index)
-                            deformerDic[deformerNode]["weights"][index] = weights
-                        # componentTag
-                        deformerDic[deformerNode]["componentTag"] = self.defWeights.checkUseComponentTag(deformerNode)
-                        # parenting
-                        deformerDic[deformerNode]["father"] = None
-                        if deformerDic[deformerNode]["relatedNode"]:
-                            if cmds.listRelatives(deformerDic[deformerNode]["relatedNode"], allParents=True):
-                                deformerDic[deformerNode]["father"] = cmds.listRelatives(deformerDic[deformerNode]["relatedNode"], allParents=True, fullPath=True)[0]
+                    # get the attributes and values for this deformer node
+                    deformerDic[deformerNode] = self.defWeights.getDeformerInfo(deformerNode)
+                    # Get shape indexes for the deformer so we can query the deformer weights
+                    shapeList, indexList, shapeToIndexDic = self.defWeights.getShapeToIndexData(deformerNode)
+                    # update dictionary
+                    deformerDic[deformerNode]["shapeList"] = shapeList
+                    deformerDic[deformerNode]["indexList"] = indexList
+                    deformerDic[deformerNode]["shapeToIndexDic"] = shapeToIndexDic
+                    deformerDic[deformerNode]["weights"] = {}
+                    for shape in shapeList:
+                        # Get weights
+                        index = shapeToIndexDic[shape]
+                        weightNode = deformerNode
+                        if deformerDic[deformerNode]["relatedNode"]: 
+                            if not deformerType == "ffd":
+                                # nonLinear because other don't have weights (wrap, shrinkWrap and wire)
+                                weightNode = deformerDic[deformerNode]["relatedNode"]
+                        weights = self.defWeights.getDeformerWeights(weightNode, index)
+                        deformerDic[deformerNode]["weights"][index] = weights
+                    # componentTag
+                    deformerDic[deformerNode]["componentTag"] = self.defWeights.checkUseComponentTag(deformerNode)
+                    # parenting
+                    deformerDic[deformerNode]["father"] = None
+                    if deformerDic[deformerNode]["relatedNode"]:
+                        if cmds.listRelatives(deformerDic[deformerNode]["relatedNode"], allParents=True):
+                            deformerDic[deformerNode]["father"] = cmds.listRelatives(deformerDic[deformerNode]["relatedNode"], allParents=True, fullPath=True)[0]
         return deformerDic
 
 
@@ -10,7 +10,7 @@ DESCRIPTION = "r017_skinningIODesc"
 ICON = "/Icons/dp_skinningIO.png"
 WIKI = "10-‐-Rebuilder#-skinning"
 
-DP_SKINNINGIO_VERSION = 1.01
+DP_SKINNINGIO_VERSION = 1.03
 
 
 class SkinningIO(dpBaseAction.ActionStartClass):
@@ -55,7 +55,7 @@ class SkinningIO(dpBaseAction.ActionStartClass):
                         else:
                             itemList = self.dpUIinst.skin.getDeformedItemList(deformerTypeList=["skinCluster"], ignoreAttr=self.dpUIinst.skin.ignoreSkinningAttr)
                         if itemList:
-                            self.exportDicToJsonFile(self.dpUIinst.skin.getSkinWeightData(itemList))
+                            self.exportDicToJsonFile(self.dpUIinst.skin.getSkinWeightData(itemList), compact=self.pipeliner.pipeData.get("b_compactData", False), compactKeyList=["skinJointsWeights", "skinBlendWeights", "skinDropoffWeights"])
                         else:
                             self.maybeDoneIO("Render_Grp")
                     else: #import
@@ -135,7 +135,7 @@ class SkinningIO(dpBaseAction.ActionStartClass):
         if toImportList:
             try:
                 # import skin weights
-                self.dpUIinst.skin.importSkinWeightsFromFile(toImportList, self.ioPath, self.latestDataFile, False)
+                self.dpUIinst.skin.importSkinWeightsFromFile(toImportList, self.ioPath, self.latestDataFile, False, skinWeightDic=skinWeightDic)
                 self.wellDoneIO(self.latestDataFile)
             except Exception as e:
                 self.notWorkedWellIO(self.latestDataFile+": "+str(e))
@@ -10,7 +10,7 @@ DESCRIPTION = "r031_blendShapeIODesc"
 ICON = "/Icons/dp_blendShapeIO.png"
 WIKI = "10-‐-Rebuilder#-blendshape"
 
-DP_BLENDSHAPEIO_VERSION = 1.03
+DP_BLENDSHAPEIO_VERSION = 1.06
 
 
 class BlendShapeIO(dpBaseAction.ActionStartClass):
@@ -62,11 +62,11 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                                 bsList = [n for n in cmds.ls(selection=False, type="blendShape") if cmds.blendShape(n, query=True, geometry=True)]
                             if bsList:
                                 bsDic = self.getBSDataDic(bsList)
+                                self.exportTargetFile(bsList)
                                 for bsNode in bsList:
-                                    self.exportTargetFile(bsNode)
                                     transformList = [cmds.listRelatives(geoShape, parent=True, type="transform")[0] for geoShape in bsDic[bsNode]["geometry"]]
                                     self.exportAlembicFile(transformList, self.originalPath, self.originalName, bsNode, False)
-                                self.exportDicToJsonFile(bsDic)
+                                self.exportDicToJsonFile(bsDic, compact=self.pipeliner.pipeData.get("b_compactData", False), compactKeyList=["baseWeights", "weightList"])
                             else:
                                 self.maybeDoneIO("BlendShapes_Grp")
                         else: #import
@@ -107,6 +107,11 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
             bsDic[bsNode]['geometry'] = cmds.blendShape(bsNode, query=True, geometry=True)
             bsDic[bsNode]['envelope'] = cmds.getAttr(bsNode+".envelope")
             bsDic[bsNode]['supportNegativeWeights'] = cmds.getAttr(bsNode+".supportNegativeWeights")
+            bsDic[bsNode]['baseWeights'] = {}
+            for s, shapeNode in enumerate(bsDic[bsNode]["geometry"]):
+                sparseWeightList = self.getSparseWeightList("{}.inputTarget[{}].baseWeights".format(bsNode, s))
+                if sparseWeightList:
+                    bsDic[bsNode]['baseWeights'][s] = sparseWeightList
             targetList = cmds.listAttr("{}.weight".format(bsNode), multi=True)
             if targetList:
                 # prepare index to deleted targets
@@ -115,7 +120,7 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                 deletedIndexList = []
                 i = 0 #workaround to avoid deleted target index when importing data
                 for t, target in enumerate(targetList):
-                    weightDic = {}
+                    weightListDic = {}
                     combination = False
                     combinationMethod = None
                     combinationList = []
@@ -134,21 +139,16 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                         elif cmds.objectType(plugNode) == "unitConversion":
                             unitConversionFactor = cmds.getAttr(plugNode+".conversionFactor")
                             unitConversionInputPlug = cmds.listConnections(plugNode+".input", destination=False, source=True, plugs=True)[0]
-                    # getting vertex weights if not equal to 1
+                    # write deleted target to compose a clear target list to avoid Maya's garbage issue
+                    while not i == indexList[t]:
+                        bsDic[bsNode]["targets"][i] = {"deleted" : True}
+                        deletedIndexList.append(i)
+                        i += 1
+                    # getting vertex weights if not equal to 1, also accepting non polygon blendShapes like curves by Zipper
                     for s, shapeNode in enumerate(bsDic[bsNode]["geometry"]):
-                        # write deleted target to compose a clear target list to avoid Maya's garbage issue
-                        while not i == indexList[t]:
-                            bsDic[bsNode]["targets"][i] = {"deleted" : True}
-                            deletedIndexList.append(i)
-                            i += 1
-                        # continue writing relevant or just info data
-                        vertices = cmds.polyEvaluate(shapeNode, vertex=True)
-                        if type(vertices) == "int": #to accept non polygon blendShapes like curves by Zipper
-                            rawWeightList = cmds.getAttr("{}.inputTarget[{}].inputTargetGroup[{}].targetWeights[0:{}]".format(bsNode, s, t, vertices-1))
-                            if not len(rawWeightList) == rawWeightList.count(1.0):
-                                for w, weight in enumerate(rawWeightList):
-                                    if not weight == 1.0:
-                                        weightDic[w] = weight
+                        sparseWeightList = self.getSparseWeightList("{}.inputTarget[{}].inputTargetGroup[{}].targetWeights".format(bsNode, s, indexList[t]))
+                        if sparseWeightList:
+                            weightListDic[s] = sparseWeightList
                     # data dictionary to export
                     bsDic[bsNode]["targets"][i] = { "name"           : target,
                                                     "deleted"        : False,
@@ -160,22 +160,65 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                                                     "combList"       : combinationList,
                                                     "unitConvFactor" : unitConversionFactor,
                                                     "unitConvInput"  : unitConversionInputPlug,
-                                                    "weightDic"      : weightDic
+                                                    "weightList"     : weightListDic
                                                     }
                     bsDic[bsNode]["deletedIndexList"] = deletedIndexList
                     i += 1
         return bsDic
 
 
-    def exportTargetFile(self, bsNode, *args):
-        """ Export the given blendShape target.
+    def getSparseWeightList(self, weightPlug, defaultValue=1.0, *args):
+        """ Read the existing elements of the given weight array plug with one query for their indices and one for their values.
+            Returns a list with the index list and the value list of the weights not equal to the default value.
+            Returns None if all weights are default, like the ones never painted that don't exist in the array.
+        """
+        existingIndexList = cmds.getAttr(weightPlug, multiIndices=True)
+        if not existingIndexList:
+            return None
+        existingValueList = cmds.getAttr(weightPlug)
+        if isinstance(existingValueList, list):
+            if existingValueList and isinstance(existingValueList[0], tuple):
+                existingValueList = list(existingValueList[0]) #array plug values come as [(v0, v1, ...)]
+        else:
+            existingValueList = [existingValueList]
+        if not len(existingValueList) == len(existingIndexList):
+            existingValueList = [cmds.getAttr(weightPlug+"["+str(idx)+"]") for idx in existingIndexList]
+        indexList, valueList = [], []
+        for idx, value in zip(existingIndexList, existingValueList):
+            if not value == defaultValue:
+                indexList.append(idx)
+                valueList.append(value)
+        if indexList:
+            return [indexList, valueList]
+        return None
+
+
+    def setSparseWeightList(self, weightPlug, sparseWeightList, *args):
+        """ Set the given index and value lists to the weight array plug.
+            Sequential indices are set together by one setAttr in the array range.
+        """
+        indexList, valueList = sparseWeightList
+        start = 0
+        for w in range(1, len(indexList)+1):
+            if w == len(indexList) or not int(indexList[w]) == int(indexList[w-1])+1:
+                cmds.setAttr("{}[{}:{}]".format(weightPlug, indexList[start], indexList[w-1]), *valueList[start:w], size=w-start)
+                start = w
+
+
+    def exportTargetFile(self, bsList, *args):
+        """ Export the targets of the given blendShape nodes, one compiled maya file by node.
         """
         try:
             self.pipeliner.makeDirIfNotExists(self.targetPath)
-            # export blendShape targets as compiled maya file
-            cmds.blendShape(bsNode, edit=True, export=self.targetPath+"/"+self.targetName+"_"+bsNode+"."+self.extention)
         except Exception as e:
             self.notWorkedWellIO(str(e))
+            return
+        for bsNode in bsList:
+            try:
+                # export blendShape targets as compiled maya file
+                cmds.blendShape(bsNode, edit=True, export=self.targetPath+"/"+self.targetName+"_"+bsNode+"."+self.extention)
+            except Exception as e:
+                self.notWorkedWellIO(str(e))
 
 
     def importBlendShapes(self, bsDic, *args):
@@ -215,6 +258,9 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                 except Exception as e:
                     self.notWorkedWellIO(self.dpUIinst.lang["r032_notImportedData"]+": "+self.targetName+"_"+bsNode+"."+self.extention+" - "+str(e))
                     wellImported = False
+            # set base weights
+            for s in list(bsDic[bsNode].get("baseWeights", {}).keys()):
+                self.setSparseWeightList("{}.inputTarget[{}].baseWeights".format(bsNode, s), bsDic[bsNode]["baseWeights"][s])
             for i in list(bsDic[bsNode]["indexTargetDic"].keys()):
                 target = bsDic[bsNode]["indexTargetDic"][i]
                 # set target value
@@ -223,9 +269,13 @@ class BlendShapeIO(dpBaseAction.ActionStartClass):
                 except:
                     pass #connected combination target
                 # set target weights
-                for s, shapeNode in enumerate(bsDic[bsNode]["geometry"]):
-                    for idx in list(bsDic[bsNode]["targets"][i]["weightDic"].keys()):
-                        cmds.setAttr("{}.inputTarget[{}].inputTargetGroup[{}].targetWeights[{}]".format(bsNode, s, i, idx), bsDic[bsNode]["targets"][i]["weightDic"][idx])
+                if "weightList" in bsDic[bsNode]["targets"][i].keys():
+                    for s in list(bsDic[bsNode]["targets"][i]["weightList"].keys()):
+                        self.setSparseWeightList("{}.inputTarget[{}].inputTargetGroup[{}].targetWeights".format(bsNode, s, i), bsDic[bsNode]["targets"][i]["weightList"][s])
+                else: #data exported by the old weight dictionary
+                    for s, shapeNode in enumerate(bsDic[bsNode]["geometry"]):
+                        for idx in list(bsDic[bsNode]["targets"][i]["weightDic"].keys()):
+                            cmds.setAttr("{}.inputTarget[{}].inputTargetGroup[{}].targetWeights[{}]".format(bsNode, s, i, idx), bsDic[bsNode]["targets"][i]["weightDic"][idx])
                 # regenerate target
                 if bsDic[bsNode]["targets"][i]["regenerate"]:
                     tgtAlreadyExists = cmds.objExists(target)
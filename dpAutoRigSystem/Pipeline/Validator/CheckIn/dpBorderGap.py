@@ -1,6 +1,5 @@
 # importing libraries:
 from maya import cmds
-from maya import OpenMaya
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -10,7 +9,7 @@ DESCRIPTION = "v123_borderGapDesc"
 ICON = "/Icons/dp_borderGap.png"
 WIKI = "07-‐-Validator#-border-gap"
 
-DP_BORDERGAP_VERSION = 1.01
+DP_BORDERGAP_VERSION = 1.03
 
 
 class BorderGap(dpBaseAction.ActionStartClass):
@@ -40,43 +39,24 @@ class BorderGap(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh")
+                toCheckList = self.sceneIndex.listNodes("mesh")
             if toCheckList:
-                self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
+                topologyList = self.dpUIinst.topology.getMeshTopologyList(toCheckList)
+                self.utils.setProgress(max=len(topologyList), addOne=False, addNumber=False)
                 # declare resulted lists
                 gapList, gapObjList = [], []
-                iter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kGeometric)
-                if iter != None:
-                    while not iter.isDone():
-                        # get mesh data
-                        shapeNode    = iter.thisNode()
-                        fnShapeNode  = OpenMaya.MFnDagNode(shapeNode)
-                        shapeName    = fnShapeNode.name()
-                        parentNode   = fnShapeNode.parent(0)
-                        fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                        objectName   = fnParentNode.name()
-                        # verify if objName or shapeName is in toCheckList
-                        for obj in toCheckList:
-                            self.utils.setProgress(self.dpUIinst.lang[self.title])
-                            if obj == shapeName and not cmds.getAttr(obj+".intermediateObject"):
-                                iterPolys = OpenMaya.MItMeshEdge(shapeNode)
-                                # Iterate through polys on current mesh
-                                while not iterPolys.isDone():
-                                    # Get current polygons connected faces
-                                    indexConFaces = OpenMaya.MIntArray()
-                                    iterPolys.getConnectedFaces(indexConFaces)
-                                    if len(indexConFaces) == 1:
-                                        if not objectName in gapObjList:
-                                            gapObjList.append(objectName)
-                                        gapList.append(objectName+'.e['+str(iterPolys.index())+']')
-                                    # Move to next polygon in the mesh list
-                                    iterPolys.next()
-                        # Move to the next selected node in the list
-                        iter.next()
+                for topologyDic in topologyList:
+                    self.utils.setProgress(self.dpUIinst.lang[self.title])
+                    objectName = topologyDic["object"]
+                    for e, faceCount in enumerate(topologyDic["edgeFaceCount"]):
+                        if faceCount == 1:
+                            if not objectName in gapObjList:
+                                gapObjList.append(objectName)
+                            gapList.append(objectName+'.e['+str(e)+']')
                 # conditional to check here
                 if gapObjList:
                     gapObjList.sort()
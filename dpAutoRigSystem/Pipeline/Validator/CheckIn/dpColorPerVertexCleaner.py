@@ -9,7 +9,7 @@ DESCRIPTION = "v118_colorPerVertexCleanerDesc"
 ICON = "/Icons/dp_colorPerVertexCleaner.png"
 WIKI = "07-‐-Validator#-colorpervertex-cleaner"
 
-DP_COLORPERVERTEX_VERSION = 1.01
+DP_COLORPERVERTEX_VERSION = 1.02
 
 
 class ColorPerVertexCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class ColorPerVertexCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="polyColorPerVertex")
             else:
-                toCheckList = cmds.ls(selection=False, type='polyColorPerVertex')
+                toCheckList = self.sceneIndex.listNodes('polyColorPerVertex')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
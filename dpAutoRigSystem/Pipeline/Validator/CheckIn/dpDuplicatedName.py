@@ -10,7 +10,7 @@ DESCRIPTION = "v025_duplicatedNameDesc"
 ICON = "/Icons/dp_duplicatedName.png"
 WIKI = "07-‐-Validator#-duplicated-name"
 
-DP_DUPLICATEDNAME_VERSION = 1.05
+DP_DUPLICATEDNAME_VERSION = 1.06
 
 
 class DuplicatedName(dpBaseAction.ActionStartClass):
@@ -40,7 +40,7 @@ class DuplicatedName(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -9,7 +9,7 @@ DESCRIPTION = 'v016_freezeTranformDesc'
 ICON = '/Icons/dp_freezeTransform.png'
 WIKI = "07-‐-Validator#-freeze-transform"
 
-DP_FREEZETRANSFORM_VERSION = 1.08
+DP_FREEZETRANSFORM_VERSION = 1.09
 
 
 class FreezeTransform(dpBaseAction.ActionStartClass):
@@ -39,15 +39,15 @@ class FreezeTransform(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     allObjectList = []
                     toFixList = []
                     if objList:
                         allObjectList = list(filter(lambda obj: cmds.objectType(obj) == 'transform', objList))
                     if len(allObjectList) == 0:
-                        allObjectList = cmds.ls(selection=False, type='transform', long=True)
+                        allObjectList = self.sceneIndex.listNodes('transform', longName=True)
                     # analisys transformations
                     if len(allObjectList) > 0:
                         self.utils.setProgress(max=len(allObjectList), addOne=False, addNumber=False)
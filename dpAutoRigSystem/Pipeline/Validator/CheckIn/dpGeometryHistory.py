@@ -9,7 +9,7 @@ DESCRIPTION = "v072_geometryHistoryDesc"
 ICON = "/Icons/dp_geometryHistory.png"
 WIKI = "07-‐-Validator#-geometry-history"
 
-DP_GEOMETRYHISTORY_VERSION = 1.06
+DP_GEOMETRYHISTORY_VERSION = 1.07
 
 
 class GeometryHistory(dpBaseAction.ActionStartClass):
@@ -39,9 +39,9 @@ class GeometryHistory(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     ignoreTypeList = ["tweak", "file", "place2dTexture"]
                     if objList:
                         geoToCleanList = objList
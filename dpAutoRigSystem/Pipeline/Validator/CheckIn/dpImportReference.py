@@ -9,7 +9,7 @@ DESCRIPTION = "v043_importReferenceDesc"
 ICON = "/Icons/dp_importReference.png"
 WIKI = "07-‐-Validator#-import-referenced-file"
 
-DP_IMPORTREFERENCE_VERSION = 1.04
+DP_IMPORTREFERENCE_VERSION = 1.05
 
 
 class ImportReference(dpBaseAction.ActionStartClass):
@@ -42,7 +42,7 @@ class ImportReference(dpBaseAction.ActionStartClass):
         if objList:
             referenceList = objList
         else:
-            referenceList = cmds.file(query=True, reference=True)
+            referenceList = self.sceneIndex.isReferenced()
         if referenceList:
             self.utils.setProgress(max=len(referenceList), addOne=False, addNumber=False)
             for reference in referenceList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v143_intermediateObjectDesc"
 ICON = "/Icons/dp_intermediateObject.png"
 WIKI = "07-‐-Validator#-intermediate-object"
 
-DP_INTERMEDIATEOBJECT_VERSION = 1.01
+DP_INTERMEDIATEOBJECT_VERSION = 1.02
 
 
 class IntermediateObject(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class IntermediateObject(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh", intermediateObjects=True)
             else:
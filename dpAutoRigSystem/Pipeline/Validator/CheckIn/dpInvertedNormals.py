@@ -10,7 +10,7 @@ DESCRIPTION = "v087_invertedNormalsDesc"
 ICON = "/Icons/dp_invertedNormals.png"
 WIKI = "07-‐-Validator#-inverted-normals"
 
-DP_INVERTEDNORMALS_VERSION = 1.02
+DP_INVERTEDNORMALS_VERSION = 1.03
 
 
 class InvertedNormals(dpBaseAction.ActionStartClass):
@@ -40,12 +40,12 @@ class InvertedNormals(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             invertedObjList = []
             if objList:
                 objMeshList = objList
             else:
-                objMeshList = cmds.ls(selection=False, type='mesh')
+                objMeshList = self.sceneIndex.listNodes('mesh')
             if objMeshList:
                 self.utils.setProgress(max=len(objMeshList), addOne=False, addNumber=False)
                 geomIter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kMesh)
@@ -1,7 +1,6 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
-from maya import OpenMaya
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -11,7 +10,7 @@ DESCRIPTION = "v125_laminaFaceCleanerDesc"
 ICON = "/Icons/dp_laminaFaceCleaner.png"
 WIKI = "07-‐-Validator#-lamina-face-cleaner"
 
-DP_LAMINAFACECLEANER_VERSION = 1.03
+DP_LAMINAFACECLEANER_VERSION = 1.05
 
 
 class LaminaFaceCleaner(dpBaseAction.ActionStartClass):
@@ -41,57 +40,25 @@ class LaminaFaceCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh")
+                toCheckList = self.sceneIndex.listNodes("mesh")
             if toCheckList:
-                self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
+                topologyList = self.dpUIinst.topology.getMeshTopologyList(toCheckList)
+                self.utils.setProgress(max=len(topologyList), addOne=False, addNumber=False)
                 # declare resulted lists
                 laminaObjList, laminaFaceList = [], []
-                iter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kGeometric)
-                if iter != None:
-                    while not iter.isDone():
-                        # get mesh data
-                        shapeNode    = iter.thisNode()
-                        fnShapeNode  = OpenMaya.MFnDagNode(shapeNode)
-                        shapeName    = fnShapeNode.name()
-                        parentNode   = fnShapeNode.parent(0)
-                        fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                        objectName   = fnParentNode.name()
-                        # verify if objName or shapeName is in toCheckList
-                        for obj in toCheckList:
-                            self.utils.setProgress(self.dpUIinst.lang[self.title])
-                            if obj == shapeName and not cmds.getAttr(obj+".intermediateObject"):
-                                # get faces
-                                faceIter   = OpenMaya.MItMeshPolygon(shapeNode)
-                                conFacesIt = OpenMaya.MItMeshPolygon(shapeNode)
-                                # run in faces listing edges
-                                while not faceIter.isDone():
-                                    # list vertices from this face
-                                    edgesIntArray = OpenMaya.MIntArray()
-                                    faceIter.getEdges(edgesIntArray)
-                                    # get connected faces of this face
-                                    conFacesIntArray = OpenMaya.MIntArray()
-                                    faceIter.getConnectedFaces(conFacesIntArray)
-                                    # run in adjacent faces to list them vertices
-                                    for f in conFacesIntArray:
-                                        # say this is the face index to use for next iterations
-                                        lastIndexPtr = OpenMaya.MScriptUtil().asIntPtr()
-                                        conFacesIt.setIndex(f, lastIndexPtr)
-                                        # get edges from this adjacent face
-                                        conEdgesIntArray = OpenMaya.MIntArray()
-                                        conFacesIt.getEdges(conEdgesIntArray)
-                                        # compare edges to verify if the list are the same
-                                        if sorted(edgesIntArray) == sorted(conEdgesIntArray):
-                                            # found laminaFaces
-                                            if not objectName in laminaObjList:
-                                                laminaObjList.append(objectName)
-                                            laminaFaceList.append(objectName+'.f['+str(faceIter.index())+']')
-                                    faceIter.next()
-                        # Move to the next selected node in the list
-                        iter.next()
+                for topologyDic in topologyList:
+                    self.utils.setProgress(self.dpUIinst.lang[self.title])
+                    objectName = topologyDic["object"]
+                    # faces using the same vertices share the same edges
+                    faceIdxList = self.dpUIinst.topology.getLaminaFaceList(topologyDic)
+                    if faceIdxList:
+                        laminaObjList.append(objectName)
+                        for f in faceIdxList:
+                            laminaFaceList.append(objectName+'.f['+str(f)+']')
                 # conditional to check here
                 if laminaObjList:
                     laminaObjList.sort()
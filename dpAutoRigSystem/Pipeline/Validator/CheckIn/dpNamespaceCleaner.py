@@ -9,7 +9,7 @@ DESCRIPTION = "v039_namespaceCleanerDesc"
 ICON = "/Icons/dp_namespaceCleaner.png"
 WIKI = "07-‐-Validator#-namespace-cleaner"
 
-DP_NAMESPACECLEANER_VERSION = 1.03
+DP_NAMESPACECLEANER_VERSION = 1.04
 
 
 class NamespaceCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class NamespaceCleaner(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 namespaceToCleanList = objList
             else:
@@ -10,7 +10,7 @@ DESCRIPTION = "v102_nonManifoldCleanerDesc"
 ICON = "/Icons/dp_nonManifoldCleaner.png"
 WIKI = "07-‐-Validator#-nonmanifold-cleaner"
 
-DP_NONMANIFOLDCLEANER_VERSION = 1.01
+DP_NONMANIFOLDCLEANER_VERSION = 1.02
 
 
 class NonManifoldCleaner(dpBaseAction.ActionStartClass):
@@ -40,9 +40,9 @@ class NonManifoldCleaner(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     if objList:
                         geoToCleanList = objList
                     else:
@@ -1,6 +1,5 @@
 # importing libraries:
 from maya import cmds
-from maya import OpenMaya
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -10,7 +9,7 @@ DESCRIPTION = "v120_nonQuadFaceDesc"
 ICON = "/Icons/dp_nonQuadFace.png"
 WIKI = "07-‐-Validator#-non-quad-face"
 
-DP_NONQUADFACE_VERSION = 1.01
+DP_NONQUADFACE_VERSION = 1.03
 
 
 class NonQuadFace(dpBaseAction.ActionStartClass):
@@ -40,45 +39,28 @@ class NonQuadFace(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh")
+                toCheckList = self.sceneIndex.listNodes("mesh")
             if toCheckList:
-                self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
+                topologyList = self.dpUIinst.topology.getMeshTopologyList(toCheckList)
+                self.utils.setProgress(max=len(topologyList), addOne=False, addNumber=False)
                 # declare resulted lists
                 polyObjList, trisObjList, trisList, polyList = [], [], [], []
-                iter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kGeometric)
-                if iter != None:
-                    while not iter.isDone():
-                        # get mesh data
-                        shapeNode    = iter.thisNode()
-                        fnShapeNode  = OpenMaya.MFnDagNode(shapeNode)
-                        shapeName    = fnShapeNode.name()
-                        parentNode   = fnShapeNode.parent(0)
-                        fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                        objectName   = fnParentNode.name()
-                        # verify if objName or shapeName is in toCheckList
-                        for obj in toCheckList:
-                            self.utils.setProgress(self.dpUIinst.lang[self.title])
-                            if obj == shapeName and not cmds.getAttr(obj+".intermediateObject"):
-                                iterPolys = OpenMaya.MItMeshPolygon(shapeNode)
-                                # Iterate through polys on current mesh
-                                while not iterPolys.isDone():
-                                    nVertex = iterPolys.polygonVertexCount()
-                                    if nVertex > 4:
-                                        if not objectName in polyObjList:
-                                            polyObjList.append(objectName)
-                                        polyList.append(objectName+'.f['+str(iterPolys.index())+']')
-                                    elif nVertex == 3:
-                                        if not objectName in trisObjList:
-                                            trisObjList.append(objectName)
-                                        trisList.append(objectName+'.f['+str(iterPolys.index())+']')
-                                    # Move to next polygon in the mesh list
-                                    iterPolys.next()
-                        # Move to the next selected node in the list
-                        iter.next()
+                for topologyDic in topologyList:
+                    self.utils.setProgress(self.dpUIinst.lang[self.title])
+                    objectName = topologyDic["object"]
+                    for f, nVertex in enumerate(topologyDic["faceVertexCount"]):
+                        if nVertex > 4:
+                            if not objectName in polyObjList:
+                                polyObjList.append(objectName)
+                            polyList.append(objectName+'.f['+str(f)+']')
+                        elif nVertex == 3:
+                            if not objectName in trisObjList:
+                                trisObjList.append(objectName)
+                            trisList.append(objectName+'.f['+str(f)+']')
                 # conditional to check here
                 if polyObjList or trisObjList:
                     nonQuadObjList = list(set(polyObjList+trisObjList))
@@ -10,7 +10,7 @@ DESCRIPTION = "v133_oneVertexDesc"
 ICON = "/Icons/dp_oneVertex.png"
 WIKI = "07-‐-Validator#-one-vertex"
 
-DP_ONEVERTEX_VERSION = 2.01
+DP_ONEVERTEX_VERSION = 2.02
 
 
 class OneVertex(dpBaseAction.ActionStartClass):
@@ -40,13 +40,13 @@ class OneVertex(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     if objList:
                         toCheckList = cmds.ls(objList, type="mesh")
                     else:
-                        toCheckList = cmds.ls(selection=False, type="mesh")
+                        toCheckList = self.sceneIndex.listNodes("mesh")
                     if toCheckList:
                         self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                         oneVertexList = self.checkNonManifoldVertex(toCheckList)
@@ -9,7 +9,7 @@ DESCRIPTION = 'v091_overrideCleanerDesc'
 ICON = '/Icons/dp_overrideCleaner.png'
 WIKI = "07-‐-Validator#-override-cleaner"
 
-DP_OVERRIDECLEANER_VERSION = 1.04
+DP_OVERRIDECLEANER_VERSION = 1.05
 
 
 class OverrideCleaner(dpBaseAction.ActionStartClass):
@@ -39,9 +39,9 @@ class OverrideCleaner(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     nodeList = cmds.ls(selection=False)
                     if objList:
                         nodeList = objList
@@ -9,7 +9,7 @@ DESCRIPTION = "v141_parentedGeometryDesc"
 ICON = "/Icons/dp_parentedGeometry.png"
 WIKI = "07-‐-Validator#-parented-geometry"
 
-DP_PARENTEDGEOMETRY_VERSION = 1.02
+DP_PARENTEDGEOMETRY_VERSION = 1.03
 
 
 class ParentedGeometry(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class ParentedGeometry(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh") #all meshes in the scene
+                toCheckList = self.sceneIndex.listNodes("mesh") #all meshes in the scene
             if toCheckList:
                 meshParentList = self.getMeshTransformList(toCheckList)
                 if meshParentList:
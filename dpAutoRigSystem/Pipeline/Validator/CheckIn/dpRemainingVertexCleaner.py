@@ -1,6 +1,5 @@
 # importing libraries:
 from maya import cmds
-from maya import OpenMaya
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -10,7 +9,7 @@ DESCRIPTION = "v135_remainingVertexCleanerDesc"
 ICON = "/Icons/dp_remainingVertexCleaner.png"
 WIKI = "07-‐-Validator#-remaining-vertex-cleaner"
 
-DP_REMAININGVERTEXCLEANER_VERSION = 1.01
+DP_REMAININGVERTEXCLEANER_VERSION = 1.03
 
 
 class RemainingVertexCleaner(dpBaseAction.ActionStartClass):
@@ -40,56 +39,23 @@ class RemainingVertexCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh")
+                toCheckList = self.sceneIndex.listNodes("mesh")
             if toCheckList:
-                self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
+                topologyList = self.dpUIinst.topology.getMeshTopologyList(toCheckList)
+                self.utils.setProgress(max=len(topologyList), addOne=False, addNumber=False)
                 # declare resulted lists
-                borderEdgeIdxList, remainingVertexList = [], []
-                iter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kGeometric)
-                if iter != None:
-                    while not iter.isDone():
-                        # get mesh data
-                        shapeNode    = iter.thisNode()
-                        fnShapeNode  = OpenMaya.MFnDagNode(shapeNode)
-                        shapeName    = fnShapeNode.name()
-                        parentNode   = fnShapeNode.parent(0)
-                        fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                        objectName   = fnParentNode.name()
-                        # verify if objName or shapeName is in toCheckList
-                        for obj in toCheckList:
-                            self.utils.setProgress(self.dpUIinst.lang[self.title])
-                            if obj == shapeName and not cmds.getAttr(obj+".intermediateObject"):
-                                vertexIter = OpenMaya.MItMeshVertex(shapeNode)
-                                iterEdges  = OpenMaya.MItMeshEdge(shapeNode)
-                                # Iterate through edges on current mesh
-                                while not iterEdges.isDone():
-                                    # Get current polygons connected faces
-                                    indexConFaces = OpenMaya.MIntArray()
-                                    iterEdges.getConnectedFaces(indexConFaces)
-                                    if len(indexConFaces) == 1:
-                                        # got a border edge
-                                        borderEdgeIdxList.append(iterEdges.index())
-                                    # Move to next edge in the mesh list
-                                    iterEdges.next()
-                                # Iterate through vertices on current mesh
-                                while not vertexIter.isDone():
-                                    # Get current vertex connected edges
-                                    indexConEdges = OpenMaya.MIntArray()
-                                    vertexIter.getConnectedEdges(indexConEdges)
-                                    if len(indexConEdges) < 3:
-                                        if borderEdgeIdxList:
-                                            if not set(indexConEdges).intersection(borderEdgeIdxList):
-                                                remainingVertexList.append(objectName+'.vtx['+str(vertexIter.index())+']')
-                                        else:
-                                            remainingVertexList.append(objectName+'.vtx['+str(vertexIter.index())+']')
-                                    # Move to next vertex in the mesh list
-                                    vertexIter.next()
-                        # Move to the next selected node in the list
-                        iter.next()
+                remainingVertexList = []
+                for topologyDic in topologyList:
+                    self.utils.setProgress(self.dpUIinst.lang[self.title])
+                    objectName = topologyDic["object"]
+                    borderVertexSet = self.dpUIinst.topology.getBorderVertexSet(topologyDic)
+                    for v, edgeCount in enumerate(topologyDic["vertexEdgeCount"]):
+                        if edgeCount < 3 and not v in borderVertexSet:
+                            remainingVertexList.append(objectName+'.vtx['+str(v)+']')
                 # conditional to check here
                 if remainingVertexList:
                     remainingVertexList.reverse()
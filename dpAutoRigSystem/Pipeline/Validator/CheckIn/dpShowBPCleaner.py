@@ -9,7 +9,7 @@ DESCRIPTION = "v051_showBPCleanerDesc"
 ICON = "/Icons/dp_showBPCleaner.png"
 WIKI = "07-‐-Validator#-showbp-cleaner"
 
-DP_SHOWBPCLEANER_VERSION = 1.03
+DP_SHOWBPCLEANER_VERSION = 1.04
 
 
 class ShowBPCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class ShowBPCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='script')
+                toCheckList = self.sceneIndex.listNodes('script')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v089_softenEdgesDesc"
 ICON = "/Icons/dp_softenEdges.png"
 WIKI = "07-‐-Validator#-soften-edges"
 
-DP_SOFTENEDGES_VERSION = 1.03
+DP_SOFTENEDGES_VERSION = 1.04
 
 
 class SoftenEdges(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class SoftenEdges(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 allMeshList = objList
             else:
-                allMeshList = cmds.ls(selection=False, type="mesh")
+                allMeshList = self.sceneIndex.listNodes("mesh")
             if allMeshList:
                 self.utils.setProgress(max=len(allMeshList), addOne=False, addNumber=False)
                 for mesh in allMeshList:
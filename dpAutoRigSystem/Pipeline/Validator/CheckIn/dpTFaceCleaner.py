@@ -1,7 +1,6 @@
 # importing libraries:
 from maya import cmds
 from maya import mel
-from maya import OpenMaya
 from ....Modules.Base import dpBaseAction
 
 # global variables to this module:
@@ -11,7 +10,7 @@ DESCRIPTION = "v129_tFaceCleanerDesc"
 ICON = "/Icons/dp_tFaceCleaner.png"
 WIKI = "07-‐-Validator#-t-face-cleaner"
 
-DP_TFACECLEANER_VERSION = 1.01
+DP_TFACECLEANER_VERSION = 1.03
 
 
 class TFaceCleaner(dpBaseAction.ActionStartClass):
@@ -41,43 +40,24 @@ class TFaceCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="mesh")
             else:
-                toCheckList = cmds.ls(selection=False, type="mesh")
+                toCheckList = self.sceneIndex.listNodes("mesh")
             if toCheckList:
-                self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
+                topologyList = self.dpUIinst.topology.getMeshTopologyList(toCheckList)
+                self.utils.setProgress(max=len(topologyList), addOne=False, addNumber=False)
                 # declare resulted lists
                 tFaceList = []
-                iter = OpenMaya.MItDependencyNodes(OpenMaya.MFn.kGeometric)
-                if iter != None:
-                    while not iter.isDone():
-                        # get mesh data
-                        shapeNode    = iter.thisNode()
-                        fnShapeNode  = OpenMaya.MFnDagNode(shapeNode)
-                        shapeName    = fnShapeNode.name()
-                        parentNode   = fnShapeNode.parent(0)
-                        fnParentNode = OpenMaya.MFnDagNode(parentNode)
-                        objectName   = fnParentNode.name()
-                        # verify if objName or shapeName is in toCheckList
-                        for obj in toCheckList:
-                            self.utils.setProgress(self.dpUIinst.lang[self.title])
-                            if obj == shapeName and not cmds.getAttr(obj+".intermediateObject"):
-                                # get edges
-                                edgeIter = OpenMaya.MItMeshEdge(shapeNode)
-                                # run in faces listing faces
-                                while not edgeIter.isDone():
-                                    # list faces from this edge
-                                    faceIntArray = OpenMaya.MIntArray()
-                                    edgeIter.getConnectedFaces(faceIntArray)
-                                    # verify the lenght of the connectedFaces
-                                    if len(faceIntArray) > 2:
-                                        # found tFace
-                                        tFaceList.append(objectName+".e["+str(edgeIter.index())+"]")
-                                    edgeIter.next()
-                        # Move to the next selected node in the list
-                        iter.next()
+                for topologyDic in topologyList:
+                    self.utils.setProgress(self.dpUIinst.lang[self.title])
+                    objectName = topologyDic["object"]
+                    for e, faceCount in enumerate(topologyDic["edgeFaceCount"]):
+                        # verify the lenght of the connectedFaces
+                        if faceCount > 2:
+                            # found tFace
+                            tFaceList.append(objectName+".e["+str(e)+"]")
                 # conditional to check here
                 if tFaceList:
                     tFaceList.sort()
@@ -9,7 +9,7 @@ DESCRIPTION = 'v093_unlockAttributesDesc'
 ICON = '/Icons/dp_unlockAttributes.png'
 WIKI = "07-‐-Validator#-unlock-attributes"
 
-DP_UNLOCKATTRIBUTES_VERSION = 1.03
+DP_UNLOCKATTRIBUTES_VERSION = 1.04
 
 
 class UnlockAttributes(dpBaseAction.ActionStartClass):
@@ -39,9 +39,9 @@ class UnlockAttributes(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not self.utils.getAllGrp():
-            if not self.utils.getNetworkNodeByAttr("dpGuideNet"):
-                if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.getAllGrp():
+            if not self.sceneIndex.getNetworkNodeByAttr("dpGuideNet"):
+                if not self.sceneIndex.isReferenced():
                     nodeList = cmds.ls(selection=False)
                     if objList:
                         nodeList = objList
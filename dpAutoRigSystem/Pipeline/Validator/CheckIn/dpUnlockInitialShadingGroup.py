@@ -9,7 +9,7 @@ DESCRIPTION = "v049_unlockIniShadGrpDesc"
 ICON = "/Icons/dp_unlockInitialShadingGroup.png"
 WIKI = "07-‐-Validator#-unlock-initialshadinggroup"
 
-DP_UNLOCKINITIALSHADINGGROUP_VERSION = 1.03
+DP_UNLOCKINITIALSHADINGGROUP_VERSION = 1.04
 
 
 class UnlockInitialShadingGroup(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class UnlockInitialShadingGroup(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -11,7 +11,7 @@ DESCRIPTION = "v079_unlockNormalsDesc"
 ICON = "/Icons/dp_unlockNormals.png"
 WIKI = "07-‐-Validator#-unlock-normals"
 
-DP_UNLOCKNORMALS_VERSION = 2.00
+DP_UNLOCKNORMALS_VERSION = 2.01
 
 
 class UnlockNormals(dpBaseAction.ActionStartClass):
@@ -42,11 +42,11 @@ class UnlockNormals(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 allMeshList = objList
             else:
-                allMeshList = cmds.ls(selection=False, type='mesh')
+                allMeshList = self.sceneIndex.listNodes('mesh')
             if allMeshList:
                 self.utils.setProgress(max=len(allMeshList), addOne=False, addNumber=False)
                 for mesh in allMeshList:
@@ -10,7 +10,7 @@ DESCRIPTION = "v053_vaccineCleanerDesc"
 ICON = "/Icons/dp_vaccineCleaner.png"
 WIKI = "07-‐-Validator#-vaccine-cleaner"
 
-DP_VACCINECLEANER_VERSION = 1.03
+DP_VACCINECLEANER_VERSION = 1.04
 
 
 class VaccineCleaner(dpBaseAction.ActionStartClass):
@@ -40,11 +40,11 @@ class VaccineCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='script')
+                toCheckList = self.sceneIndex.listNodes('script')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v114_bindPoseCleanerDesc"
 ICON = "/Icons/dp_bindPoseCleaner.png"
 WIKI = "07-‐-Validator#-bindpose-cleaner"
 
-DP_BINDPOSECLEANER_VERSION = 1.01
+DP_BINDPOSECLEANER_VERSION = 1.02
 
 
 class BindPoseCleaner(dpBaseAction.ActionStartClass):
@@ -40,11 +40,11 @@ class BindPoseCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="dagPose")
             else:
-                toCheckList = cmds.ls(selection=False, type="dagPose") #bindPose nodes
+                toCheckList = self.sceneIndex.listNodes("dagPose") #bindPose nodes
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 # conditional to check here
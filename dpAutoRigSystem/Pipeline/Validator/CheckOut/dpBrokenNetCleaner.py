@@ -9,7 +9,7 @@ DESCRIPTION = "v047_brokenNetCleanerDesc"
 ICON = "/Icons/dp_brokenNetCleaner.png"
 WIKI = "07-‐-Validator#-broken-network-cleaner"
 
-DP_BROKENNETCLEANER_VERSION = 1.05
+DP_BROKENNETCLEANER_VERSION = 1.06
 
 
 class BrokenNetCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class BrokenNetCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='network')
+                toCheckList = self.sceneIndex.listNodes('network')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
@@ -13,7 +13,7 @@ DESCRIPTION = "v127_brokenRivetDesc"
 ICON = "/Icons/dp_brokenRivet.png"
 WIKI = "07-‐-Validator#-broken-rivets"
 
-DP_BROKENRIVET_VERSION = 1.01
+DP_BROKENRIVET_VERSION = 1.02
 
 
 class BrokenRivet(dpBaseAction.ActionStartClass):
@@ -344,7 +344,7 @@ class BrokenRivet(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="follicle")
             else:
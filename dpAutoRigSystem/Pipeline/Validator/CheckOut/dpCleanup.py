@@ -9,7 +9,7 @@ DESCRIPTION = "v097_cleanupDesc"
 ICON = "/Icons/dp_cleanup.png"
 WIKI = "07-‐-Validator#-cleanup"
 
-DP_CLEANUP_VERSION = 1.01
+DP_CLEANUP_VERSION = 1.02
 
 
 class Cleanup(dpBaseAction.ActionStartClass):
@@ -40,7 +40,7 @@ class Cleanup(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
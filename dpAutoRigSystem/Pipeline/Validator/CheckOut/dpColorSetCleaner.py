@@ -9,7 +9,7 @@ DESCRIPTION = "v031_colorSetCleanerDesc"
 ICON = "/Icons/dp_colorSetCleaner.png"
 WIKI = "07-‐-Validator#-colorset-cleaner"
 
-DP_COLORSETCLEANER_VERSION = 1.05
+DP_COLORSETCLEANER_VERSION = 1.06
 
 
 class ColorSetCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class ColorSetCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='createColorSet')
+                toCheckList = self.sceneIndex.listNodes('createColorSet')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
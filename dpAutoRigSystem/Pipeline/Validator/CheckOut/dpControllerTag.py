@@ -9,7 +9,7 @@ DESCRIPTION = "v074_controllerTagDesc"
 ICON = "/Icons/dp_controllerTag.png"
 WIKI = "07-‐-Validator#-controller-tag"
 
-DP_CONTROLLERTAG_VERSION = 1.04
+DP_CONTROLLERTAG_VERSION = 1.05
 
 
 class ControllerTag(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class ControllerTag(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -11,7 +11,7 @@ DESCRIPTION = "v061_controlsHierarchyDesc"
 ICON = "/Icons/dp_controlsHierarchy.png"
 WIKI = "07-‐-Validator#-controls-hierarchy"
 
-DP_CONTROLSHIERARCHY_VERSION = 1.07
+DP_CONTROLSHIERARCHY_VERSION = 1.08
 
 
 class ControlsHierarchy(dpBaseAction.ActionStartClass):
@@ -135,7 +135,7 @@ class ControlsHierarchy(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             rootNode = None
             
             globalCtrl = self.utils.getNodeByMessage("globalCtrl")
@@ -9,7 +9,7 @@ DESCRIPTION = "v106_cycleCheckerDesc"
 ICON = "/Icons/dp_cycleChecker.png"
 WIKI = "07-‐-Validator#-cycle-checker"
 
-DP_CYCLECHECKER_VERSION = 1.01
+DP_CYCLECHECKER_VERSION = 1.02
 
 
 class CycleChecker(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class CycleChecker(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             self.utils.setProgress(max=1, addOne=False, addNumber=False)
             self.utils.setProgress(self.dpUIinst.lang[self.title])
             cycles = None
@@ -9,7 +9,7 @@ DESCRIPTION = "v145_dataSetCleanerDesc"
 ICON = "/Icons/dp_dataSetCleaner.png"
 WIKI = "07-‐-Validator#-data_grp-set-cleaner"
 
-DP_DATASETCLEANER_VERSION = 1.00
+DP_DATASETCLEANER_VERSION = 1.01
 
 
 class DataSetCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class DataSetCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 dataGrp = objList[0]
             else:
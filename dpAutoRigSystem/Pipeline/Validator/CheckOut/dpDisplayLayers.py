@@ -9,7 +9,7 @@ DESCRIPTION = "v055_displayLayersDesc"
 ICON = "/Icons/dp_displayLyr.png"
 WIKI = "07-‐-Validator#-display-layers"
 
-DP_DISPLAYLAYERS_VERSION = 1.06
+DP_DISPLAYLAYERS_VERSION = 1.07
 
 
 class DisplayLayers(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class DisplayLayers(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 ctrlsGeometryList = objList
             else:
@@ -9,7 +9,7 @@ DESCRIPTION = "v139_emptyTransformCleanerDesc"
 ICON = "/Icons/dp_emptyTransformCleaner.png"
 WIKI = "07-‐-Validator#-empty-transform-cleaner"
 
-DP_EMPTYTRANSFORMCLEANER_VERSION = 1.02
+DP_EMPTYTRANSFORMCLEANER_VERSION = 1.03
 
 
 class EmptyTransformCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class EmptyTransformCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
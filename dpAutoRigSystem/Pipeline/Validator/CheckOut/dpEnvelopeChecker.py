@@ -10,7 +10,7 @@ DESCRIPTION = "v095_envelopeCheckerDesc"
 ICON = "/Icons/dp_envelopeChecker.png"
 WIKI = "07-‐-Validator#-envelope-checker"
 
-DP_ENVELOPECHECKER_VERSION = 1.02
+DP_ENVELOPECHECKER_VERSION = 1.03
 
 
 class EnvelopeChecker(dpBaseAction.ActionStartClass):
@@ -55,7 +55,7 @@ class EnvelopeChecker(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 allNodesList = objList
             else:
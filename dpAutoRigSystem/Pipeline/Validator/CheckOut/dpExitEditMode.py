@@ -9,7 +9,7 @@ DESCRIPTION = "v035_exitEditModeDesc"
 ICON = "/Icons/dp_exitEditMode.png"
 WIKI = "07-‐-Validator#-exit-edit-mode"
 
-DP_EXITEDITMODE_VERSION = 1.04
+DP_EXITEDITMODE_VERSION = 1.05
 
 
 class ExitEditMode(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class ExitEditMode(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
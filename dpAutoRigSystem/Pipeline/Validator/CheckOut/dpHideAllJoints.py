@@ -9,7 +9,7 @@ DESCRIPTION = "v116_hideAllJointsDesc"
 ICON = "/Icons/dp_hideAllJoints.png"
 WIKI = "07-‐-Validator#-hide-all-joints"
 
-DP_HIDEALLJOINTS_VERSION = 1.01
+DP_HIDEALLJOINTS_VERSION = 1.02
 
 
 class HideAllJoints(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class HideAllJoints(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='joint') #all
+                toCheckList = self.sceneIndex.listNodes('joint') #all
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
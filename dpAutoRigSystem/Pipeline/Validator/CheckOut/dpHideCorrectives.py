@@ -9,7 +9,7 @@ DESCRIPTION = "v037_hideCorrectivesDesc"
 ICON = "/Icons/dp_hideCorrectives.png"
 WIKI = "07-‐-Validator#-hide-correctives"
 
-DP_HIDECORRECTIVES_VERSION = 1.04
+DP_HIDECORRECTIVES_VERSION = 1.05
 
 
 class HideCorrectives(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class HideCorrectives(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             optionCtrl = self.utils.getNodeByMessage("optionCtrl")
             if optionCtrl:
                 if objList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v029_hideDataGrpDesc"
 ICON = "/Icons/dp_hideDataGrp.png"
 WIKI = "07-‐-Validator#-hide-data_grp"
 
-DP_HIDEDATAGRP_VERSION = 1.03
+DP_HIDEDATAGRP_VERSION = 1.04
 
 
 class HideDataGrp(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class HideDataGrp(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             dataGrp = None
             if objList:
                 dataGrp = objList[0]
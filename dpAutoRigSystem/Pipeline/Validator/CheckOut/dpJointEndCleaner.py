@@ -9,7 +9,7 @@ DESCRIPTION = "v112_jointEndCleanerDesc"
 ICON = "/Icons/dp_jointEndCleaner.png"
 WIKI = "07-‐-Validator#-joint-end-cleaner"
 
-DP_JOINTENDCLEANER_VERSION = 1.02
+DP_JOINTENDCLEANER_VERSION = 1.03
 
 
 class JointEndCleaner(dpBaseAction.ActionStartClass):
@@ -39,16 +39,16 @@ class JointEndCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type="joint")
+                toCheckList = self.sceneIndex.listNodes("joint")
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 # list joint ends
                 jEndList = [j for j in toCheckList if self.dpUIinst.jointEndAttr in cmds.listAttr(j)] #by attribute
-                jEndList.extend([j for j in cmds.ls(selection=False, type="joint") if j.endswith(self.dpUIinst.jointEndAttr)]) #by suffix
+                jEndList.extend([j for j in self.sceneIndex.listNodes("joint") if j.endswith(self.dpUIinst.jointEndAttr)]) #by suffix
                 if jEndList:
                     # check connection with skinCluster to avoid delete it and crash the setup
                     jEndList = list(set(jEndList)-set(self.dpUIinst.skin.getSkinnedJointList())) #remove duplicated and skinned joints
@@ -9,7 +9,7 @@ DESCRIPTION = "v041_keyframeCleanerDesc"
 ICON = "/Icons/dp_keyframeCleaner.png"
 WIKI = "07-‐-Validator#-keyframe-cleaner"
 
-DP_KEYFRAMECLEANER_VERSION = 1.03
+DP_KEYFRAMECLEANER_VERSION = 1.04
 
 
 class KeyframeCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class KeyframeCleaner(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -9,7 +9,7 @@ DESCRIPTION = "v027_ngskintoolsCleanerDesc"
 ICON = "/Icons/dp_ngskintoolsCleaner.png"
 WIKI = "07-‐-Validator#-ngskintools-cleaner"
 
-DP_NGSKINTOOLSCLEANER_VERSION = 1.04
+DP_NGSKINTOOLSCLEANER_VERSION = 1.05
 
 
 class NgSkinToolsCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class NgSkinToolsCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='ngst2SkinLayerData')
+                toCheckList = self.sceneIndex.listNodes('ngst2SkinLayerData')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
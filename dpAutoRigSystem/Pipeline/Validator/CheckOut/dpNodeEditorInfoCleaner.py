@@ -9,7 +9,7 @@ DESCRIPTION = "v147_nodeEditoInfoCleanerDesc"
 ICON = "/Icons/dp_nodeEditorInfoCleaner.png"
 WIKI = "07-‐-Validator#-node-editor-info-cleaner"
 
-DP_NODEEDITORINFOCLEANER_VERSION = 1.00
+DP_NODEEDITORINFOCLEANER_VERSION = 1.01
 
 
 class NodeEditorInfoCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class NodeEditorInfoCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='nodeGraphEditorInfo')
+                toCheckList = self.sceneIndex.listNodes('nodeGraphEditorInfo')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v077_outlinerCleanerDesc"
 ICON = "/Icons/dp_outlinerCleaner.png"
 WIKI = "07-‐-Validator#-outliner-cleaner"
 
-DP_OUTLINERCLEANER_VERSION = 1.05
+DP_OUTLINERCLEANER_VERSION = 1.06
 
 
 class OutlinerCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class OutlinerCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             hiddenList = [self.dpUIinst.tempGrp, self.dpUIinst.guideMirrorGrp]
             
             
@@ -47,7 +47,7 @@ class OutlinerCleaner(dpBaseAction.ActionStartClass):
 
 
             if not objList:
-                objList = cmds.ls(selection=False, type="transform")
+                objList = self.sceneIndex.listNodes("transform")
             if objList:
                 self.utils.setProgress(max=len(hiddenList), addOne=False, addNumber=False)
                 for item in hiddenList:
@@ -13,7 +13,7 @@ DESCRIPTION = "v108_passthroughAttributesDesc"
 ICON = "/Icons/dp_passthroughAttributes.png"
 WIKI = "07-‐-Validator#-pasthrough-attributes"
 
-DP_PASSTHROUGHATTRIBUTES_VERSION = 1.01
+DP_PASSTHROUGHATTRIBUTES_VERSION = 1.02
 
 
 class PassthroughAttributes(dpBaseAction.ActionStartClass):
@@ -44,7 +44,7 @@ class PassthroughAttributes(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -12,7 +12,7 @@ WIKI = "07-‐-Validator#-proxy-creator"
 PROXIED = "dpProxied"
 NO_PROXY = "dpDoNotProxyIt"
 
-DP_PROXYCREATOR_VERSION = 1.07
+DP_PROXYCREATOR_VERSION = 1.08
 
 
 class ProxyCreator(dpBaseAction.ActionStartClass):
@@ -43,7 +43,7 @@ class ProxyCreator(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             self.skinClusterList = []
             proxyGrp = None
             if objList:
@@ -10,7 +10,7 @@ DESCRIPTION = "v104_pruneSkinWeightsDesc"
 ICON = "/Icons/dp_pruneSkinWeights.png"
 WIKI = "07-‐-Validator#-prune-skin-weights"
 
-DP_PRUNESKINWEIGHTS_VERSION = 1.02
+DP_PRUNESKINWEIGHTS_VERSION = 1.04
 
 
 class PruneSkinWeights(dpBaseAction.ActionStartClass):
@@ -41,25 +41,27 @@ class PruneSkinWeights(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='skinCluster')
+                toCheckList = self.sceneIndex.listNodes('skinCluster')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for skinClusterNode in toCheckList:
                     self.utils.setProgress(self.dpUIinst.lang[self.title])
                     meshList = cmds.skinCluster(skinClusterNode, query=True, geometry=True)
                     if meshList:
-                        weightsList = self.dpUIinst.skin.getSkinWeights(meshList[0], skinClusterNode)
+                        infIndexList, count, weightList = self.dpUIinst.skin.getSkinWeightMatrix(meshList[0], skinClusterNode)[1:]
+                        infCount = len(infIndexList)
                         toPruneList = []
-                        # check low weights
-                        for v, weightDic in enumerate(weightsList):
-                            for w in weightDic.keys():
-                                if weightDic[w] < self.pruneMinValue:
-                                    toPruneList.append(v)
-                                    break
+                        # check low weights reading the bulk weight matrix
+                        if infCount:
+                            for v in range(0, count):
+                                for w in weightList[v*infCount:(v+1)*infCount]:
+                                    if w and w < self.pruneMinValue:
+                                        toPruneList.append(v)
+                                        break
                         # conditional to check here
                         if toPruneList:
                             self.checkedObjList.append(skinClusterNode)
@@ -9,7 +9,7 @@ DESCRIPTION = "v137_remapValueToSetRangeDesc"
 ICON = "/Icons/dp_remapValueToSetRange.png"
 WIKI = "07-‐-Validator#-remapvalue-to-setrange"
 
-DP_REMAPVALUETOSETRANGE_VERSION = 1.01
+DP_REMAPVALUETOSETRANGE_VERSION = 1.02
 
 
 class RemapValueToSetRange(dpBaseAction.ActionStartClass):
@@ -47,11 +47,11 @@ class RemapValueToSetRange(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type="remapValue")
             else:
-                toCheckList = cmds.ls(selection=False, type="remapValue")
+                toCheckList = self.sceneIndex.listNodes("remapValue")
             if toCheckList:
                 remapValueToChangeList = []
                 for item in toCheckList:
@@ -25,7 +25,7 @@ ATTR_TYPE = {
                 "doubleLinear" : 2
             }
 
-DP_RESETPOSE_VERSION = 1.05
+DP_RESETPOSE_VERSION = 1.06
 
 
 class ResetPose(dpBaseAction.ActionStartClass):
@@ -57,7 +57,7 @@ class ResetPose(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -9,7 +9,7 @@ DESCRIPTION = "v110_scalableDeformerCheckerDesc"
 ICON = "/Icons/dp_scalableDeformerChecker.png"
 WIKI = "07-‐-Validator#-scalable-deformer-checker"
 
-DP_SCALABLEDEFORMERCHECKER_VERSION = 1.01
+DP_SCALABLEDEFORMERCHECKER_VERSION = 1.02
 
 
 class ScalableDeformerChecker(dpBaseAction.ActionStartClass):
@@ -40,11 +40,11 @@ class ScalableDeformerChecker(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type=['skinCluster', 'deltaMush'])
+                toCheckList = self.sceneIndex.listNodes(['skinCluster', 'deltaMush'])
             if toCheckList:
                 optionCtrl = self.utils.getNodeByMessage("optionCtrl")
                 if optionCtrl:
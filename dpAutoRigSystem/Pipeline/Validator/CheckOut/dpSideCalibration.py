@@ -9,7 +9,7 @@ DESCRIPTION = "v045_sideCalibrationDesc"
 ICON = "/Icons/dp_sideCalibration.png"
 WIKI = "07-‐-Validator#-side-calibration"
 
-DP_SIDECALIBRATION_VERSION = 1.05
+DP_SIDECALIBRATION_VERSION = 1.06
 
 
 class SideCalibration(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class SideCalibration(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
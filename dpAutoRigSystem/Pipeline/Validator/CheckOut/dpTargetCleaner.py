@@ -11,7 +11,7 @@ WIKI = "07-‐-Validator#-blendshape-target-cleaner"
 
 DPKEEPITATTR = "dpKeepIt"
 
-DP_TARGETCLEANER_VERSION = 1.10
+DP_TARGETCLEANER_VERSION = 1.11
 
 
 class TargetCleaner(dpBaseAction.ActionStartClass):
@@ -41,12 +41,12 @@ class TargetCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
                 toCheckList = None
-                meshList = cmds.ls(selection=False, type='mesh')
+                meshList = self.sceneIndex.listNodes('mesh')
                 if meshList:
                     toCheckList = list(set(cmds.listRelatives(meshList, type="transform", parent=True, fullPath=False)))
             if toCheckList:
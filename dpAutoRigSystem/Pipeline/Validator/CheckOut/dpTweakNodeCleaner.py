@@ -9,7 +9,7 @@ DESCRIPTION = "v131_tweakNodeCleanerDesc"
 ICON = "/Icons/dp_tweakNodeCleaner.png"
 WIKI = "07-‐-Validator#-tweak-node-cleaner"
 
-DP_TWEAKNODECLEANER_VERSION = 1.02
+DP_TWEAKNODECLEANER_VERSION = 1.03
 
 
 class TweakNodeCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class TweakNodeCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = cmds.ls(objList, type='tweak')
             else:
-                toCheckList = cmds.ls(selection=False, type='tweak') #tweakNodes
+                toCheckList = self.sceneIndex.listNodes('tweak') #tweakNodes
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
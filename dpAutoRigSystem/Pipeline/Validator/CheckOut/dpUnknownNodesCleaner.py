@@ -9,7 +9,7 @@ DESCRIPTION = "v059_unknownNodesCleanerDesc"
 ICON = "/Icons/dp_unknownNodesCleaner.png"
 WIKI = "07-‐-Validator#-unknown-nodes-cleaner"
 
-DP_UNKNOWNNODESCLEANER_VERSION = 1.04
+DP_UNKNOWNNODESCLEANER_VERSION = 1.05
 
 
 class UnknownNodesCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class UnknownNodesCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type='unknown')
+                toCheckList = self.sceneIndex.listNodes('unknown')
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
@@ -9,7 +9,7 @@ DESCRIPTION = "v149_unusedDeformerCleanerDesc"
 ICON = "/Icons/dp_unusedDeformerCleaner.png"
 WIKI = "07-‐-Validator#-unused-deformer-cleaner"
 
-DP_UNUSEDDEFORMERCLEANER_VERSION = 1.00
+DP_UNUSEDDEFORMERCLEANER_VERSION = 1.01
 
 
 class UnusedDeformerCleaner(dpBaseAction.ActionStartClass):
@@ -41,7 +41,7 @@ class UnusedDeformerCleaner(dpBaseAction.ActionStartClass):
 
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             unusedList = []
             #cmds.findDeformers("*")
             deformerList = cmds.ls(type="geometryFilter") #deformers
@@ -10,7 +10,7 @@ DESCRIPTION = "v085_unusedNodeCleanerDesc"
 ICON = "/Icons/dp_unusedNodeCleaner.png"
 WIKI = "07-‐-Validator#-unused-node-cleaner"
 
-DP_UNUSEDNODECLEANER_VERSION = 1.04
+DP_UNUSEDNODECLEANER_VERSION = 1.05
 
 
 class UnusedNodeCleaner(dpBaseAction.ActionStartClass):
@@ -40,7 +40,7 @@ class UnusedNodeCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
@@ -9,7 +9,7 @@ DESCRIPTION = "v083_unusedSkinCleanerDesc"
 ICON = "/Icons/dp_unusedSkinCleaner.png"
 WIKI = "07-‐-Validator#-unused-skin-cleaner"
 
-DP_UNUSEDSKINCLEANER_VERSION = 1.04
+DP_UNUSEDSKINCLEANER_VERSION = 1.05
 
 
 class UnusedSkinCleaner(dpBaseAction.ActionStartClass):
@@ -39,11 +39,11 @@ class UnusedSkinCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             if objList:
                 toCheckList = objList
             else:
-                toCheckList = cmds.ls(selection=False, type="skinCluster")
+                toCheckList = self.sceneIndex.listNodes("skinCluster")
             if toCheckList:
                 self.utils.setProgress(max=len(toCheckList), addOne=False, addNumber=False)
                 for item in toCheckList:
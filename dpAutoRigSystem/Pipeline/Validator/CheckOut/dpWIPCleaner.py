@@ -9,7 +9,7 @@ DESCRIPTION = "v010_wipCleanerDesc"
 ICON = "/Icons/dp_wipCleaner.png"
 WIKI = "07-‐-Validator#-wip-cleaner"
 
-DP_WIPCLEANER_VERSION = 1.04
+DP_WIPCLEANER_VERSION = 1.05
 
 
 class WIPCleaner(dpBaseAction.ActionStartClass):
@@ -39,7 +39,7 @@ class WIPCleaner(dpBaseAction.ActionStartClass):
         
         # ---
         # --- validator code --- beginning
-        if not cmds.file(query=True, reference=True):
+        if not self.sceneIndex.isReferenced():
             wipGrp = None
             if objList:
                 wipGrp = objList
@@ -6,11 +6,23 @@ import json
 import time
 import shutil
 import stat
+import sys
+import zlib
+import mmap
+import hashlib
+from array import array
 
 PIPE_FOLDER = "_dpPipeline"
 DISCORD_URL = "https://discord.com/api/webhooks"
+COMPACT_KEY = "dpCompactData"
+COMPACT_EXTENSION = "dpbin"
+COMPACT_MAGIC = b"DPBIN001"
+COMPACT_MIN_SIZE = 8
+POINTER_KEY = "dpDataPointer"
+POINTER_EXTENSION = "dpptr"
+DATA_HASH_FILE = "dpDataHash.json"
 
-DP_PIPELINER_VERSION = 1.18
+DP_PIPELINER_VERSION = 1.22
 
 
 class Pipeliner(object):
@@ -58,6 +70,10 @@ class Pipeliner(object):
             dic = open(jsonPath, "r", encoding='utf-8')
             content = json.loads(dic.read())
             dic.close()
+            if isinstance(content, dict) and COMPACT_KEY in content.keys():
+                content = self.getCompactContent(content, jsonPath)
+            elif isinstance(content, dict) and POINTER_KEY in content.keys():
+                content = self.getJsonContent(self.resolveDataPointer(jsonPath))
         except:
             content = None
         return content
@@ -234,7 +250,8 @@ class Pipeliner(object):
         "b_i_wip"            : True,
         "b_i_publish"        : True,
         "b_i_date"           : True,
-        "b_i_degrade"        : True
+        "b_i_degrade"        : True,
+        "b_compactData"      : False
         }
         return defaultPipeInfo
 
@@ -312,7 +329,8 @@ class Pipeliner(object):
         "b_i_degrade"        : "i264_biDegradeAnn",
         "s_webhook"          : "i277_sWebhookAnn",
         "b_discord"          : "i278_bDiscordAnn",
-        "s_callback"         : "i284_sCallbackAnn"
+        "s_callback"         : "i284_sCallbackAnn",
+        "b_compactData"      : "i364_bCompactDataAnn"
         }
 
 
@@ -748,6 +766,169 @@ class Pipeliner(object):
             json.dump(dataDic, jsonFile, indent=indentation, sort_keys=sortKeys)
 
 
+    def getCompactSidecarPath(self, fileNamePath, *args):
+        """ Returns the binary sidecar file path related to the given json header file path.
+        """
+        return fileNamePath[:fileNamePath.rfind(".")]+"."+COMPACT_EXTENSION
+
+
+    def isCompactSidecar(self, fileName, *args):
+        """ Returns True if the given file name is a binary sidecar of a compact json file.
+        """
+        return fileName.endswith("."+COMPACT_EXTENSION)
+
+
+    def packCompactArray(self, typeCode, valueList, blockList, bufferList, *args):
+        """ Compress the given values as a little endian array and store it in the buffer list.
+            Returns the block index to be written in the json header.
+        """
+        data = array(typeCode, valueList)
+        if sys.byteorder == "big":
+            data.byteswap()
+        buffer = zlib.compress(data.tobytes())
+        offset = len(COMPACT_MAGIC)
+        if blockList:
+            offset = blockList[-1][1]+blockList[-1][2]
+        blockList.append([typeCode, offset, len(buffer), len(data)])
+        bufferList.append(buffer)
+        return len(blockList)-1
+
+
+    def isCompactNumber(self, value, *args):
+        """ Returns True if the given value can be stored as a float in the binary sidecar.
+        """
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+    def packCompactData(self, data, blockList, bufferList, keyList=None, packing=False, *args):
+        """ Walk in the given data to replace the weight structures by references to binary blocks.
+            Only the values of the dictionary keys in the given key list are packed, because the weights are stored as float32.
+            Sparse weights = dictionary with index keys and number values, as deformer weights.
+            Pair weights = list with an index list and a number list, as blendShape sparse target weights.
+            Row weights = list of dictionaries with name keys and number values, as skinCluster joint weights by vertex.
+            Any other data is kept as it is in the json header.
+        """
+        if isinstance(data, dict):
+            if packing and len(data) >= COMPACT_MIN_SIZE and all(str(k).isdigit() and self.isCompactNumber(v) for k, v in data.items()):
+                return {COMPACT_KEY : "sparse",
+                        "index"     : self.packCompactArray("I", [int(k) for k in data.keys()], blockList, bufferList),
+                        "value"     : self.packCompactArray("f", list(data.values()), blockList, bufferList)
+                        }
+            return dict((k, self.packCompactData(v, blockList, bufferList, keyList, packing or (bool(keyList) and k in keyList))) for k, v in data.items())
+        elif isinstance(data, list):
+            if not packing:
+                return data
+            if len(data) == 2 and all(isinstance(v, list) for v in data) and len(data[0]) == len(data[1]) and len(data[0]) >= COMPACT_MIN_SIZE and all(isinstance(i, int) and not isinstance(i, bool) and i >= 0 for i in data[0]) and all(self.isCompactNumber(v) for v in data[1]):
+                return {COMPACT_KEY : "pairs",
+                        "index"     : self.packCompactArray("I", data[0], blockList, bufferList),
+                        "value"     : self.packCompactArray("f", data[1], blockList, bufferList)
+                        }
+            if len(data) >= COMPACT_MIN_SIZE and all(r is None or (isinstance(r, dict) and all(self.isCompactNumber(v) for v in r.values())) for r in data):
+                nameDic, countList, nameIdList, valueList = {}, [], [], []
+                for row in data:
+                    if row is None:
+                        countList.append(-1)
+                    else:
+                        countList.append(len(row))
+                        for k, v in row.items():
+                            if not k in nameDic.keys():
+                                nameDic[k] = len(nameDic)
+                            nameIdList.append(nameDic[k])
+                            valueList.append(v)
+                return {COMPACT_KEY : "rows",
+                        "names"     : list(nameDic.keys()),
+                        "count"     : self.packCompactArray("i", countList, blockList, bufferList),
+                        "name"      : self.packCompactArray("I", nameIdList, blockList, bufferList),
+                        "value"     : self.packCompactArray("f", valueList, blockList, bufferList)
+                        }
+            return [self.packCompactData(v, blockList, bufferList, keyList, packing) for v in data]
+        return data
+
+
+    def unpackCompactArray(self, buffer, block, *args):
+        """ Read the block from the mapped sidecar buffer and return the uncompressed array.
+        """
+        typeCode, offset, size = block[:3]
+        data = array(typeCode)
+        data.frombytes(zlib.decompress(buffer[offset:offset+size]))
+        if sys.byteorder == "big":
+            data.byteswap()
+        return data
+
+
+    def unpackCompactData(self, data, blockList, buffer, *args):
+        """ Rebuild the original data from the json header structure and the mapped sidecar buffer.
+            Keys are returned as strings as we get them from a regular json file.
+        """
+        if isinstance(data, dict):
+            if COMPACT_KEY in data.keys():
+                if data[COMPACT_KEY] == "sparse":
+                    indexArray = self.unpackCompactArray(buffer, blockList[data["index"]])
+                    return dict(zip([str(i) for i in indexArray], self.unpackCompactArray(buffer, blockList[data["value"]]).tolist()))
+                elif data[COMPACT_KEY] == "pairs":
+                    return [self.unpackCompactArray(buffer, blockList[data["index"]]).tolist(), self.unpackCompactArray(buffer, blockList[data["value"]]).tolist()]
+                elif data[COMPACT_KEY] == "rows":
+                    nameList = data["names"]
+                    nameIdArray = self.unpackCompactArray(buffer, blockList[data["name"]])
+                    valueList = self.unpackCompactArray(buffer, blockList[data["value"]]).tolist()
+                    rowList, i = [], 0
+                    for count in self.unpackCompactArray(buffer, blockList[data["count"]]):
+                        if count < 0:
+                            rowList.append(None)
+                        else:
+                            rowList.append(dict((nameList[nameIdArray[j]], valueList[j]) for j in range(i, i+count)))
+                            i += count
+                    return rowList
+            return dict((k, self.unpackCompactData(v, blockList, buffer)) for k, v in data.items())
+        elif isinstance(data, list):
+            return [self.unpackCompactData(v, blockList, buffer) for v in data]
+        return data
+
+
+    def saveCompactJsonFile(self, dataDic, fileNamePath, keyList=None, *args):
+        """ Save the given data dic as a small json header with the weight values in a compressed binary sidecar file.
+            Only the weights found in the values of the given dictionary keys are stored in the sidecar, the other data stays exact in the header.
+            The sidecar stores float32 sparse index/value arrays as independent zlib blocks to be read from a memory mapped file.
+        """
+        blockList, bufferList = [], []
+        headerDic = self.packCompactData(dataDic, blockList, bufferList, keyList)
+        sidecarPath = self.getCompactSidecarPath(fileNamePath)
+        with open(sidecarPath, 'wb') as binFile:
+            binFile.write(COMPACT_MAGIC)
+            for buffer in bufferList:
+                binFile.write(buffer)
+        self.saveJsonFile({COMPACT_KEY : {"version" : 1, "sidecar" : os.path.basename(sidecarPath), "blocks" : blockList}, "data" : headerDic}, fileNamePath, indentation=None)
+
+
+    def copyCompactSidecar(self, sourceFile, destFile, *args):
+        """ Copy the binary sidecar of the given compact json header file beside the copied header and rename it in the header.
+            Nothing is done for a regular json file.
+        """
+        with open(sourceFile, "r", encoding="utf-8") as jsonFile:
+            headerDic = json.loads(jsonFile.read())
+        if isinstance(headerDic, dict) and COMPACT_KEY in headerDic.keys():
+            sidecarPath = self.getCompactSidecarPath(destFile)
+            shutil.copy2(os.path.dirname(sourceFile)+"/"+headerDic[COMPACT_KEY]["sidecar"], sidecarPath)
+            headerDic[COMPACT_KEY]["sidecar"] = os.path.basename(sidecarPath)
+            self.saveJsonFile(headerDic, destFile, indentation=None)
+
+
+    def getCompactContent(self, headerDic, jsonPath, *args):
+        """ Read the binary sidecar file of the given compact json header and return the full data dictionary.
+        """
+        blockList = headerDic[COMPACT_KEY]["blocks"]
+        if not blockList:
+            return headerDic["data"]
+        with open(os.path.dirname(jsonPath)+"/"+headerDic[COMPACT_KEY]["sidecar"], 'rb') as binFile:
+            buffer = mmap.mmap(binFile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if not buffer[:len(COMPACT_MAGIC)] == COMPACT_MAGIC:
+                    return None
+                return self.unpackCompactData(headerDic["data"], blockList, buffer)
+            finally:
+                buffer.close()
+
+
     def defineFileVersion(self, assetNameList, *args):
         """ Return the max number plus one of a versioned files list.
         """
@@ -985,7 +1166,11 @@ class Pipeliner(object):
                     if latestFile:
                         savedScene = self.utils.checkSavedScene()
                         if not savedScene:
-                            savedScene = self.userSaveThisScene(False)
+                            policy = self.dpUIinst.getDialogPolicy("unsavedScene", "continue")
+                            if policy:
+                                savedScene = policy == "continue"
+                            else:
+                                savedScene = self.userSaveThisScene(False)
                         if savedScene:
                             self.dpUIinst.rebuilding = False
                             cmds.file(assetFolder+"/"+latestFile, open=True, ignoreVersion=True, force=True)
@@ -1284,11 +1469,14 @@ class Pipeliner(object):
                                 os.remove(destPath+"/"+destFile)
                     else:
                         self.makeDirIfNotExists(destPath)
-                    sourceItem = next(os.walk(sourcePath))[2][-1]
+                    sourceItem = sorted([f for f in next(os.walk(sourcePath))[2] if not self.isDataHashIndex(f) and not self.isCompactSidecar(f)])[-1]
+                    sourceItem = os.path.basename(self.resolveDataPointer(sourcePath+"/"+sourceItem))
                     ext = sourceItem[sourceItem.rfind("."):]
                     prefix = sourceItem[:sourceItem.find("_")+1]
                     destItem = destPath+"/"+prefix+self.pipeData['assetName']+self.pipeData['s_model']+"0".zfill(self.pipeData['i_padding'])+self.pipeData['s_rig']+"0".zfill(self.pipeData['i_padding'])+ext
                     shutil.copy2(sourcePath+"/"+sourceItem, destItem)
+                    if ext == ".json":
+                        self.copyCompactSidecar(sourcePath+"/"+sourceItem, destItem)
             # Concatenate done message
             sucessMessageText = self.dpUIinst.lang['r068_replacedDataSuccess']+"\n\n"+self.dpUIinst.lang['i036_from']+": "+path+"\n"+self.dpUIinst.lang['i037_to']+": "+self.pipeData['assetName']+"\n\n"+" \n".join(toReplaceList)
             cmds.confirmDialog(title="dpAutoRigSystem", message=sucessMessageText, button="Ok")
@@ -1326,3 +1514,93 @@ class Pipeliner(object):
                 cmds.file(rename=cmds.file(query=True, sceneName=True))
                 ext = cmds.file(type=True, query=True)[0]
                 return cmds.file(save=True, type=ext)
+
+
+    def getDataHash(self, data, *args):
+        """ Returns the sha1 hash of the given data as a sorted json string or None if it can't be serialized.
+        """
+        try:
+            return hashlib.sha1(json.dumps(data, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        except (TypeError, ValueError):
+            return None
+
+
+    def getDataPointerPath(self, fileNamePath, *args):
+        """ Returns the pointer file path of the given data file path.
+        """
+        return fileNamePath+"."+POINTER_EXTENSION
+
+
+    def isDataPointer(self, fileName, *args):
+        """ Returns True if the given file name is a pointer to an older exported data file with the same content.
+        """
+        return fileName.endswith("."+POINTER_EXTENSION)
+
+
+    def isDataHashIndex(self, fileName, *args):
+        """ Returns True if the given file name is the data hash index of an exported data folder.
+        """
+        return os.path.basename(fileName) == DATA_HASH_FILE
+
+
+    def getDataHashDic(self, folder, *args):
+        """ Returns the dictionary with the exported data file names as keys and their content hash as values.
+        """
+        hashDic = None
+        if os.path.exists(folder+"/"+DATA_HASH_FILE):
+            hashDic = self.getJsonContent(folder+"/"+DATA_HASH_FILE)
+        return hashDic or {}
+
+
+    def recordDataHash(self, fileNamePath, dataHash, *args):
+        """ Store the content hash of the given written data file in the folder hash index.
+            Also remove an old pointer file with the same name as it was replaced by the real data file.
+        """
+        if dataHash:
+            folder = os.path.dirname(fileNamePath)
+            hashDic = self.getDataHashDic(folder)
+            hashDic[os.path.basename(fileNamePath)] = dataHash
+            self.saveJsonFile(hashDic, folder+"/"+DATA_HASH_FILE)
+        pointerPath = self.getDataPointerPath(fileNamePath)
+        if os.path.exists(pointerPath):
+            os.remove(pointerPath)
+
+
+    def saveDataPointer(self, fileNamePath, dataFileName, dataHash, *args):
+        """ Save a pointer file for the given data file path instead of writing the same content again.
+        """
+        self.saveJsonFile({POINTER_KEY : {"file" : dataFileName, "hash" : dataHash}}, self.getDataPointerPath(fileNamePath))
+
+
+    def resolveDataPointer(self, filePath, *args):
+        """ Returns the real data file path of the given file path, reading it if it's a pointer file.
+        """
+        if self.isDataPointer(filePath):
+            try:
+                with open(filePath, "r", encoding='utf-8') as pointerFile:
+                    pointerDic = json.loads(pointerFile.read())
+                return os.path.dirname(filePath)+"/"+pointerDic[POINTER_KEY]["file"]
+            except:
+                pass
+        return filePath
+
+
+    def findSameDataFile(self, fileNamePath, prefix, dataHash, *args):
+        """ Returns the name of the data file with the same content of the given hash, or None if the content must be written.
+            It checks the given file if it already exists, otherwise the latest exported file with the same prefix and extension.
+        """
+        folder, fileName = os.path.split(fileNamePath)
+        if not dataHash or not os.path.exists(folder):
+            return None
+        hashDic = self.getDataHashDic(folder)
+        if os.path.exists(fileNamePath):
+            if hashDic.get(fileName) == dataHash:
+                return fileName
+            return None
+        extension = fileName[fileName.rfind("."):]
+        candidateList = sorted([f for f in next(os.walk(folder))[2] if f.startswith(prefix) and (f.endswith(extension) or f.endswith(extension+"."+POINTER_EXTENSION))])
+        if candidateList:
+            dataPath = self.resolveDataPointer(folder+"/"+candidateList[-1])
+            if os.path.exists(dataPath) and hashDic.get(os.path.basename(dataPath)) == dataHash:
+                return os.path.basename(dataPath)
+        return None
@@ -4,7 +4,7 @@ from maya import mel
 from functools import partial
 import os
 
-DP_PUBLISHER_VERSION = 1.12
+DP_PUBLISHER_VERSION = 1.14
 
 
 class Publisher(object):
@@ -112,13 +112,14 @@ class Publisher(object):
 
     def runCheckedValidators(self, firstMode=True, stopIfFoundBlock=True, publishLog=None, *args):
         """ Run the verify of fix of checked validators.
+            Without interface the log window isn't shown, but the log is still exported.
         """
         toCheckValidatorList = self.dpUIinst.checkAddOnsInstanceList.copy()
         toCheckValidatorList.extend(self.dpUIinst.checkInInstanceList)
         toCheckValidatorList.extend(self.dpUIinst.checkOutInstanceList)
         toCheckValidatorList.extend(self.dpUIinst.checkFinishingInstanceList)
         if toCheckValidatorList:
-            validationResultDataList = self.dpUIinst.runSelectedActions(toCheckValidatorList, firstMode, True, stopIfFoundBlock, publishLog)
+            validationResultDataList = self.dpUIinst.runSelectedActions(toCheckValidatorList, firstMode, not self.dpUIinst.headless, stopIfFoundBlock, publishLog, batchMode=self.dpUIinst.headless, exportLog=True)
             if validationResultDataList[1]: #found issue
                 stoppedMessage = self.dpUIinst.lang['v020_publishStopped']+" "+toCheckValidatorList[validationResultDataList[2]].guideModuleName                    
                 return stoppedMessage
@@ -151,6 +152,8 @@ class Publisher(object):
             - packaging the delivered files as toClient zipFile, toCloud dropbox, toHist folders
             - generate the image preview
             If it fails, it'll reopen the current file without save any change and returns False.
+            Returns True if it was published.
+            Without interface the image preview, open folder and windows are skipped.
         """
         if self.pipeliner.pipeData['publishPath']:
             # Starting progress window
@@ -239,7 +242,7 @@ class Publisher(object):
                         self.pipeliner.mountPackagePath()
                         if self.pipeliner.pipeData['toClientPath']:
                             # rigging preview image
-                            if self.pipeliner.pipeData['b_imager']:
+                            if self.pipeliner.pipeData['b_imager'] and not self.dpUIinst.headless:
                                 self.pipeliner.pipeData['imagePreviewPath'] = self.packager.imager(self.pipeliner.pipeData, builtVersion, self.pipeliner.getToday())
                                 self.utils.setProgress(endIt=True)
                                 self.utils.setProgress(self.dpUIinst.lang['i225_savingFile']+"...", self.publisherName, 8, addOne=False, addNumber=False)
@@ -262,8 +265,9 @@ class Publisher(object):
                                 if self.pipeliner.pipeData['dropboxPath']:
                                     self.packager.toDropbox(zipFile, self.pipeliner.pipeData['dropboxPath'])
                             # open folder
-                            self.utils.setProgress(self.dpUIinst.lang['i226_exportFiles']+"... Folder openning", addNumber=False)
-                            self.packager.openFolder(self.pipeliner.pipeData['toClientPath'])
+                            if not self.dpUIinst.headless:
+                                self.utils.setProgress(self.dpUIinst.lang['i226_exportFiles']+"... Folder openning", addNumber=False)
+                                self.packager.openFolder(self.pipeliner.pipeData['toClientPath'])
                         # hist
                         if self.pipeliner.pipeData['historyPath']:
                             self.utils.setProgress(self.dpUIinst.lang['i226_exportFiles']+"... dpHist", addNumber=False)
@@ -289,11 +293,13 @@ class Publisher(object):
                                 print("Callback result =", callbackResult)
 
                     # publisher log window
-                    self.successPublishedWindow(publishFileName)
-                    self.utils.setProgress(endIt=True)
-                    self.utils.closeUI('dpPublisherWindow')
+                    if not self.dpUIinst.headless:
+                        self.successPublishedWindow(publishFileName)
+                        self.utils.setProgress(endIt=True)
+                        self.utils.closeUI('dpPublisherWindow')
                     if fromUI:
                         self.askUserChooseFile(publishFileName)
+                    return True
 
             else:
                 mel.eval('warning \"'+self.dpUIinst.lang['v021_noFileName']+'\";')
@@ -309,9 +315,13 @@ class Publisher(object):
             Warning the raison of the error.
         """
         self.utils.setProgress(endIt=True)
-        self.utils.closeUI('dpPublisherWindow')
         # reopen current file
         cmds.file(self.pipeliner.pipeData['sceneName'], open=True, force=True)
+        if self.dpUIinst.headless:
+            if raison:
+                print(raison)
+            return
+        self.utils.closeUI('dpPublisherWindow')
         # report the error in a log window
         if raison:
             self.dpUIinst.logger.infoWin('i019_log', 'i216_publish', raison, "left", 250, 150)
@@ -0,0 +1,436 @@
+# importing libraries:
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+
+# global variables to this module:
+EXIT_OK = 0
+EXIT_ISSUES = 1
+EXIT_FAILED = 2
+EXIT_USAGE = 3
+
+ACTION_MODE_DIC = {
+                    "verify" : ["v000_validator", True],
+                    "fix"    : ["v000_validator", False],
+                    "export" : ["r000_rebuilder", True],
+                    "import" : ["r000_rebuilder", False]
+                    }
+POLICY_DIC = {
+                "duplicatedNames" : ["abort", "continue"],
+                "guideVersion"    : ["rig", "update", "cancel"],
+                "unsavedScene"    : ["continue", "cancel"]
+                }
+
+DP_BATCH_VERSION = 1.03
+
+
+class Batch(object):
+    def __init__(self, language=None, policyDic=None, *args):
+        """ Initialize the dpAutoRigSystem without interface to run validators and rebuilders in mayapy.
+        """
+        self.initializeMaya()
+        # the module imports need to find the dpAutoRigSystem parent folder in the PYTHONPATH
+        parentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        if not parentPath in os.environ.get("PYTHONPATH", "").split(os.pathsep):
+            os.environ["PYTHONPATH"] = parentPath+os.pathsep+os.environ.get("PYTHONPATH", "")
+        if not parentPath in sys.path:
+            sys.path.append(parentPath)
+        from dpAutoRigSystem import dpAutoRig
+        self.dpUIinst = dpAutoRig.Start()
+        self.dpUIinst.headless = True
+        self.dpUIinst.startHeadless(language)
+        if policyDic:
+            self.dpUIinst.dialogPolicyDic.update(policyDic)
+
+
+    def initializeMaya(self, *args):
+        """ Start the Maya standalone session if we aren't running inside of Maya.
+        """
+        try:
+            from maya import cmds
+            cmds.about(batch=True)
+        except:
+            from maya import standalone
+            standalone.initialize(name="python")
+
+
+    def getActionInstanceList(self, actionType, *args):
+        """ Returns the loaded validator or rebuilder instances for the given action type.
+        """
+        if actionType == "r000_rebuilder":
+            return self.dpUIinst.rebuilderInstanceList
+        return self.dpUIinst.checkAddOnsInstanceList + self.dpUIinst.checkInInstanceList + self.dpUIinst.checkOutInstanceList + self.dpUIinst.checkFinishingInstanceList
+
+
+    def getPresetDic(self, preset, *args):
+        """ Returns the preset dictionary from the given validator preset name or json file path.
+        """
+        if preset in self.dpUIinst.validatorPresetDic.keys():
+            return self.dpUIinst.validatorPresetDic[preset]
+        if os.path.isfile(preset):
+            return self.dpUIinst.pipeliner.getJsonContent(preset)
+
+
+    def setActiveModules(self, actionInstList, preset=None, moduleList=None, *args):
+        """ Activate the action instances by the given preset or module name list.
+            Without preset or module list all actions are active.
+            Returns the not found module names.
+        """
+        notFoundList = []
+        self.dpUIinst.changeActiveAllModules(actionInstList, not (preset or moduleList))
+        if preset:
+            presetDic = self.getPresetDic(preset)
+            if not presetDic:
+                return [preset]
+            self.dpUIinst.applyActionPreset(presetDic, actionInstList)
+        if moduleList:
+            nameList = [a.guideModuleName for a in actionInstList]
+            for moduleName in moduleList:
+                if moduleName in nameList:
+                    actionInstList[nameList.index(moduleName)].changeActive(True)
+                else:
+                    notFoundList.append(moduleName)
+        return notFoundList
+
+
+    def getSceneStatus(self, actionResultData, *args):
+        """ Returns the scene status and the summary of the action results.
+        """
+        status = "ok"
+        summaryDic = {}
+        for actionName, actionDic in actionResultData.items():
+            if actionName in ["dpProfile", "Publisher"]:
+                continue
+            summaryDic[actionName] = {
+                                        "foundIssue" : True in actionDic["foundIssueList"],
+                                        "resultOk"   : not False in actionDic["resultOkList"],
+                                        "messages"   : actionDic["messageList"]
+                                        }
+            if summaryDic[actionName]["foundIssue"] or not summaryDic[actionName]["resultOk"]:
+                status = "issues"
+        return status, summaryDic
+
+
+    def runScene(self, scene, action="verify", preset=None, moduleList=None, save=False, stopIfFoundBlock=False, *args):
+        """ Open the given scene file and run the active actions in the given mode.
+            Returns the result dictionary of this scene.
+        """
+        from maya import cmds
+        actionType, firstMode = ACTION_MODE_DIC[action]
+        resultDic = {"scene" : scene, "action" : action, "status" : "failed", "error" : None, "actions" : {}}
+        startTime = time.time()
+        try:
+            cmds.file(scene, open=True, force=True, prompt=False)
+            self.dpUIinst.pipeliner.refreshAssetData()
+            actionInstList = self.getActionInstanceList(actionType)
+            notFoundList = self.setActiveModules(actionInstList, preset, moduleList)
+            if notFoundList:
+                resultDic["error"] = self.dpUIinst.lang['i062_notFound']+": "+", ".join(notFoundList)
+            else:
+                runResult = self.dpUIinst.runSelectedActions(actionInstList, firstMode, verbose=False, stopIfFoundBlock=stopIfFoundBlock, actionType=actionType, batchMode=True, exportLog=True)
+                if runResult:
+                    resultDic["status"], resultDic["actions"] = self.getSceneStatus(runResult[0])
+                    if runResult[1]:
+                        resultDic["status"] = "blocked"
+                    if "dpProfile" in runResult[0].keys():
+                        resultDic["time"] = runResult[0]["dpProfile"]["time"]
+                    if save:
+                        cmds.file(save=True, force=True)
+                else:
+                    resultDic["error"] = "aborted by policy"
+        except Exception as e:
+            resultDic["error"] = str(e)
+        resultDic["elapsed"] = round(time.time()-startTime, 3)
+        return resultDic
+
+
+    def run(self, sceneList, action="verify", preset=None, moduleList=None, save=False, stopIfFoundBlock=False, *args):
+        """ Run the batch for each given scene file.
+            Returns the result dictionary and the exit code.
+        """
+        resultDic = {"dpARVersion" : self.dpUIinst.dpARVersion, "batchVersion" : DP_BATCH_VERSION, "action" : action, "preset" : preset, "modules" : moduleList, "scenes" : []}
+        exitCode = EXIT_OK
+        for scene in sceneList:
+            sceneResultDic = self.runScene(scene, action, preset, moduleList, save, stopIfFoundBlock)
+            resultDic["scenes"].append(sceneResultDic)
+            if sceneResultDic["status"] == "failed":
+                exitCode = EXIT_FAILED
+            elif not sceneResultDic["status"] == "ok" and exitCode == EXIT_OK:
+                exitCode = EXIT_ISSUES
+        resultDic["exitCode"] = exitCode
+        return resultDic, exitCode
+
+
+    def publishAsset(self, path, asset, comments=None, preset=None, *args):
+        """ Open the latest wip file of the given asset and publish it running the validators in fix mode and packaging it.
+            The validators are activated by the given preset or by the first validator preset, the same one selected by default in the interface.
+            It fails without publishing if the latest wip file wasn't opened, to not publish the scene that was already open.
+            Returns the result dictionary of this asset.
+        """
+        from maya import cmds
+        resultDic = {"asset" : asset, "status" : "failed", "published" : None, "error" : None}
+        startTime = time.time()
+        try:
+            assetFolder = path+"/"+asset
+            latestFile = None
+            if os.path.isdir(assetFolder):
+                latestFile = self.dpUIinst.pipeliner.getLatestFile(assetFolder)
+            if not latestFile:
+                resultDic["error"] = self.dpUIinst.lang['i351_notFoundWIPAssets']+" "+assetFolder
+                resultDic["elapsed"] = round(time.time()-startTime, 3)
+                return resultDic
+            self.dpUIinst.pipeliner.loadAsset(path, asset)
+            openedScene = cmds.file(query=True, sceneName=True)
+            if not openedScene or not os.path.normcase(os.path.normpath(openedScene)) == os.path.normcase(os.path.normpath(assetFolder+"/"+latestFile)):
+                resultDic["error"] = self.dpUIinst.lang['i062_notFound']+": "+assetFolder+"/"+latestFile
+                resultDic["elapsed"] = round(time.time()-startTime, 3)
+                return resultDic
+            self.dpUIinst.pipeliner.refreshAssetData()
+            if not preset and self.dpUIinst.validatorPresetList:
+                preset = self.dpUIinst.validatorPresetList[0]
+            if preset:
+                notFoundList = self.setActiveModules(self.getActionInstanceList("v000_validator"), preset)
+                if notFoundList:
+                    resultDic["error"] = self.dpUIinst.lang['i062_notFound']+": "+", ".join(notFoundList)
+                    resultDic["elapsed"] = round(time.time()-startTime, 3)
+                    return resultDic
+            if not comments:
+                comments = self.dpUIinst.lang['m046_publisher']
+            if self.dpUIinst.publisher.runPublishing(fromUI=False, comments=self.dpUIinst.lang['i358_batch']+" - "+comments) == True:
+                resultDic["status"] = "ok"
+                resultDic["published"] = self.dpUIinst.pipeliner.pipeData['publishPath']+"/"+self.dpUIinst.pipeliner.pipeData['publishFileName']
+            else:
+                resultDic["error"] = self.dpUIinst.lang['v020_publishStopped']
+        except Exception as e:
+            resultDic["error"] = str(e)
+        resultDic["elapsed"] = round(time.time()-startTime, 3)
+        return resultDic
+
+
+class PublishPool(object):
+    def __init__(self, path, assetList, comments=None, workers=2, licenses=None, timeout=3600, retries=1, mayapy=None, language=None, preset=None, *args):
+        """ Distribute the asset publishing to a pool of mayapy worker processes.
+            It doesn't need Maya running here, each worker is a new mayapy process running this module in worker mode.
+            The number of concurrent workers is limited by the licenses cap if it's given.
+        """
+        self.path = path
+        self.assetList = assetList
+        self.comments = comments
+        self.poolSize = max(1, workers)
+        if licenses:
+            self.poolSize = max(1, min(self.poolSize, licenses))
+        self.timeout = timeout
+        self.retries = retries
+        self.mayapy = mayapy or sys.executable
+        self.language = language
+        self.preset = preset
+        self.parentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+    def startWorker(self, asset, attempt, *args):
+        """ Start a mayapy process to publish the given asset and return its running data.
+        """
+        outputFile = os.path.join(tempfile.gettempdir(), "dpBatchPublish_"+str(os.getpid())+"_"+asset+"_"+str(attempt)+".json")
+        cmdList = [self.mayapy, "-m", "dpAutoRigSystem.batch", "--worker", "--publishPath", self.path, "--assets", asset, "--output", outputFile]
+        if self.comments:
+            cmdList.extend(["--comments", self.comments])
+        if self.language:
+            cmdList.extend(["--language", self.language])
+        if self.preset:
+            cmdList.extend(["--preset", self.preset])
+        env = os.environ.copy()
+        env["PYTHONPATH"] = self.parentPath+os.pathsep+env.get("PYTHONPATH", "")
+        process = subprocess.Popen(cmdList, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return {"asset" : asset, "attempt" : attempt, "process" : process, "output" : outputFile, "start" : time.time()}
+
+
+    def getWorkerResult(self, worker, timedOut=False, *args):
+        """ Read the result dictionary written by the finished worker process.
+        """
+        resultDic = {"asset" : worker["asset"], "status" : "failed", "published" : None, "error" : None}
+        if timedOut:
+            resultDic["error"] = "timeout after "+str(self.timeout)+"s"
+        elif os.path.exists(worker["output"]):
+            try:
+                with open(worker["output"], "r", encoding="utf-8") as jsonFile:
+                    resultDic = json.load(jsonFile)["assets"][0]
+            except Exception as e:
+                resultDic["error"] = str(e)
+        else:
+            resultDic["error"] = "worker exit code "+str(worker["process"].returncode)
+        if os.path.exists(worker["output"]):
+            os.remove(worker["output"])
+        resultDic["attempt"] = worker["attempt"]
+        resultDic["elapsed"] = round(time.time()-worker["start"], 3)
+        return resultDic
+
+
+    def run(self, verbose=True, *args):
+        """ Run the asset queue in the worker pool retrying the failed assets.
+            Returns the aggregated result dictionary and the exit code.
+        """
+        startTime = time.time()
+        queueList = [[asset, 1] for asset in self.assetList]
+        runningList = []
+        resultDic = {}
+        while queueList or runningList:
+            while queueList and len(runningList) < self.poolSize:
+                asset, attempt = queueList.pop(0)
+                runningList.append(self.startWorker(asset, attempt))
+            time.sleep(1)
+            for worker in list(runningList):
+                timedOut = False
+                if worker["process"].poll() == None:
+                    if time.time()-worker["start"] < self.timeout:
+                        continue
+                    worker["process"].kill()
+                    worker["process"].wait()
+                    timedOut = True
+                runningList.remove(worker)
+                workerResultDic = self.getWorkerResult(worker, timedOut)
+                resultDic[worker["asset"]] = workerResultDic
+                if not workerResultDic["status"] == "ok" and worker["attempt"] <= self.retries:
+                    queueList.append([worker["asset"], worker["attempt"]+1])
+                if verbose:
+                    print(worker["asset"], workerResultDic["status"], workerResultDic["error"] or workerResultDic["published"])
+        assetResultList = [resultDic[asset] for asset in self.assetList]
+        exitCode = EXIT_OK
+        if [r for r in assetResultList if not r["status"] == "ok"]:
+            exitCode = EXIT_FAILED
+        reportDic = {"batchVersion" : DP_BATCH_VERSION, "path" : self.path, "workers" : self.poolSize, "timeout" : self.timeout, "retries" : self.retries, "elapsed" : round(time.time()-startTime, 3), "assets" : assetResultList, "exitCode" : exitCode}
+        reportDic["logFile"] = self.exportReport(reportDic)
+        return reportDic, exitCode
+
+
+    def exportReport(self, reportDic, *args):
+        """ Write the aggregated publishing report as a dpLog json file in the dpData/dpLog folder of the given wip path.
+        """
+        logFolder = self.path+"/dpData/dpLog"
+        try:
+            if not os.path.exists(logFolder):
+                os.makedirs(logFolder)
+            logFile = logFolder+"/dpLog_dpBatchPublish_"+time.strftime("%Y-%m-%d_%H-%M-%S", time.localtime())+".json"
+            with open(logFile, "w") as jsonFile:
+                json.dump(reportDic, jsonFile, indent=4)
+            return logFile
+        except Exception as e:
+            print(e)
+
+
+def getArgParser():
+    """ Returns the command line argument parser.
+    """
+    parser = argparse.ArgumentParser(prog="dpAutoRigSystem.batch", description="Run dpAutoRigSystem validators or rebuilders without interface in the given scene files.")
+    parser.add_argument("scenes", nargs="*", help="Maya scene files to process.")
+    parser.add_argument("--sceneList", help="Text file with one scene file path by line.")
+    parser.add_argument("--action", choices=sorted(ACTION_MODE_DIC.keys()), default="verify", help="verify or fix for validators, export or import for rebuilders.")
+    parser.add_argument("--preset", help="Validator preset name or json file path with the module names to activate, also used to publish.")
+    parser.add_argument("--modules", help="Comma separated module class names to activate.")
+    parser.add_argument("--language", default="English", help="Language used in the messages.")
+    parser.add_argument("--policy", action="append", default=[], help="Dialog answer as key=value: "+", ".join([k+"="+"|".join(v) for k, v in POLICY_DIC.items()]))
+    parser.add_argument("--save", action="store_true", help="Save each scene after running the actions.")
+    parser.add_argument("--stopIfBlocked", action="store_true", help="Stop running the actions of a scene if one of them is blocked.")
+    parser.add_argument("--output", help="Json file to write the results, otherwise print them.")
+    parser.add_argument("--publishPath", help="Wip path of the assets to publish instead of running actions in scenes.")
+    parser.add_argument("--assets", help="Comma separated asset names to publish, all assets in the publishPath by default.")
+    parser.add_argument("--comments", help="Publishing comments.")
+    parser.add_argument("--workers", type=int, default=2, help="Number of mayapy worker processes to publish.")
+    parser.add_argument("--licenses", type=int, help="Maximum number of concurrent Maya licenses used by the workers.")
+    parser.add_argument("--timeout", type=int, default=3600, help="Seconds to wait for each asset publishing.")
+    parser.add_argument("--retries", type=int, default=1, help="Number of retries for each failed asset.")
+    parser.add_argument("--mayapy", help="mayapy executable used by the workers, the current Python executable by default.")
+    parser.add_argument("--worker", action="store_true", help="Publish the given assets in this process.")
+    return parser
+
+
+def getPolicyDic(policyList):
+    """ Returns the dialog policy dictionary from the key=value list or raises ValueError if it isn't valid.
+    """
+    policyDic = {}
+    for policy in policyList:
+        key, _, value = policy.partition("=")
+        if not key in POLICY_DIC.keys() or not value in POLICY_DIC[key]:
+            raise ValueError("invalid policy: "+policy)
+        policyDic[key] = value
+    return policyDic
+
+
+def writeResult(resultDic, output=None):
+    """ Write the result dictionary in the output json file or print it.
+    """
+    if output:
+        with open(output, "w") as jsonFile:
+            json.dump(resultDic, jsonFile, indent=4)
+    else:
+        print(json.dumps(resultDic, indent=4))
+
+
+def runPublish(args):
+    """ Publish the assets of the wip path in this process when it's a worker or distribute them to a worker pool.
+        Returns the exit code.
+    """
+    if not os.path.exists(args.publishPath):
+        print(json.dumps({"exitCode" : EXIT_USAGE, "error" : "not found "+args.publishPath}, indent=4))
+        return EXIT_USAGE
+    if args.assets:
+        assetList = [a.strip() for a in args.assets.split(",") if a.strip()]
+    else:
+        assetList = sorted([f for f in next(os.walk(args.publishPath))[1] if not f == "dpData"])
+    if args.worker:
+        try:
+            batch = Batch(args.language, {"unsavedScene" : "continue"})
+        except Exception as e:
+            print(json.dumps({"exitCode" : EXIT_USAGE, "error" : str(e)}, indent=4))
+            return EXIT_USAGE
+        resultDic = {"batchVersion" : DP_BATCH_VERSION, "path" : args.publishPath, "assets" : [], "exitCode" : EXIT_OK}
+        for asset in assetList:
+            resultDic["assets"].append(batch.publishAsset(args.publishPath, asset, args.comments, args.preset))
+            if not resultDic["assets"][-1]["status"] == "ok":
+                resultDic["exitCode"] = EXIT_FAILED
+        writeResult(resultDic, args.output)
+        return resultDic["exitCode"]
+    pool = PublishPool(args.publishPath, assetList, args.comments, args.workers, args.licenses, args.timeout, args.retries, args.mayapy, args.language, args.preset)
+    resultDic, exitCode = pool.run()
+    writeResult(resultDic, args.output)
+    return exitCode
+
+
+def main(argList=None):
+    """ Command line entry point.
+        Returns the exit code:
+            0 = all scenes ran well
+            1 = found issues or not well done results
+            2 = a scene failed to open or run
+            3 = wrong arguments or initialization failure
+    """
+    parser = getArgParser()
+    args = parser.parse_args(argList)
+    if args.publishPath:
+        return runPublish(args)
+    sceneList = list(args.scenes)
+    if args.sceneList:
+        with open(args.sceneList, "r", encoding="utf-8") as sceneFile:
+            sceneList.extend([line.strip() for line in sceneFile.readlines() if line.strip()])
+    if not sceneList:
+        parser.print_usage()
+        return EXIT_USAGE
+    try:
+        policyDic = getPolicyDic(args.policy)
+        batch = Batch(args.language, policyDic)
+    except Exception as e:
+        print(json.dumps({"exitCode" : EXIT_USAGE, "error" : str(e)}, indent=4))
+        return EXIT_USAGE
+    moduleList = None
+    if args.modules:
+        moduleList = [m.strip() for m in args.modules.split(",") if m.strip()]
+    resultDic, exitCode = batch.run(sceneList, args.action, args.preset, moduleList, args.save, args.stopIfBlocked)
+    writeResult(resultDic, args.output)
+    return exitCode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
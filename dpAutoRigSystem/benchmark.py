@@ -0,0 +1,356 @@
+# importing libraries:
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import traceback
+import subprocess
+import contextlib
+from functools import wraps
+
+# global variables to this module:
+EXIT_OK = 0
+EXIT_REGRESSION = 1
+EXIT_FAILED = 2
+EXIT_USAGE = 3
+
+# Start methods timed as startup phases, the key argument index splits the phase by the given folder or mode:
+PHASE_DIC = {
+                "dpARLoadingWindow"  : None,
+                "loadVariables"      : None,
+                "startHeadless"      : None,
+                "mainUI"             : None,
+                "getJsonFileInfo"    : 0,
+                "startGuideModules"  : 0,
+                "createGuideButton"  : None,
+                "autoCheckOptionVar" : 2,
+                "checkForUpdate"     : None,
+                "refreshMainUI"      : None,
+                "startScriptJobs"    : None
+            }
+# library class methods timed as startup phases by module and class name, the phase is named by the class and method:
+LIBRARY_PHASE_DIC = {
+                "dpLanguageCache.LanguageCache" : {"getLanguageInfo" : None, "loadLanguage" : 0}
+            }
+NETWORK_METHOD_LIST = ["checkForUpdate", "getLocalData", "checkTermsAndCond"]
+
+DP_BENCHMARK_VERSION = 1.02
+
+
+def installStubMaya():
+    """ Put a stubbed maya package in the sys.modules to measure the Python side of the startup without Maya.
+        Every Maya command returns a mock, so the numbers don't include the Maya UI creation costs.
+    """
+    from unittest import mock
+    maya = mock.MagicMock(name="maya")
+    maya.cmds.about.side_effect = lambda *args, **kwargs: True if kwargs.get("batch") else "2025"
+    maya.cmds.internalVar.return_value = tempfile.gettempdir()+"/"
+    maya.cmds.workspace.return_value = tempfile.gettempdir()
+    maya.cmds.file.return_value = ""
+    maya.cmds.optionVar.return_value = 0
+    maya.cmds.ls.return_value = []
+    maya.cmds.iconTextButton.return_value = "partial(wiki='')"
+    sys.modules["maya"] = maya
+    for moduleName in ["cmds", "mel", "OpenMaya", "api", "standalone", "utils"]:
+        sys.modules["maya."+moduleName] = getattr(maya, moduleName)
+    for moduleName in ["OpenMaya", "OpenMayaAnim"]:
+        sys.modules["maya.api."+moduleName] = getattr(maya.api, moduleName)
+
+
+class StartupBenchmark(object):
+    def __init__(self, mode="ui", language=None, stub=False, offline=False, *args):
+        """ Measure the time to have the dpAutoRigSystem ready to use, split by startup phase.
+            Modes:
+                ui = dpAutoRig.Start().showUI(), it needs the interactive Maya or the stubbed maya.cmds.
+                headless = dpAutoRig.Start().startHeadless(), it runs in mayapy.
+            The offline option replaces the update and terms checks by nothing to get reproducible numbers without network.
+        """
+        self.mode = mode
+        self.language = language
+        self.stub = stub
+        self.offline = offline
+        self.phaseDic = {}
+        self.dpAutoRig = None
+        self.parentPath = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+    def initializeMaya(self, *args):
+        """ Install the stubbed maya package or start the Maya standalone session if we aren't running inside of Maya.
+        """
+        if self.stub:
+            installStubMaya()
+            return
+        try:
+            from maya import cmds
+            cmds.about(batch=True)
+        except:
+            from maya import standalone
+            standalone.initialize(name="python")
+
+
+    def addPhaseTime(self, phase, elapsed, *args):
+        """ Sum the elapsed time and the number of calls of the given phase.
+        """
+        phaseDic = self.phaseDic.setdefault(phase, {"time" : 0, "calls" : 0})
+        phaseDic["time"] = round(phaseDic["time"]+elapsed, 4)
+        phaseDic["calls"] += 1
+
+
+    def getTimedMethod(self, phaseName, method, keyIndex, *args):
+        """ Returns the given method wrapped to add its elapsed time to the phase dictionary.
+        """
+        benchmark = self
+        @wraps(method)
+        def timedMethod(*args, **kwargs):
+            phase = phaseName
+            if keyIndex != None and len(args) > keyIndex+1 and args[keyIndex+1]:
+                phase = phaseName+":"+str(args[keyIndex+1])
+            startTime = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                benchmark.addPhaseTime(phase, time.perf_counter()-startTime)
+        return timedMethod
+
+
+    def instrument(self, *args):
+        """ Import the dpAutoRig module and wrap the Start and library methods of the phases.
+            Returns the original methods by class and method name to restore them later.
+        """
+        # the module imports need to find the dpAutoRigSystem parent folder in the PYTHONPATH
+        if not self.parentPath in os.environ.get("PYTHONPATH", "").split(os.pathsep):
+            os.environ["PYTHONPATH"] = self.parentPath+os.pathsep+os.environ.get("PYTHONPATH", "")
+        if not self.parentPath in sys.path:
+            sys.path.append(self.parentPath)
+        startTime = time.perf_counter()
+        from dpAutoRigSystem import dpAutoRig
+        self.addPhaseTime("import", time.perf_counter()-startTime)
+        self.dpAutoRig = dpAutoRig
+        originalDic = {}
+        for methodName, keyIndex in PHASE_DIC.items():
+            method = getattr(dpAutoRig.Start, methodName, None)
+            if method:
+                originalDic[(dpAutoRig.Start, methodName)] = method
+                setattr(dpAutoRig.Start, methodName, self.getTimedMethod(methodName, method, keyIndex))
+        for classPath, methodDic in LIBRARY_PHASE_DIC.items():
+            moduleName, className = classPath.split(".")
+            libraryClass = getattr(getattr(dpAutoRig, moduleName, None), className, None)
+            if libraryClass:
+                for methodName, keyIndex in methodDic.items():
+                    method = getattr(libraryClass, methodName, None)
+                    if method:
+                        originalDic[(libraryClass, methodName)] = method
+                        setattr(libraryClass, methodName, self.getTimedMethod(className+"."+methodName, method, keyIndex))
+        if self.offline:
+            for methodName in NETWORK_METHOD_LIST:
+                if hasattr(dpAutoRig.Start, methodName):
+                    originalDic.setdefault((dpAutoRig.Start, methodName), getattr(dpAutoRig.Start, methodName))
+                    setattr(dpAutoRig.Start, methodName, lambda *args, **kwargs: None)
+        return originalDic
+
+
+    def restore(self, originalDic, *args):
+        """ Put back the original methods.
+        """
+        for (ownerClass, methodName), method in originalDic.items():
+            setattr(ownerClass, methodName, method)
+
+
+    def runOnce(self, *args):
+        """ Run one startup and returns its result dictionary with the phase times.
+        """
+        self.phaseDic = {}
+        resultDic = {"status" : "ok", "error" : None, "total" : None, "phases" : None}
+        originalDic = {}
+        try:
+            originalDic = self.instrument()
+            startTime = time.perf_counter()
+            dpUIinst = self.dpAutoRig.Start()
+            self.addPhaseTime("Start", time.perf_counter()-startTime)
+            if self.mode == "headless":
+                dpUIinst.headless = True
+                dpUIinst.startHeadless(self.language)
+            else:
+                showStartTime = time.perf_counter()
+                dpUIinst.showUI()
+                self.addPhaseTime("showUI", time.perf_counter()-showStartTime)
+            resultDic["total"] = round(time.perf_counter()-startTime+self.phaseDic["import"]["time"], 4)
+            if self.mode == "ui" and not self.stub:
+                dpUIinst.deleteExistWindow()
+        except Exception as e:
+            resultDic["status"] = "failed"
+            resultDic["error"] = str(e)
+            resultDic["traceback"] = traceback.format_exc()
+        finally:
+            if originalDic:
+                self.restore(originalDic)
+        resultDic["phases"] = self.phaseDic
+        return resultDic
+
+
+    def getEnvironmentDic(self, *args):
+        """ Returns the data of the running environment to compare results between machines and releases.
+        """
+        environmentDic = {"python" : platform.python_version(), "platform" : platform.platform(), "maya" : "stub", "dpARVersion" : None}
+        if self.dpAutoRig:
+            environmentDic["dpARVersion"] = self.dpAutoRig.DPAR_VERSION_5
+        if not self.stub:
+            try:
+                from maya import cmds
+                environmentDic["maya"] = cmds.about(version=True)
+            except Exception:
+                environmentDic["maya"] = None
+        return environmentDic
+
+
+    def startFreshRun(self, *args):
+        """ Run one startup in a new Python process to measure the cold start including the module imports.
+            Returns its result dictionary.
+        """
+        outputFile = os.path.join(tempfile.gettempdir(), "dpBenchmark_"+str(os.getpid())+"_"+str(time.time_ns())+".json")
+        cmdList = [sys.executable, "-m", "dpAutoRigSystem.benchmark", "--mode", self.mode, "--repeat", "1", "--output", outputFile]
+        if self.language:
+            cmdList.extend(["--language", self.language])
+        if self.stub:
+            cmdList.append("--stub")
+        if self.offline:
+            cmdList.append("--offline")
+        env = os.environ.copy()
+        env["PYTHONPATH"] = self.parentPath+os.pathsep+env.get("PYTHONPATH", "")
+        process = subprocess.run(cmdList, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        resultDic = {"status" : "failed", "error" : "benchmark process exit code "+str(process.returncode), "total" : None, "phases" : {}}
+        if os.path.exists(outputFile):
+            try:
+                with open(outputFile, "r", encoding="utf-8") as jsonFile:
+                    resultDic = json.load(jsonFile)["runs"][0]
+            except Exception as e:
+                resultDic["error"] = str(e)
+            os.remove(outputFile)
+        return resultDic
+
+
+    def getSummaryDic(self, runList, *args):
+        """ Returns the min, mean and max time of each phase and of the total, ignoring the failed runs.
+        """
+        summaryDic = {}
+        valueDic = {}
+        for runDic in runList:
+            if runDic["status"] == "ok":
+                valueDic.setdefault("total", []).append(runDic["total"])
+                for phase, phaseDic in runDic["phases"].items():
+                    valueDic.setdefault(phase, []).append(phaseDic["time"])
+        for phase, valueList in valueDic.items():
+            summaryDic[phase] = {"min" : min(valueList), "mean" : round(sum(valueList)/len(valueList), 4), "max" : max(valueList), "runs" : len(valueList)}
+        return summaryDic
+
+
+    def run(self, repeat=3, fresh=False, *args):
+        """ Run the startup the given number of times.
+            In the same process only the first run has the cold module imports, the fresh option runs each one in a new process.
+            The startup messages are sent to stderr to keep the stdout only for the json result.
+            Returns the benchmark result dictionary.
+        """
+        runList = []
+        with contextlib.redirect_stdout(sys.stderr):
+            if not fresh:
+                self.initializeMaya()
+            for r in range(max(1, repeat)):
+                if fresh:
+                    runDic = self.startFreshRun()
+                else:
+                    runDic = self.runOnce()
+                runDic["cold"] = fresh or r == 0
+                runList.append(runDic)
+        return {
+                "benchmarkVersion" : DP_BENCHMARK_VERSION,
+                "date"             : time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+                "mode"             : self.mode,
+                "stub"             : self.stub,
+                "offline"          : self.offline,
+                "fresh"            : fresh,
+                "environment"      : self.getEnvironmentDic(),
+                "runs"             : runList,
+                "summary"          : self.getSummaryDic(runList)
+                }
+
+
+def compareBaseline(resultDic, baselineDic, tolerance=0.2, minTime=0.01):
+    """ Compare the mean time of each phase with the baseline result.
+        A phase is a regression if it's slower than the baseline by more than the tolerance ratio and the minimum time in seconds.
+        Returns the list of regression dictionaries.
+    """
+    regressionList = []
+    baselineSummaryDic = baselineDic.get("summary", {})
+    for phase, summaryDic in resultDic["summary"].items():
+        if phase in baselineSummaryDic.keys():
+            baselineMean = baselineSummaryDic[phase]["mean"]
+            difference = summaryDic["mean"]-baselineMean
+            if difference > minTime and difference > baselineMean*tolerance:
+                regressionList.append({"phase" : phase, "baseline" : baselineMean, "current" : summaryDic["mean"], "difference" : round(difference, 4)})
+    return regressionList
+
+
+def getArgParser():
+    """ Returns the command line argument parser.
+    """
+    parser = argparse.ArgumentParser(prog="dpAutoRigSystem.benchmark", description="Measure the dpAutoRigSystem startup time by phase.")
+    parser.add_argument("--mode", choices=["ui", "headless"], default="headless", help="ui runs Start().showUI() and needs the interactive Maya or --stub, headless runs Start().startHeadless().")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of startups to measure.")
+    parser.add_argument("--fresh", action="store_true", help="Run each startup in a new process to measure cold starts.")
+    parser.add_argument("--stub", action="store_true", help="Use a stubbed maya package instead of Maya.")
+    parser.add_argument("--offline", action="store_true", help="Skip the update and terms checks that use the network.")
+    parser.add_argument("--language", default="English", help="Language to load.")
+    parser.add_argument("--baseline", help="Previous benchmark json file to compare the phase times.")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Slower ratio accepted by phase when comparing with the baseline.")
+    parser.add_argument("--minTime", type=float, default=0.01, help="Slower seconds accepted by phase when comparing with the baseline.")
+    parser.add_argument("--output", help="Json file to write the results, otherwise print them.")
+    return parser
+
+
+def writeResult(resultDic, output=None):
+    """ Write the result dictionary in the output json file or print it.
+    """
+    if output:
+        with open(output, "w") as jsonFile:
+            json.dump(resultDic, jsonFile, indent=4)
+    else:
+        print(json.dumps(resultDic, indent=4))
+
+
+def main(argList=None):
+    """ Command line entry point.
+        Returns the exit code:
+            0 = all startups ran well without regression
+            1 = found a regression compared with the baseline
+            2 = a startup failed
+            3 = wrong arguments
+    """
+    parser = getArgParser()
+    args = parser.parse_args(argList)
+    baselineDic = None
+    if args.baseline:
+        try:
+            with open(args.baseline, "r", encoding="utf-8") as jsonFile:
+                baselineDic = json.load(jsonFile)
+        except Exception as e:
+            print(json.dumps({"exitCode" : EXIT_USAGE, "error" : str(e)}, indent=4))
+            return EXIT_USAGE
+    benchmark = StartupBenchmark(args.mode, args.language, args.stub, args.offline)
+    resultDic = benchmark.run(args.repeat, args.fresh)
+    exitCode = EXIT_OK
+    if baselineDic:
+        resultDic["regressions"] = compareBaseline(resultDic, baselineDic, args.tolerance, args.minTime)
+        if resultDic["regressions"]:
+            exitCode = EXIT_REGRESSION
+    if [r for r in resultDic["runs"] if not r["status"] == "ok"]:
+        exitCode = EXIT_FAILED
+    resultDic["exitCode"] = exitCode
+    writeResult(resultDic, args.output)
+    return exitCode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
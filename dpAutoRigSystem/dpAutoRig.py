@@ -41,11 +41,18 @@ import socket
 import platform
 from maya import cmds
 from maya import mel
+from maya.api import OpenMaya
 from functools import partial
 from importlib import reload
 from .Modules.Library import dpUtils
 from .Modules.Library import dpControls
 from .Modules.Library import dpSkinning
+from .Modules.Library import dpMeshTopology
+from .Modules.Library import dpSceneIndex
+from .Modules.Library import dpModuleRegistry
+from .Modules.Library import dpLanguageCache
+from .Modules.Library import dpSceneLookup
+from .Modules.Library import dpNameRegistry
 from .Modules.Base import dpBaseStandard
 from .Modules.Base import dpBaseLayout
 from .Modules.Base import dpBaseCurve
@@ -77,6 +84,12 @@ class Start(object):
         reload(dpUtils)
         reload(dpControls)
         reload(dpSkinning)
+        reload(dpMeshTopology)
+        reload(dpSceneIndex)
+        reload(dpModuleRegistry)
+        reload(dpLanguageCache)
+        reload(dpSceneLookup)
+        reload(dpNameRegistry)
         reload(dpBaseStandard)
         reload(dpBaseLayout)
         reload(dpBaseCurve)
@@ -166,6 +179,10 @@ class Start(object):
         self.loadedDeforming = False
         self.loadedCustom = False
         self.rebuilding = False
+        self.headless = cmds.about(batch=True)
+        self.deferRefreshView = False
+        self.pendingRefreshView = False
+        self.dialogPolicyDic = {}
         self.moduleFLCollapseStatus = False
         self.rebuilderFLCollapseStatus = False
         self.collapseEditSelModFL = False
@@ -181,11 +198,25 @@ class Start(object):
         self.userDefAgreeTerms = 1
         self.optionCtrl = None
         self.utils = dpUtils.Utils(self)
+        self.topology = dpMeshTopology.MeshTopology(self)
+        self.sceneIndex = dpSceneIndex.SceneIndex(self)
+        self.sceneLookup = dpSceneLookup.SceneLookup(self)
+        self.nameRegistry = dpNameRegistry.NameRegistry(self)
+        self.registry = dpModuleRegistry.ModuleRegistry(self)
+        self.languageCache = dpLanguageCache.LanguageCache(self)
         self.dpARpath = self.utils.findPath("dpAutoRig.py")
         self.pipeliner = dpPipeliner.Pipeliner(self)
         self.packager = dpPackager.Packager(self)
         self.allUIs = {}
         self.iSelChangeJobId = 0
+        self.selChangePending = False
+        self.selChangeTime = 0
+        self.selChangeInterval = 0.1
+        self.selectedModuleStateDic = {}
+        self.lastSelectedModuleList = []
+        self.geomTypeList = ["mesh", "nurbsSurface", "subdiv"]
+        self.geomModelList = None
+        self.geomCallbackIdList = []
         self.iconInfo = self.dpARpath+"/Icons/dp_info.png"
         self.iconPlusInfo = self.dpARpath+"/Icons/dp_plusInfo.png"
         self.iconX = self.dpARpath+"/Icons/dp_xDelete.png"
@@ -207,6 +238,54 @@ class Start(object):
         print("dpAutoRigSystem "+self.lang['i346_loadedSuccess']+"\n----------")
 
 
+    def startHeadless(self, langName=None, *args):
+        """ Load the dictionaries, libraries and validator/rebuilder instances without creating any interface.
+            Used to run the actions in batch mode by mayapy.
+        """
+        self.langList, self.langDic = self.languageCache.getLanguageInfo()
+        self.langName = self.englishName
+        if langName in self.langList:
+            self.langName = langName
+        self.presetList, self.presetDic = self.getJsonFileInfo(self.curvesPresetsFolder)
+        self.presetName = "Default"
+        if not self.presetName in self.presetList:
+            self.presetName = self.presetList[0]
+        self.validatorPresetList, self.validatorPresetDic = self.getJsonFileInfo(self.validatorPresetsFolder)
+        if self.pipeliner.pipeData['presetsPath']:
+            self.loadPipelineValidatorPresets()
+        self.lang = self.langDic[self.langName]
+        self.ctrlPreset = self.presetDic[self.presetName]
+        self.ctrls = dpControls.ControlClass(self)
+        self.publisher = dpPublisher.Publisher(self, ui=False)
+        self.customAttr = dpCustomAttr.CustomAttr(self, False)
+        self.skin = dpSkinning.Skinning(self)
+        self.logger = dpLogger.Logger(self, ui=False)
+        # hidden action instances
+        for guideDir, instanceList in [[self.checkInFolder, self.checkInInstanceList], [self.checkOutFolder, self.checkOutInstanceList]]:
+            for guideModule in self.startGuideModules(guideDir, "exists", None):
+                instanceList.append(self.initExtraModule(guideModule, guideDir.replace("/", "."), hidden=True))
+        for pathKey, instanceList in [["addOnsPath", self.checkAddOnsInstanceList], ["finishingPath", self.checkFinishingInstanceList]]:
+            if self.pipeliner.pipeData[pathKey] and os.path.exists(self.pipeliner.pipeData[pathKey]):
+                sys.path.append(self.pipeliner.pipeData[pathKey])
+                for guideModule in self.startGuideModules("", "exists", None, path=self.pipeliner.pipeData[pathKey]):
+                    instanceList.append(self.initExtraModule(guideModule, hidden=True))
+        for guideDir in [self.rebuilderFolder, self.startFolder, self.sourceFolder, self.setupFolder, self.deformingFolder, self.customFolder]:
+            for guideModule in self.startGuideModules(guideDir, "exists", None):
+                self.rebuilderInstanceList.append(self.initExtraModule(guideModule, guideDir.replace("/", "."), hidden=True))
+        print("dpAutoRigSystem "+self.lang['i346_loadedSuccess']+"\n----------")
+
+
+    def getDialogPolicy(self, policy, default, *args):
+        """ Returns the answer to replace a dialog by the given policy key when it was set in the dialogPolicyDic by the batch mode.
+            Without interface it returns the given default answer.
+            Returns None if the dialog must be shown to the user.
+        """
+        if policy in self.dialogPolicyDic.keys():
+            return self.dialogPolicyDic[policy]
+        if self.headless:
+            return default
+
+
     def ui(self, *args):
         """ Start the main UI, menus and layouts for dpAutoRigSystem through workspaceControl.
         """
@@ -236,15 +315,19 @@ class Start(object):
             - NewSceneOpened
             - SceneSaved
             - deleteAll = new scene (disable to don't reset the asset context when running a new scene for the first module)
-            - SelectionChanged
+            - SelectionChanged = coalesced to run once when Maya is idle
             - WorkspaceChanged = not documented
+            - uiDeleted = remove the geometry model and name registry callbacks
         """
         cmds.scriptJob(event=('SceneOpened', partial(self.refreshMainUI, clearSel=True)), parent='dpAutoRigSystemWC', killWithScene=False, compressUndo=True)
         #cmds.scriptJob(event=('deleteAll', self.refreshMainUI), parent='dpAutoRigSystemWC', replacePrevious=True, killWithScene=False, compressUndo=False, force=True)
         cmds.scriptJob(event=('NewSceneOpened', self.refreshMainUI), parent='dpAutoRigSystemWC', killWithScene=False, compressUndo=True)
         cmds.scriptJob(event=('SceneSaved', partial(self.refreshMainUI, savedScene=True, resetButtons=False)), parent='dpAutoRigSystemWC', killWithScene=False, compressUndo=True)
         cmds.scriptJob(event=('workspaceChanged', self.pipeliner.refreshAssetData), parent='dpAutoRigSystemWC', killWithScene=False, compressUndo=True)
-        self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectedGuide), parent='languageMenu', replacePrevious=True, killWithScene=False, compressUndo=True, force=True)
+        self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectionChanged), parent='languageMenu', replacePrevious=True, killWithScene=False, compressUndo=True, force=True)
+        cmds.scriptJob(uiDeleted=('dpAutoRigSystemWC', self.removeGeomModelCallbacks), runOnce=True, killWithScene=False)
+        cmds.scriptJob(uiDeleted=('dpAutoRigSystemWC', self.nameRegistry.stopRegistry), runOnce=True, killWithScene=False)
+        self.startGeomModelCallbacks()
         self.ctrls.startCorrectiveEditMode()
         self.jobSelectedGuide()
 
@@ -271,6 +354,8 @@ class Start(object):
         print("\n----------")
         loadingString = "Loading dpAutoRigSystem v%s ... " %self.dpARVersion
         print(loadingString)
+        if cmds.about(batch=True):
+            return
         path = os.path.dirname(__file__)
         randImage = random.randint(0,7)
         self.clearDPARLoadingWindow()
@@ -379,7 +464,7 @@ class Start(object):
         self.allUIs["languageMenu"] = cmds.menuItem('languageMenu', label='Language', parent='settingsMenu', subMenu=True)
         cmds.radioMenuItemCollection('languageRadioMenuCollection')
         # create a language list:
-        self.langList, self.langDic = self.getJsonFileInfo(self.languagesFolder)
+        self.langList, self.langDic = self.languageCache.getLanguageInfo()
         # create menuItems from language list:
         if self.langList:
             # verify if there is an optionVar of last choosen by user in Maya system:
@@ -518,6 +603,7 @@ class Start(object):
         self.allUIs["defaultRenderLayerCB"] = cmds.checkBox('defaultRenderLayerCB', label=self.lang['i004_defaultRL'], align='left', value=1, parent=self.allUIs["rigOptionsLayout"])
         self.allUIs["colorizeCtrlCB"] = cmds.checkBox('colorizeCtrlCB', label=self.lang['i065_colorizeCtrl'], align='left', value=1, parent=self.allUIs["rigOptionsLayout"])
         self.allUIs["addAttrCB"] = cmds.checkBox('addAttrCB', label=self.lang['i066_addAttr'], align='left', value=1, parent=self.allUIs["rigOptionsLayout"])
+        self.allUIs["incrementalCB"] = cmds.checkBox('incrementalCB', label=self.lang['i365_incrementalCB'], align='left', value=0, parent=self.allUIs["rigOptionsLayout"])
         self.allUIs["degreeLayout"] = cmds.rowColumnLayout('degreeLayout', numberOfColumns=2, columnWidth=[(1, 100), (2, 250)], columnAlign=[(1, 'left'), (2, 'left')], columnAttach=[(1, 'left', 0), (2, 'left', 10)], parent=self.allUIs["rigOptionsLayout"])
         # option Degree:
         self.degreeOptionMenu = cmds.optionMenu("degreeOptionMenu", label='', changeCommand=self.changeOptionDegree, parent=self.allUIs["degreeLayout"])
@@ -828,8 +914,8 @@ class Start(object):
         self.allUIs["selectAllProcessCB"] = cmds.checkBox(label=self.lang['m004_select']+" "+self.lang['i211_all']+" "+self.lang['i292_processes'].lower(), value=True, changeCommand=partial(self.changeActiveAllModules, self.rebuilderInstanceList), parent=self.allUIs["footerRebuilder"])
         cmds.separator(style='none', height=10, parent=self.allUIs["footerRebuilder"])
         self.allUIs["selectedRebuildersPL"] = cmds.paneLayout("selectedRebuildersPL", configuration="vertical2", separatorThickness=7.0, width=370, parent=self.allUIs["footerRebuilder"])
-        self.allUIs["splitDataSelectProcessBT"] = cmds.button("splitDataSelectProcessBT", label=self.lang['r002_splitData'].upper(), command=partial(self.runSelectedActions, self.rebuilderInstanceList, True, True, actionType="r000_rebuilder"), parent=self.allUIs["selectedRebuildersPL"])
-        self.allUIs["rebuildSelectProcessBT"] = cmds.button("rebuildSelectProcessBT", label=self.lang['r001_rebuild'].upper(), command=partial(self.runSelectedActions, self.rebuilderInstanceList, False, True, actionType="r000_rebuilder"), parent=self.allUIs["selectedRebuildersPL"])
+        self.allUIs["splitDataSelectProcessBT"] = cmds.button("splitDataSelectProcessBT", label=self.lang['r002_splitData'].upper(), command=partial(self.runSelectedActions, self.rebuilderInstanceList, True, True, actionType="r000_rebuilder", batchMode=True), parent=self.allUIs["selectedRebuildersPL"])
+        self.allUIs["rebuildSelectProcessBT"] = cmds.button("rebuildSelectProcessBT", label=self.lang['r001_rebuild'].upper(), command=partial(self.runSelectedActions, self.rebuilderInstanceList, False, True, actionType="r000_rebuilder", batchMode=True), parent=self.allUIs["selectedRebuildersPL"])
         cmds.separator(style='none', height=10, parent=self.allUIs["footerRebuilder"])
         # edit formLayout in order to get a good scalable window:
         cmds.formLayout( self.allUIs["rebuilderTabLayout"], edit=True,
@@ -861,6 +947,8 @@ class Start(object):
         if savedScene:
             self.selList = cmds.ls(selection=True)
             self.rebuilding = False
+        self.resetSelectedGuideState()
+        self.setGeomModelDirty()
         self.populateCreatedGuideModules()
         self.checkImportedGuides()
         self.checkGuideNets()
@@ -873,9 +961,9 @@ class Start(object):
             for rebuildInstance in self.rebuilderInstanceList:
                 rebuildInstance.updateActionButtons(color=False)
         try:
-            self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectedGuide), parent='languageMenu', replacePrevious=True, killWithScene=False, compressUndo=True)
+            self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectionChanged), parent='languageMenu', replacePrevious=True, killWithScene=False, compressUndo=True)
         except:
-            self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectedGuide), parent='languageMenu', replacePrevious=False, killWithScene=False, compressUndo=True)
+            self.iSelChangeJobId = cmds.scriptJob(event=('SelectionChanged', self.jobSelectionChanged), parent='languageMenu', replacePrevious=False, killWithScene=False, compressUndo=True)
         if savedScene:
             cmds.select(clear=True)
             if self.selList:
@@ -885,8 +973,36 @@ class Start(object):
         self.rebuilding = False
 
 
-    def jobSelectedGuide(self):
+    def jobSelectionChanged(self, *args):
+        """ SelectionChanged scriptJob that coalesces the events to run the selection update only once when Maya is idle.
+        """
+        self.selChangeTime = time.time()
+        if not self.selChangePending:
+            self.selChangePending = True
+            cmds.evalDeferred(self.runDeferredSelectionChanged, lowestPriority=True)
+
+
+    def runDeferredSelectionChanged(self, *args):
+        """ Wait the selection to stay unchanged during the interval time, then run the jobSelectedGuide.
+        """
+        if time.time() - self.selChangeTime < self.selChangeInterval:
+            cmds.evalDeferred(self.runDeferredSelectionChanged, lowestPriority=True)
+            return
+        self.selChangePending = False
+        if cmds.workspaceControl("dpAutoRigSystemWC", query=True, exists=True):
+            self.jobSelectedGuide()
+
+
+    def resetSelectedGuideState(self, *args):
+        """ Forget the selection state of the module buttons to update all of them in the next selection job.
+        """
+        self.selectedModuleStateDic = {}
+        self.lastSelectedModuleList = []
+
+
+    def jobSelectedGuide(self, *args):
         """ This scriptJob read if the selected item in the scene is a guideModule and reload the UI.
+            Only the module buttons with a changed selection state are updated.
         """
         # run the UI part:
         self.selectedModuleInstanceList = []
@@ -908,31 +1024,44 @@ class Start(object):
             if needUpdateSelect:
                 self.refreshMainUI()
                 cmds.select(updatedGuideNodeList)
+        selectedGuideInfoList = [cmds.getAttr(selectedGuide+"."+self.moduleInstanceInfoAttr) for selectedGuide in selectedGuideNodeList]
         # update UI
-        for m, moduleInstance in enumerate(self.moduleInstancesList):
+        moduleStateDic = {}
+        for moduleInstance in self.moduleInstancesList:
+            moduleInstanceInfo = str(moduleInstance)
+            isSelected = moduleInstanceInfo in selectedGuideInfoList
+            if isSelected:
+                self.selectedModuleInstanceList.append(moduleInstance)
+            if self.selectedModuleStateDic.get(moduleInstanceInfo) == isSelected:
+                moduleStateDic[moduleInstanceInfo] = isSelected
+                continue
             if cmds.objExists(moduleInstance.moduleGrp):
                 if moduleInstance.selectButton:
-                    currentColorList = self.ctrls.getGuideRGBColorList(moduleInstance)
-                    if currentColorList:
-                        cmds.button(moduleInstance.selectButton, edit=True, label=" ", backgroundColor=currentColorList)
-                    if selectedGuideNodeList:
-                        for selectedGuide in selectedGuideNodeList:
-                            selectedGuideInfo = cmds.getAttr(selectedGuide+"."+self.moduleInstanceInfoAttr)
-                            if selectedGuideInfo == str(moduleInstance):
-                                cmds.button(moduleInstance.selectButton, edit=True, label="S", backgroundColor=(1.0, 1.0, 1.0))
-                                self.selectedModuleInstanceList.append(moduleInstance)
-        # delete module layout:
-        if not selectedGuideNodeList:
-            try:
-                cmds.frameLayout(self.allUIs['editSelectedModuleLayoutA'], edit=True, label=self.lang['i011_editSelected']+" "+self.lang['i143_module'])
-                cmds.deleteUI("selectedModuleColumn")
-            except:
-                pass
-        # re-create module layout:
-        if self.selectedModuleInstanceList:
-            self.selectedModuleInstanceList[-1].reCreateEditSelectedModuleLayout(bSelect=False)
-        # call reload the geometries in skin UI:
-        self.reloadPopulatedGeoms()
+                    if isSelected:
+                        cmds.button(moduleInstance.selectButton, edit=True, label="S", backgroundColor=(1.0, 1.0, 1.0))
+                    else:
+                        currentColorList = self.ctrls.getGuideRGBColorList(moduleInstance)
+                        if currentColorList:
+                            cmds.button(moduleInstance.selectButton, edit=True, label=" ", backgroundColor=currentColorList)
+                    moduleStateDic[moduleInstanceInfo] = isSelected
+        self.selectedModuleStateDic = moduleStateDic
+        # edit module layout only if the selected modules changed:
+        selectedModuleList = [str(moduleInstance) for moduleInstance in self.selectedModuleInstanceList]
+        if selectedModuleList != self.lastSelectedModuleList:
+            self.lastSelectedModuleList = selectedModuleList
+            # delete module layout:
+            if not selectedGuideNodeList:
+                try:
+                    cmds.frameLayout(self.allUIs['editSelectedModuleLayoutA'], edit=True, label=self.lang['i011_editSelected']+" "+self.lang['i143_module'])
+                    cmds.deleteUI("selectedModuleColumn")
+                except:
+                    pass
+            # re-create module layout:
+            if self.selectedModuleInstanceList:
+                self.selectedModuleInstanceList[-1].reCreateEditSelectedModuleLayout(bSelect=False)
+        # call reload the geometries in skin UI only if they depend on the selection or the scene geometries changed:
+        if self.geomModelList == None or self.getGeomChoice() == "selGeoms":
+            self.reloadPopulatedGeoms()
     
 
     def resetAllButtonColors(self, *args):
@@ -1168,12 +1297,67 @@ class Start(object):
         self.actualizeSkinFooter()
         
         
+    def getGeomChoice(self, *args):
+        """ Returns the current geomType choice of the skinning UI (allGeoms or selGeoms).
+        """
+        geomSelectedRadioButton = cmds.radioCollection(self.allUIs["geomCollection"], query=True, select=True)
+        return cmds.radioButton(geomSelectedRadioButton, query=True, annotation=True)
+
+
+    def setGeomModelDirty(self, *args):
+        """ Mark the cached scene geometry model to be read again in the next populateGeoms.
+            Used by the node added, removed, renamed and dag changed callbacks.
+        """
+        self.geomModelList = None
+
+
+    def startGeomModelCallbacks(self, *args):
+        """ Create the API callbacks that mark the cached scene geometry model as dirty.
+        """
+        self.removeGeomModelCallbacks()
+        for geomType in self.geomTypeList:
+            self.geomCallbackIdList.append(OpenMaya.MDGMessage.addNodeAddedCallback(self.setGeomModelDirty, geomType))
+            self.geomCallbackIdList.append(OpenMaya.MDGMessage.addNodeRemovedCallback(self.setGeomModelDirty, geomType))
+        self.geomCallbackIdList.append(OpenMaya.MNodeMessage.addNameChangedCallback(OpenMaya.MObject.kNullObj, self.setGeomModelDirty))
+        self.geomCallbackIdList.append(OpenMaya.MDagMessage.addAllDagChangesCallback(self.setGeomModelDirty))
+
+
+    def removeGeomModelCallbacks(self, *args):
+        """ Remove the scene geometry model callbacks.
+        """
+        if self.geomCallbackIdList:
+            try:
+                OpenMaya.MMessage.removeCallbacks(self.geomCallbackIdList)
+            except:
+                pass
+        self.geomCallbackIdList = []
+
+
+    def getGeomModelList(self, *args):
+        """ Returns the cached list of [transform, shapeList] long names of the scene geometries to skin.
+            It reads the scene only when the model is dirty, ignoring intermediate objects and the ribbon nurbs planes.
+        """
+        if self.geomModelList == None:
+            modelList, shapeDic = [], {}
+            ignoreSet = set(cmds.ls("*."+self.skin.ignoreSkinningAttr, recursive=True, objectsOnly=True, long=True) or [])
+            for geomType in self.geomTypeList:
+                for shapeName in cmds.ls(selection=False, type=geomType, long=True, noIntermediate=True) or []:
+                    transformName = shapeName.rpartition("|")[0]
+                    if transformName and not transformName in ignoreSet:
+                        if not transformName in shapeDic.keys():
+                            shapeDic[transformName] = []
+                            modelList.append([transformName, shapeDic[transformName]])
+                        shapeDic[transformName].append(shapeName)
+            self.geomModelList = modelList
+        return self.geomModelList
+
+
     def populateGeoms(self, *args):
         """ This function is responsable to list all geometries or only selected geometries in the interface in order to use in skinning.
+            The scene geometries come from the cached geometry model.
         """
         # get current geomType (all or just selected):
-        geomSelectedRadioButton = cmds.radioCollection(self.allUIs["geomCollection"], query=True, select=True)
-        chooseGeom = cmds.radioButton(geomSelectedRadioButton, query=True, annotation=True)
+        chooseGeom = self.getGeomChoice()
         
         # get user preference as long or short name:
         displayGeoLongName = cmds.checkBox(self.allUIs["geoLongName"], query=True, value=True)
@@ -1181,29 +1365,20 @@ class Start(object):
         # list geometries to be populated:
         geomList, shortNameList, sameNameList, sortedGeoList = [], [], [], []
         
-        currentSelectedList = cmds.ls(selection=True, long=True)
-        geomTypeList = ["mesh", "nurbsSurface", "subdiv"]
-        for geomType in geomTypeList:
-            allGeomList = cmds.ls(selection=False, type=geomType, long=True)
-            if allGeomList:
-                for meshName in allGeomList:
-                    if cmds.getAttr(meshName+".intermediateObject") == 0:
-                        transformNameList = cmds.listRelatives(meshName, parent=True, fullPath=True, type="transform")
-                        if transformNameList:
-                            # do not add ribbon nurbs plane to the list:
-                            if not cmds.objExists(transformNameList[0]+"."+self.skin.ignoreSkinningAttr):
-                                if not transformNameList[0] in geomList:
-                                    if chooseGeom == "allGeoms":
-                                        geomList.append(transformNameList[0])
-                                        cmds.checkBox(self.allUIs["geoLongName"], edit=True, value=True, enable=False)
-                                    elif chooseGeom == "selGeoms":
-                                        cmds.checkBox(self.allUIs["geoLongName"], edit=True, enable=True)
-                                        if transformNameList[0] in currentSelectedList or meshName in currentSelectedList:
-                                            if displayGeoLongName:
-                                                geomList.append(transformNameList[0])
-                                            else:
-                                                shortName = transformNameList[0][transformNameList[0].rfind("|")+1:]
-                                                geomList.append(shortName)
+        geomModelList = self.getGeomModelList()
+        if geomModelList:
+            if chooseGeom == "allGeoms":
+                cmds.checkBox(self.allUIs["geoLongName"], edit=True, value=True, enable=False)
+                geomList = [transformName for transformName, shapeList in geomModelList]
+            elif chooseGeom == "selGeoms":
+                cmds.checkBox(self.allUIs["geoLongName"], edit=True, enable=True)
+                currentSelectedSet = set(cmds.ls(selection=True, long=True))
+                for transformName, shapeList in geomModelList:
+                    if transformName in currentSelectedSet or not currentSelectedSet.isdisjoint(shapeList):
+                        if displayGeoLongName:
+                            geomList.append(transformName)
+                        else:
+                            geomList.append(transformName[transformName.rfind("|")+1:])
 
         # check if we have same short name:
         if geomList:
@@ -1332,11 +1507,14 @@ class Start(object):
             self.loadedPath = True
         # list all guide modules:
         guideModuleList = self.utils.findAllModules(path, guideDir)
+        if action == "start":
+            self.registry.clearMissedClasses()
         if guideModuleList:
             if action == "start":
                 # create guide buttons:
                 for guideModule in guideModuleList:
                     self.createGuideButton(guideModule, guideDir, layout, path)
+                self.registry.saveManifest()
             elif action == "check":
                 notFoundModuleList = []
                 # verify the list if exists all elements in the folder:
@@ -1399,44 +1577,50 @@ class Start(object):
     
     def createGuideButton(self, guideModule, guideDir, layout, path=None):
         """ Create a guideButton for guideModule in the respective colMiddleLeftA guidesLayout.
+            The guides, integrated guides, tools and control curves get their data from the module registry without import them.
+            Their code is imported only when the button is used.
         """
-        # especific import command for guides storing theses guides modules in a variable:
-        #guide = __import__("dpAutoRigSystem."+guideDir+"."+guideModule, {}, {}, [guideModule])
-        basePath = self.utils.findEnv("PYTHONPATH", "dpAutoRigSystem")
+        guideInfoDic = None
+        if guideDir in [self.standardFolder, self.integratedFolder, self.toolsFolder, self.curvesSimpleFolder, self.curvesCombinedFolder]:
+            guideInfoDic = self.registry.getModuleInfo(self.dpARpath, guideDir, guideModule)
+        if guideDir:
+            guideDir = guideDir.replace("/", ".")
+        if not guideInfoDic:
+            # especific import command for guides storing theses guides modules in a variable:
+            #guide = __import__("dpAutoRigSystem."+guideDir+"."+guideModule, {}, {}, [guideModule])
+            basePath = self.utils.findEnv("PYTHONPATH", "dpAutoRigSystem")
 
-        # Sandbox the module import process so a single guide cannot crash the whole Autorig.
-        # https://github.com/SqueezeStudioAnimation/dpAutoRigSystem/issues/28
-        try:
-            if guideDir:
-                guideDir = guideDir.replace("/", ".")
-                guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
-            else:
-                sys.path.append(path)
-                guide = __import__(guideModule, {}, {}, [guideModule])
-            if self.dev:
-                reload(guide)
-        except Exception as e:
-            errorString = self.lang['e017_loadingExtension']+" "+guideModule+" : "+str(e.args)
-            mel.eval('warning \"'+errorString+'\";')
-            return
+            # Sandbox the module import process so a single guide cannot crash the whole Autorig.
+            # https://github.com/SqueezeStudioAnimation/dpAutoRigSystem/issues/28
+            try:
+                if guideDir:
+                    guide = __import__(basePath+"."+guideDir+"."+guideModule, {}, {}, [guideModule])
+                else:
+                    sys.path.append(path)
+                    guide = __import__(guideModule, {}, {}, [guideModule])
+                if self.dev:
+                    reload(guide)
+            except Exception as e:
+                errorString = self.lang['e017_loadingExtension']+" "+guideModule+" : "+str(e.args)
+                mel.eval('warning \"'+errorString+'\";')
+                return
+            if not "WIKI" in dir(guide):
+                guide.WIKI = None
+            guideInfoDic = {"CLASS_NAME" : guide.CLASS_NAME, "TITLE" : guide.TITLE, "DESCRIPTION" : guide.DESCRIPTION, "ICON" : guide.ICON, "WIKI" : guide.WIKI}
 
         # getting data from guide module:
-        title = self.lang[guide.TITLE]
-        description = self.lang[guide.DESCRIPTION]
-        icon = guide.ICON
+        title = self.lang[guideInfoDic["TITLE"]]
+        description = self.lang[guideInfoDic["DESCRIPTION"]]
+        icon = guideInfoDic["ICON"]
         if guideDir:
             # find path where 'dpAutoRig.py' is been executed to get the icon:
             path = self.dpARpath
         iconDir = path+icon
-        guideName = guide.CLASS_NAME
-        if not "WIKI" in dir(guide):
-            guide.WIKI = None
+        guideName = guideInfoDic["CLASS_NAME"]
         
         # creating a basic layout for guide buttons:
         if guideDir == self.curvesSimpleFolder.replace("/", ".") or guideDir == self.curvesCombinedFolder.replace("/", "."):
-            ctrlInstance = self.initExtraModule(guideModule, guideDir)
-            cmds.iconTextButton(image=iconDir, label=guideName, annotation=guideName, height=32, width=32, command=partial(self.installControllerModule, ctrlInstance, True), parent=self.allUIs[layout])
-            self.controlInstanceList.append(ctrlInstance)
+            cmds.iconTextButton(image=iconDir, label=guideName, annotation=guideName, height=32, width=32, command=partial(self.installControllerModule, guideName, True), parent=self.allUIs[layout])
         else:
             isRebuilder = False
             if guideDir == self.rebuilderFolder.replace("/", ".") or guideDir == self.startFolder.replace("/", ".") or guideDir == self.sourceFolder.replace("/", ".") or guideDir == self.setupFolder.replace("/", ".") or guideDir == self.deformingFolder.replace("/", ".") or guideDir == self.customFolder.replace("/", "."):
@@ -1480,11 +1664,11 @@ class Start(object):
                 rebuilderInstance.actionCB = cmds.checkBox(label=title, value=True, changeCommand=rebuilderInstance.changeActive)
                 rebuilderInstance.firstBT = cmds.button(label=rebuilderInstance.firstBTLabel, width=45, command=partial(rebuilderInstance.runAction, True), backgroundColor=(0.5, 0.5, 0.5), enable=rebuilderInstance.firstBTEnable, parent=moduleLayout)
                 rebuilderInstance.secondBT = cmds.button(label=rebuilderInstance.secondBTLabel, width=45, command=partial(rebuilderInstance.runAction, False), backgroundColor=(0.5, 0.5, 0.5), enable=rebuilderInstance.secondBTEnable, parent=moduleLayout)
-                rebuilderInstance.infoITB = cmds.iconTextButton(image=self.iconInfo, height=30, width=30, style='iconOnly', command=partial(self.logger.infoWin, guide.TITLE, guide.DESCRIPTION, None, 'center', 305, 250, wiki=guide.WIKI), parent=moduleLayout)
+                rebuilderInstance.infoITB = cmds.iconTextButton(image=self.iconInfo, height=30, width=30, style='iconOnly', command=partial(self.logger.infoWin, guideInfoDic["TITLE"], guideInfoDic["DESCRIPTION"], None, 'center', 305, 250, wiki=guideInfoDic["WIKI"]), parent=moduleLayout)
                 rebuilderInstance.deleteDataITB = cmds.iconTextButton(image=self.iconX, height=30, width=30, style='iconOnly', command=rebuilderInstance.deleteData, enable=rebuilderInstance.deleteDataBTEnable, annotation=self.lang['r058_deleteDataAnn'], parent=moduleLayout)
                 rebuilderInstance.updateActionButtons(color=False)
             else:
-                cmds.iconTextButton(image=self.iconInfo, height=30, width=30, style='iconOnly', command=partial(self.logger.infoWin, guide.TITLE, guide.DESCRIPTION, None, 'center', 305, 250, wiki=guide.WIKI), parent=moduleLayout)
+                cmds.iconTextButton(image=self.iconInfo, height=30, width=30, style='iconOnly', command=partial(self.logger.infoWin, guideInfoDic["TITLE"], guideInfoDic["DESCRIPTION"], None, 'center', 305, 250, wiki=guideInfoDic["WIKI"]), parent=moduleLayout)
         cmds.setParent('..')
     
     
@@ -1542,10 +1726,13 @@ class Start(object):
         return guideInstance
     
     
-    def installControllerModule(self, ctrlInstance, useUI, *args):
+    def installControllerModule(self, ctrlName, useUI, *args):
         """  Start the creation of this Controller module using the UI info.
+            The control module is imported and initialized by the first use.
         """
-        ctrlInstance.cvMain(useUI)
+        ctrlInstance = self.ctrls.getControlInstance(ctrlName)
+        if ctrlInstance:
+            ctrlInstance.cvMain(useUI)
     
     
     def execIntegratedGuide(self, guideModule, guideDir, *args):
@@ -1759,11 +1946,17 @@ class Start(object):
     def setValidatorPreset(self, *args):
         self.validatorPresetName = self.getCurrentMenuValue(self.validatorPresetList)
         checkInstanceList = self.checkInInstanceList + self.checkOutInstanceList + self.checkAddOnsInstanceList + self.checkFinishingInstanceList
-        if checkInstanceList:
-            for presetKey in self.validatorPresetDic[self.validatorPresetName]:
-                for validatorModule in checkInstanceList:
-                    if presetKey == validatorModule.guideModuleName:
-                        validatorModule.changeActive(self.validatorPresetDic[self.validatorPresetName][validatorModule.guideModuleName])
+        self.applyActionPreset(self.validatorPresetDic[self.validatorPresetName], checkInstanceList)
+
+
+    def applyActionPreset(self, presetDic, actionInstList, *args):
+        """ Set the active state of the given validator or rebuilder instances using the module names in the preset dictionary.
+        """
+        if actionInstList:
+            for presetKey in presetDic:
+                for actionModule in actionInstList:
+                    if presetKey == actionModule.guideModuleName:
+                        actionModule.changeActive(presetDic[actionModule.guideModuleName])
 
 
     def changeActiveAllModules(self, instList, value, *args):
@@ -1775,18 +1968,27 @@ class Start(object):
                 inst.changeActive(value)
 
 
-    def runSelectedActions(self, actionInstList, firstMode, verbose=True, stopIfFoundBlock=False, publishLog=None, actionType="v000_validator", *args):
+    def runSelectedActions(self, actionInstList, firstMode, verbose=True, stopIfFoundBlock=False, publishLog=None, actionType="v000_validator", batchMode=False, exportLog=None, *args):
         """ Run the code for each active validator/rebuilder instance.
             firstMode = True for verify/export
                       = False for fix/import
+            batchMode = True to run the viewport refresh and undo flush just once after all actions.
+            exportLog = True to export the dpLog json file, it follows the verbose value by default.
         """
+        if exportLog == None:
+            exportLog = verbose
         if firstMode and actionType == "r000_rebuilder": #splitData
             if self.utils.getDuplicatedNames():
-                confirm = cmds.confirmDialog(title=self.lang['v024_duplicatedName'], icon="question", message=self.lang['i355_uniqueNameDependence'], button=[self.lang['i071_yes'], self.lang['i072_no']], defaultButton=self.lang['i072_no'], cancelButton=self.lang['i072_no'], dismissString=self.lang['i072_no'])
-                if confirm == self.lang['i072_no']:
+                policy = self.getDialogPolicy("duplicatedNames", "abort")
+                if not policy:
+                    confirm = cmds.confirmDialog(title=self.lang['v024_duplicatedName'], icon="question", message=self.lang['i355_uniqueNameDependence'], button=[self.lang['i071_yes'], self.lang['i072_no']], defaultButton=self.lang['i072_no'], cancelButton=self.lang['i072_no'], dismissString=self.lang['i072_no'])
+                    if confirm == self.lang['i072_no']:
+                        return
+                elif policy == "abort":
                     return
         self.resetAllButtonColors()
         actionResultData = {}
+        profileData = {"actionType" : actionType, "firstMode" : firstMode, "time" : 0, "actions" : {}}
         logText = ""
         if publishLog:
             logText = "\nPublisher"
@@ -1796,16 +1998,30 @@ class Start(object):
             logText += "\nComments: "+publishLog["comments"]+"\n"
         if actionInstList:
             self.utils.setProgress(self.lang[actionType]+': '+self.lang['c110_start'], self.lang[actionType], len(actionInstList))
-            for a, actionInst in enumerate(actionInstList):
-                if actionInst.active:
-                    self.utils.setProgress(actionInst.guideModuleName)
-                    actionInst.verbose = False
-                    actionResultData[actionInst.guideModuleName] = actionInst.runAction(firstMode)
-                    actionInst.verbose = True
-                    if stopIfFoundBlock:
-                        if True in actionInst.foundIssueList:
-                            if False in actionInst.resultOkList:
-                                return actionResultData, True, a
+            self.deferRefreshView = batchMode
+            # share the read mesh topology and scene queries between the actions of this run
+            self.topology.startSnapshot()
+            self.sceneIndex.startIndex()
+            try:
+                for a, actionInst in enumerate(actionInstList):
+                    if actionInst.active:
+                        self.utils.setProgress(actionInst.guideModuleName)
+                        actionInst.verbose = False
+                        actionResultData[actionInst.guideModuleName] = actionInst.runProfiledAction(firstMode)
+                        actionInst.verbose = True
+                        profileData["actions"][actionInst.guideModuleName] = actionInst.profileDic
+                        profileData["time"] = round(profileData["time"]+actionInst.profileDic["time"], 4)
+                        if not firstMode:
+                            self.topology.clearSnapshot()
+                            self.sceneIndex.clearIndex()
+                        if stopIfFoundBlock:
+                            if True in actionInst.foundIssueList:
+                                if False in actionInst.resultOkList:
+                                    return actionResultData, True, a
+            finally:
+                self.topology.stopSnapshot()
+                self.sceneIndex.stopIndex()
+                self.runDeferredRefreshView()
         if actionResultData:
             dataList = list(actionResultData.keys())
             dataList.sort()
@@ -1821,14 +2037,30 @@ class Start(object):
         if verbose:
             self.logger.infoWin('i019_log', actionType, logText, "left", 250, (150+(heightSize)*13))
             print("\n-------------\n"+self.lang[actionType]+"\n"+logText)
+        if exportLog:
             if publishLog:
                 actionResultData["Publisher"] = publishLog
+            if profileData["actions"]:
+                profileData["comparison"] = self.utils.compareProfileLog(profileData, subFolder=self.dpData+"/"+self.dpLog)
+                actionResultData["dpProfile"] = profileData
             if not self.utils.exportLogDicToJson(actionResultData, subFolder=self.dpData+"/"+self.dpLog):
                 print(self.lang['i201_saveScene'])
         self.utils.setProgress(endIt=True)
         return actionResultData, False, 0
 
     
+    def runDeferredRefreshView(self, *args):
+        """ Stop deferring the actions viewport refresh and run it once if any action asked for it.
+        """
+        self.deferRefreshView = False
+        if self.pendingRefreshView:
+            self.pendingRefreshView = False
+            cmds.refresh()
+            cmds.viewFit(allObjects=True, animate=True)
+            mel.eval("flushUndo;")
+            cmds.select(clear=True)
+
+
     def donateWin(self, *args):
         """ Simple window with links to donate in order to support this free and openSource code via PayPal.
         """
@@ -2418,9 +2650,11 @@ class Start(object):
                 self.utils.closeUI(dpRAttr.winName)
     
     
-    def rigAll(self, integrate=None, *args):
+    def rigAll(self, integrate=None, incremental=False, *args):
         """ Create the RIG based in the Guide Modules in the scene.
             Most important function to automate the generating process.
+            In incremental mode, the modules with the same guide hash of the last build, and not integrated with a changed module, are skipped keeping their last built rig.
+            The last built rig of the other modules is deleted before rebuilding them.
         """
         print('\ndpAutoRigSystem Log: ' + self.lang['i178_startRigging'] + '...\n')
         # Starting progress window
@@ -2437,6 +2671,8 @@ class Start(object):
         # get a list of modules to be rigged and re-declare the riggedModuleDic to store for log in the end:
         self.modulesToBeRiggedList = self.utils.getModulesToBeRigged(self.moduleInstancesList)
         self.riggedModuleDic = {}
+        buildStartTime = time.perf_counter()
+        self.buildReportDic = {"dpARVersion" : self.dpARVersion, "scene" : cmds.file(query=True, sceneName=True), "time" : 0, "phases" : {}, "modules" : {}, "plan" : {}}
         
         # declare a list to store all integrating information:
         self.integratedTaskDic = {}
@@ -2452,7 +2688,9 @@ class Start(object):
                     btYes = self.lang['i071_yes']
                     btUpdateGuides = self.lang['m186_updateGuides']
                     btNo = self.lang['i072_no']
-                    userChoose = cmds.confirmDialog(title='dpAutoRigSystem - v'+self.dpARVersion, message=self.lang['i127_guideVersionDif'], button=[btYes, btUpdateGuides, btNo], defaultButton=btYes, cancelButton=btNo, dismissString=btNo)
+                    userChoose = {"rig" : btYes, "update" : btUpdateGuides, "cancel" : btNo}.get(self.getDialogPolicy("guideVersion", "rig"))
+                    if not userChoose:
+                        userChoose = cmds.confirmDialog(title='dpAutoRigSystem - v'+self.dpARVersion, message=self.lang['i127_guideVersionDif'], button=[btYes, btUpdateGuides, btNo], defaultButton=btYes, cancelButton=btNo, dismissString=btNo)
                     if userChoose == btNo:
                         return
                     elif userChoose == btUpdateGuides:
@@ -2465,12 +2703,16 @@ class Start(object):
             if cmds.objExists(self.guideMirrorGrp):
                 cmds.delete(self.guideMirrorGrp)
             
+            # list the scene names once to resolve the new node names without probing the scene:
+            self.nameRegistry.startRegistry()
+            
             # regenerate mirror information for all guides:
             for guideModule in self.modulesToBeRiggedList:
                 guideModule.checkFatherMirror()
             
             # store hierarchy from guides:
             self.hookDic = self.utils.hook()
+            self.buildReportDic["plan"] = self.utils.getBuildPlanDic([guideModule.moduleGrp for guideModule in self.modulesToBeRiggedList], self.hookDic)
             
             # get prefix:
             self.prefix = cmds.textField("prefixTextField", query=True, text=True)
@@ -2486,16 +2728,50 @@ class Start(object):
                 bColorize = cmds.checkBox(self.allUIs["colorizeCtrlCB"], query=True, value=True)
                 integrate = cmds.checkBox(self.allUIs["integrateCB"], query=True, value=True)
                 bAddAttr = cmds.checkBox(self.allUIs["addAttrCB"], query=True, value=True)
+                incremental = incremental or cmds.checkBox(self.allUIs["incrementalCB"], query=True, value=True)
             except:
                 pass
             
+            # compare guide hashes to the last build to skip the unchanged modules:
+            buildHashDic = {}
+            for guideModule in self.modulesToBeRiggedList:
+                buildHashDic[guideModule.moduleGrp] = guideModule.getGuideDataHash([self.prefix, self.degreeOption, self.presetName])
+            previousBuildDic = self.getBuildHashDic()
+            if incremental and previousBuildDic:
+                # only compare to the modules that still have their last built rig in the scene
+                previousHashDic = {}
+                for moduleGrp, moduleBuildDic in previousBuildDic.items():
+                    hookList = moduleBuildDic.get("hookList")
+                    if hookList and len(cmds.ls(hookList) or []) == len(hookList):
+                        previousHashDic[moduleGrp] = moduleBuildDic["hash"]
+                dirtyList = self.utils.getDirtyModuleList(buildHashDic, previousHashDic, self.buildReportDic["plan"])
+                skippedList = [guideModule for guideModule in self.modulesToBeRiggedList if not guideModule.moduleGrp in dirtyList]
+                self.buildReportDic["incremental"] = {"rebuildList" : dirtyList, "skippedList" : [guideModule.moduleGrp for guideModule in skippedList]}
+                for guideModule in skippedList:
+                    # the last built rig of this module is kept
+                    self.modulesToBeRiggedList.remove(guideModule)
+                    guideModule.deleteModule()
+                for moduleGrp in dirtyList:
+                    # delete the last built rig of this module to rebuild it
+                    if moduleGrp in previousBuildDic:
+                        for hookGrp in previousBuildDic[moduleGrp].get("hookList") or []:
+                            # a hook group could be already deleted with its father module rig
+                            hookNodeList = cmds.ls(hookGrp)
+                            if hookNodeList:
+                                cmds.delete(hookNodeList)
+            
             # serialize all guides before build them
             for guideModule in self.modulesToBeRiggedList:
+                phaseStartTime = time.perf_counter()
                 guideModule.serializeGuide()
+                self.addBuildTime(phaseStartTime, "serializeGuide", guideModule.moduleGrp)
 
             if integrate == 1:
+                phaseStartTime = time.perf_counter()
                 self.createBaseRigNode()
+                self.addBuildTime(phaseStartTime, "createBaseRigNode")
             # run RIG function for each guideModule:
+            builtHookDic = {}
             for guideModule in self.modulesToBeRiggedList:
                 # create the rig for this guideModule:
                 guideModuleCustomName = cmds.getAttr(guideModule.moduleGrp+'.customName')
@@ -2507,7 +2783,16 @@ class Start(object):
                 self.utils.setProgress('Rigging: '+str(guideName))
                 
                 # Rig it :)
+                phaseStartTime = time.perf_counter()
                 guideModule.rigModule()
+                self.addBuildTime(phaseStartTime, "rigModule", guideModule.moduleGrp)
+                # get the hook groups of the rigged module before the integration removes them from the guideNet:
+                builtHookDic[guideModule.moduleGrp] = []
+                for hookAttr in cmds.listAttr(guideModule.guideNet, string="*HookGrp") or []:
+                    hookGrpList = cmds.listConnections(guideModule.guideNet+"."+hookAttr, source=True, destination=False)
+                    if hookGrpList:
+                        # store the uuid to find the hook group after the integration changes its path
+                        builtHookDic[guideModule.moduleGrp].extend(cmds.ls(hookGrpList, uuid=True) or [])
                 # get rigged module name:
                 self.riggedModuleDic[guideModule.moduleGrp.split(":")[0]] = guideModuleCustomName
                 # get integrated information:
@@ -2516,26 +2801,29 @@ class Start(object):
             
             #Colorize all controller in yellow as a base
             if bColorize:
+                phaseStartTime = time.perf_counter()
                 aBCtrl = [self.globalCtrl, self.rootCtrl, self.optionCtrl]
                 aAllCtrls = cmds.ls("*_Ctrl")
                 lPattern = re.compile(self.lang['p002_left'] + '_.*._Ctrl')
                 rPattern = re.compile(self.lang['p003_right'] + '_.*._Ctrl')
-                for pCtrl in aAllCtrls:
-                    shapeList = cmds.listRelatives(pCtrl, children=True, allDescendents=True, fullPath=True, type="shape")
-                    if shapeList:
-                        if not cmds.getAttr(shapeList[0]+".overrideEnabled"):
-                            if (lPattern.match(pCtrl)):
-                                self.ctrls.colorShape([pCtrl], "red")
-                            elif (rPattern.match(pCtrl)):
-                                self.ctrls.colorShape([pCtrl], "blue")
-                            elif (pCtrl in aBCtrl):
-                                self.ctrls.colorShape([pCtrl], "black")
-                            else:
-                                self.ctrls.colorShape([pCtrl], "yellow")
+                # group the not colorized controllers by color to set them in bulk:
+                colorCtrlDic = {"red" : [], "blue" : [], "black" : [], "yellow" : []}
+                for pCtrl in self.ctrls.getNotColorizedList(aAllCtrls):
+                    if (lPattern.match(pCtrl)):
+                        colorCtrlDic["red"].append(pCtrl)
+                    elif (rPattern.match(pCtrl)):
+                        colorCtrlDic["blue"].append(pCtrl)
+                    elif (pCtrl in aBCtrl):
+                        colorCtrlDic["black"].append(pCtrl)
+                    else:
+                        colorCtrlDic["yellow"].append(pCtrl)
+                self.ctrls.colorShapeBatch(list(colorCtrlDic.items()))
+                self.addBuildTime(phaseStartTime, "colorize")
             
             if integrate == 1:
                 # Update progress window
                 self.utils.setProgress('Rigging: '+self.lang['i010_integrateCB'])
+                phaseStartTime = time.perf_counter()
                 
                 # get all parent info from rigged modules:
                 self.originedFromDic = self.utils.getOriginedFromDic()
@@ -3269,9 +3557,15 @@ class Start(object):
                                             cmds.connectAttr(self.rootCtrl+".message", pTagCtrl+".parentTag", force=True)
                                     else:
                                         cmds.connectAttr(self.rootCtrl+".message", pTagCtrl+".parentTag", force=True)
+                self.addBuildTime(phaseStartTime, "integrate")
 
             #Actualise all controls (All_Grp.controlList) for this rig:
             dpUpdateRigInfo.UpdateRigInfo.updateRigInfoLists()
+            
+            # store the guide hashes of this build:
+            for guideModule in self.modulesToBeRiggedList:
+                previousBuildDic[guideModule.moduleGrp] = {"hash" : buildHashDic[guideModule.moduleGrp], "hookList" : builtHookDic.get(guideModule.moduleGrp, [])}
+            self.setBuildHashDic(previousBuildDic)
 
             # Add usefull attributes for the animators
             if (bAddAttr):
@@ -3374,12 +3668,22 @@ class Start(object):
                 if self.detectedBug:
                     print("\n\n")
                     print(self.bugMessage)
-                    cmds.confirmDialog(title=self.lang['i078_detectedBug'], message=self.bugMessage, button=["OK"])
+                    if not self.headless:
+                        cmds.confirmDialog(title=self.lang['i078_detectedBug'], message=self.bugMessage, button=["OK"])
 
         # re-declaring guideMirror and previewMirror groups:
         if cmds.objExists(self.guideMirrorGrp):
             cmds.delete(self.guideMirrorGrp)
         
+        # stop tracking the scene names:
+        self.buildReportDic["nameRegistry"] = self.nameRegistry.getReportDic()
+        self.nameRegistry.stopRegistry()
+        
+        # build report:
+        self.buildReportDic["time"] = round(time.perf_counter()-buildStartTime, 4)
+        if self.modulesToBeRiggedList and self.utils.getProfileMode() >= 0:
+            self.utils.exportLogDicToJson(self.buildReportDic, name="dpBuild", subFolder=self.dpData+"/"+self.dpLog)
+        
         # reload the jointSkinList:
         self.populateJoints()
         if not self.rebuilding:
@@ -3390,5 +3694,38 @@ class Start(object):
             self.utils.setProgress(endIt=True)
         
         cmds.select(clear=True)
+
+
+    def getBuildHashDic(self, *args):
+        """ Returns the dictionary stored in the All_Grp by the last build with the guide hash and the rigged static hook groups by module.
+        """
+        allGrp = self.utils.getAllGrp()
+        if allGrp:
+            if cmds.objExists(allGrp+".dpBuildHash"):
+                hashData = cmds.getAttr(allGrp+".dpBuildHash")
+                if hashData:
+                    return json.loads(hashData)
+        return {}
+
+
+    def setBuildHashDic(self, hashDic, *args):
+        """ Store the given build dictionary in the All_Grp to be compared in the next incremental build.
+        """
+        allGrp = self.utils.getAllGrp()
+        if allGrp:
+            if not cmds.objExists(allGrp+".dpBuildHash"):
+                cmds.addAttr(allGrp, longName="dpBuildHash", dataType="string")
+            cmds.setAttr(allGrp+".dpBuildHash", json.dumps(hashDic), type="string")
+
+
+    def addBuildTime(self, startTime, phase, moduleGrp=None, *args):
+        """ Store the elapsed time since the given start time in the build report.
+            The phase time is summed and it's also stored by module if we have the moduleGrp.
+        """
+        elapsed = round(time.perf_counter()-startTime, 4)
+        self.buildReportDic["phases"][phase] = round(self.buildReportDic["phases"].get(phase, 0)+elapsed, 4)
+        if moduleGrp:
+            self.buildReportDic["modules"].setdefault(moduleGrp, {})[phase] = elapsed
+        return elapsed
     
     ###################### End: Rigging Modules Instances.